@@ -7,6 +7,7 @@ from components import (
     ss_norm,
     simulation,
     ss_average_max,
+    ss_empirical,
     sidebar,
     dataset,
 )
@@ -48,13 +49,14 @@ def main():
         # Safety Stock and Reorder Point calculator section
         with st.expander("Calculate Safety Stock and Reorder Point"):
             # Create tabs for different calculation methods
-            tab1, tab2, tab3, tab4, tab5 = st.tabs(
+            tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(
                 [
                     "Basic",
                     "Average - Max",
                     "Cycle Service Rate",
                     "Fill Rate",
                     "Holding / Stockout cost",
+                    "Lead Time Demand Distribution",
                 ]
             )
 
@@ -78,6 +80,10 @@ def main():
             with tab5:
                 ss_norm.ss_holding_stockout(filtered_data, lead_time_data)
 
+            # Empirical lead time demand distribution based calculation
+            with tab6:
+                ss_empirical.ss_empirical(filtered_data, lead_time_data)
+
         with st.expander("Simulation"):
             simulation.simulation(lead_time_data)
 
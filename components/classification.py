@@ -0,0 +1,61 @@
+"""Classification components for portfolio-wide SKU segmentation"""
+
+import streamlit as st
+from core import classification
+from core.utils import data_fingerprint
+
+
+@st.cache_data(show_spinner=False)
+def cached_abc_xyz_classification(fingerprint, _matrix):
+    """
+    Cached ABC/XYZ classification keyed by the data fingerprint only.
+
+    Args:
+        fingerprint (str): Fingerprint of the matrix, used as cache key
+        _matrix (pandas.DataFrame): Daily demand matrix (not hashed)
+
+    Returns:
+        pandas.DataFrame: Output of core.classification.abc_xyz_classification
+    """
+    return classification.abc_xyz_classification(_matrix)
+
+
+def portfolio_abc_xyz(matrix):
+    """
+    Returns the ABC/XYZ classification of all products, cached per data fingerprint.
+
+    Args:
+        matrix (pandas.DataFrame): Daily demand matrix (Date x Product_Code)
+
+    Returns:
+        pandas.DataFrame: Output of core.classification.abc_xyz_classification
+    """
+    return cached_abc_xyz_classification(data_fingerprint(matrix), matrix)
+
+
+@st.cache_data(show_spinner=False)
+def cached_demand_pattern_classification(fingerprint, _matrix):
+    """
+    Cached demand pattern classification keyed by the data fingerprint only.
+
+    Args:
+        fingerprint (str): Fingerprint of the matrix, used as cache key
+        _matrix (pandas.DataFrame): Daily demand matrix (not hashed)
+
+    Returns:
+        pandas.DataFrame: Output of core.classification.demand_pattern_classification
+    """
+    return classification.demand_pattern_classification(_matrix)
+
+
+def portfolio_demand_patterns(matrix):
+    """
+    Returns the demand pattern of all products, cached per data fingerprint.
+
+    Args:
+        matrix (pandas.DataFrame): Daily demand matrix (Date x Product_Code)
+
+    Returns:
+        pandas.DataFrame: Output of core.classification.demand_pattern_classification
+    """
+    return cached_demand_pattern_classification(data_fingerprint(matrix), matrix)
@@ -0,0 +1,38 @@
+"""Cleaning components for robust outlier filtering of daily demand"""
+
+import streamlit as st
+from core import cleaning
+
+
+@st.cache_data(show_spinner=False)
+def clean_daily_demand(df, window=15, n_sigmas=3.0):
+    """
+    Builds the raw and Hampel-cleaned daily demand matrices for all products.
+
+    Results are cached on the input data so the cleaning runs once per dataset.
+
+    Args:
+        df (pandas.DataFrame): Demand data with 'Date', 'Product_Code' and 'Order_Demand' columns
+        window (int): Size of the centred rolling window in days
+        n_sigmas (float): Number of robust standard deviations tolerated
+
+    Returns:
+        tuple: (raw matrix, cleaned matrix), both indexed by Date with one column per Product_Code
+    """
+    return cleaning.clean_daily_demand(df, window, n_sigmas)
+
+
+@st.cache_data(show_spinner=False)
+def warehouse_demand_matrix(df):
+    """
+    Builds the daily demand matrix of every product at every warehouse,
+    cached on the input data.
+
+    Args:
+        df (pandas.DataFrame): Demand data with 'Date', 'Warehouse', 'Product_Code'
+            and 'Order_Demand' columns
+
+    Returns:
+        pandas.DataFrame: Matrix indexed by Date with one column per (Warehouse, Product_Code)
+    """
+    return cleaning.warehouse_demand_matrix(df)
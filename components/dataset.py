@@ -1,6 +1,7 @@
 """Dataset component for handling demand and lead time data processing"""
 import pandas as pd
 import streamlit as st
+from components.cleaning import clean_daily_demand
 
 
 class Dataset:
@@ -12,13 +13,16 @@ class Dataset:
     
     Attributes:
         data (pd.DataFrame): Processed demand dataset
+        daily_demand (pd.DataFrame): Dense daily demand matrix (Date x Product_Code)
+        daily_demand_clean (pd.DataFrame): Hampel-cleaned version of daily_demand
     """
     def __init__(self):
         """
         Initialize Dataset instance.
         
         Loads either uploaded or sample demand data based on the session state.
-        The data is then prepared using the prepare_data method.
+        The data is then prepared using the prepare_data method, and the raw
+        and outlier-cleaned daily demand of every product is built once.
         """
         data_option = st.session_state["data_option"]
         if data_option == "Upload data":
@@ -28,6 +32,7 @@ class Dataset:
 
         df = pd.read_csv(f"data/csv/{filename}.csv")
         self.data = self.prepare_data(df)
+        self.daily_demand, self.daily_demand_clean = clean_daily_demand(self.data)
 
     def prepare_data(self, df):
         """
@@ -63,13 +68,14 @@ class DatasetLeadTime:
     Attributes:
         data (pd.DataFrame): Processed lead time dataset
     """
-    def __init__(self, filters):
+    def __init__(self, filters=None):
         """
         Initialize DatasetLeadTime instance.
         
         Parameters:
-            filters (dict): Dictionary containing filtering criteria
-                          Expected keys: 'Product_Code', 'Year'
+            filters (dict or None): Dictionary containing filtering criteria
+                          Expected keys: 'Product_Code', 'Year'.
+                          None keeps the lead times of all products and years.
         
         Loads either uploaded or sample lead time data based on the session state
         and applies the specified filters.
@@ -89,7 +95,7 @@ class DatasetLeadTime:
         
         Parameters:
             df (pd.DataFrame): Raw lead time data DataFrame
-            filters (dict): Filtering criteria for Product_Code and Year
+            filters (dict or None): Filtering criteria for Product_Code and Year
         
         Returns:
             pd.DataFrame: Cleaned and filtered lead time data
@@ -98,12 +104,16 @@ class DatasetLeadTime:
             1. Converts date columns to datetime
             2. Filters data for specific product code
             3. Filters data for specific year
+            (steps 2 and 3 are skipped when filters is None)
         """
         df["Ordered_Date"] = pd.to_datetime(df["Ordered_Date"])
         df["Received_Date"] = pd.to_datetime(df["Received_Date"])
         df = df.loc[df["Ordered_Date"] == df["Ordered_Date"]]
         df = df.loc[df["Received_Date"] == df["Received_Date"]]
 
+        if filters is None:
+            return df
+
         product_code = filters["Product_Code"][0]
         year = filters["Year"][0]
 
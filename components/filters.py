@@ -2,6 +2,7 @@
 
 import streamlit as st
 from streamlit_dynamic_filters import DynamicFilters
+from core.classification import suitable_models
 
 
 def selectbox_simulation_year(col, df):
@@ -81,6 +82,8 @@ def selectbox_forecast_model(col, key):
     """
     Creates a selectbox for selecting the forecasting model.
     Uses forecast_horizon from session state to customize Moving Average option.
+    When a demand_pattern is in session state, only the models suited to that
+    pattern are offered.
     Stores selection in session state under 'forecast_model'.
 
     Args:
@@ -95,9 +98,11 @@ def selectbox_forecast_model(col, key):
         "Exponential Smoothing",
         "Theta",
         "Kalman Filter",
+        "Croston (SBA)",
         "Linear Regression",
         "Random Forest",
     ]
+    models = suitable_models(st.session_state.get("demand_pattern"), models)
     st.session_state["forecast_model"] = col.selectbox("Select Model", models, key=key)
 
 
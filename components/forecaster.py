@@ -1,13 +1,57 @@
 """Forecaster components"""
 
-import numpy as np
 import streamlit as st
 import pandas as pd
-from darts import TimeSeries
-from darts.models import NaiveDrift, NaiveMovingAverage, LinearRegressionModel
-from darts.models import StatsForecastAutoARIMA, StatsForecastAutoETS, RandomForest
-from darts.models import StatsForecastAutoTheta, KalmanForecaster
-import darts.metrics
+from core.classification import suitable_models
+from core import forecasting
+from core.forecasting import CrostonSBA
+
+
+def route_forecast_model():
+    """
+    Restricts the selected forecasting model to the product's demand pattern.
+
+    When the model in session state is not suited to the demand_pattern in
+    session state (e.g. a Random Forest grid search on lumpy demand), the
+    first suitable model is used instead and stored as the forecast_model.
+
+    Returns:
+        str: Name of the forecasting model to use
+    """
+    model = st.session_state["forecast_model"]
+    pattern = st.session_state.get("demand_pattern")
+    if suitable_models(pattern, [model]):
+        return model
+
+    routed_model = suitable_models(pattern, ["Croston (SBA)", "Naive Drift"])[0]
+    st.warning(
+        f"{model} is not suited to {pattern} demand, using {routed_model} instead."
+    )
+    st.session_state["forecast_model"] = routed_model
+    return routed_model
+
+
+def select_model(model, series, horizon_days):
+    """
+    Creates the forecasting model for the year in session state, see
+    core.forecasting.select_model, and displays the best parameters of a
+    grid search.
+
+    Args:
+        model (str): Name of the forecasting model
+        series (TimeSeries): Daily demand from the start of the year
+        horizon_days (int): Number of days in the forecast horizon
+
+    Returns:
+        object: Instance of the forecasting model
+    """
+    model, best_params = forecasting.select_model(
+        model, series, st.session_state["year"], horizon_days
+    )
+    if best_params is not None:
+        with st.popover("Best parameters"):
+            st.write(best_params)
+    return model
 
 
 class Forecaster:
@@ -52,70 +96,23 @@ class Forecaster:
         """
         year = st.session_state["year"]
         year_forecast = year + 1
-
-        start_date = f"{year}-01-01"
-        end_date = f"{year_forecast}-12-31"
-
-        # Filter data for selected time range
-        df_filtered = df.loc[(df["Date"] >= start_date) & (df["Date"] <= end_date)]
-        df_filtered = df_filtered[["Date", "Order_Demand"]]
-        df_filtered = df_filtered.groupby("Date").sum().reset_index()
-
-        # Create continuous date range and merge with filtered data
-        date_range = pd.date_range(start=start_date, end=end_date, freq="D")
-        df_forecast = pd.DataFrame(
-            {
-                "Date": date_range,
-            }
+        return forecasting.prepare_timeseries(
+            df, f"{year}-01-01", f"{year_forecast}-12-31"
         )
-        df_forecast = pd.merge(df_forecast, df_filtered, on="Date", how="left")
-
-        # Handle missing values
-        df_forecast.fillna(value=0, inplace=True)
-
-        # Filter positive values
-        df_forecast["Order_Demand"] = df_forecast["Order_Demand"].clip(lower=0)
-
-        df_forecast = df_forecast[["Date", "Order_Demand"]]
-        df_forecast.columns = ["Date", "Value"]
-        series = TimeSeries.from_dataframe(df_forecast, "Date", "Value", freq="D")
-
-        return series
 
     def prepare_model(self):
         """
         Initialize the selected forecasting model.
 
         Creates and returns an instance of the forecasting model selected in the
-        Streamlit session state.
+        Streamlit session state, restricted to models suited to the product's
+        demand pattern.
 
         Returns:
             object: Instance of the selected forecasting model
         """
-        model = st.session_state["forecast_model"]
-
-        # Handle moving average models
-        if "Moving Average" in model:
-            input_chunk_length = 3  # Default to 3 periods
-            return NaiveMovingAverage(input_chunk_length=input_chunk_length)
-
-        # Other models
-        if model == "Naive Drift":
-            return NaiveDrift()
-        elif model == "Linear Regression":
-            param_grid = self.define_param_grid()
-            return self.optimize_model(param_grid)
-        elif model == "ARIMA":
-            return StatsForecastAutoARIMA()
-        elif model == "Exponential Smoothing":
-            return StatsForecastAutoETS()
-        elif model == "Theta":
-            return StatsForecastAutoTheta()
-        elif model == "Kalman Filter":
-            return KalmanForecaster()
-        elif model == "Random Forest":
-            param_grid = self.define_param_grid()
-            return self.optimize_model(param_grid)
+        model = route_forecast_model()
+        return select_model(model, self.timeseries, self.get_forecast_horizon_days())
 
     def define_param_grid(self):
         """
@@ -128,80 +125,7 @@ class Forecaster:
             dict: Parameter grid for model optimization
         """
         model = st.session_state["forecast_model"]
-        if model == "Linear Regression":
-            return {
-                "lags": [
-                    [-1],
-                    [-1, -2],
-                    [-1, -2, -3],
-                    [-1, -2, -3, -4, -5, -6, -7],
-                ],  # Different lag values to test
-                "output_chunk_length": [
-                    self.get_forecast_horizon_days()
-                ],  # Different forecast horizons
-                "n_jobs": [-1],  # Use all available cores
-            }
-        elif model == "Random Forest":
-            return {
-                "n_estimators": [50, 100],  # Reduced number of options for tree count
-                "max_depth": [10, 20],  # Reduced depth options
-                "lags": [
-                    [-1],
-                    [-1, -2, -3],
-                    [-1, -2, -3, -4, -5, -6, -7],
-                ],  # Key lag values
-                "output_chunk_length": [
-                    self.get_forecast_horizon_days()
-                ],  # Reduced forecast horizons
-                "n_jobs": [-1],  # Use all available cores
-            }
-
-    def optimize_model(self, param_grid):
-        """
-        Perform grid search to optimize model parameters.
-
-        Uses cross-validation to find the best parameters for the selected model.
-
-        Args:
-            param_grid (dict): Parameter grid to search
-
-        Returns:
-            object: Optimized model instance with best parameters
-        """
-        year = st.session_state["year"]
-        split_point = pd.to_datetime(f"{year}-11-01")
-        series = self.timeseries.drop_after(split_point)
-
-        split_point_1 = pd.to_datetime(f"{year}-10-31")
-        split_point_2 = pd.to_datetime(f"{year + 1}-01-01")
-        val_series = self.timeseries.drop_before(split_point_1).drop_after(
-            split_point_2
-        )
-
-        # Configure grid search parameters
-        args = {
-            "parameters": param_grid,
-            "series": series,
-            "val_series": val_series,
-            "n_jobs": -1,
-            "metric": darts.metrics.mae,
-            "show_warnings": False,
-        }
-
-        # Perform grid search for selected model
-        forecast_model = st.session_state["forecast_model"]
-        if forecast_model == "Linear Regression":
-            gridsearch = LinearRegressionModel.gridsearch(**args)
-        elif forecast_model == "Random Forest":
-            gridsearch = RandomForest.gridsearch(**args)
-
-        best_model = gridsearch[0]
-        best_params = gridsearch[1]
-
-        with st.popover("Best parameters"):
-            st.write(best_params)
-
-        return best_model
+        return forecasting.param_grid(model, self.get_forecast_horizon_days())
 
     def generate_historical_forecasts(self):
         """
@@ -210,17 +134,12 @@ class Forecaster:
         Creates forecasts for historical data to evaluate model performance
         and stores both predicted and actual values.
         """
-        forecast_horizon = self.get_forecast_horizon_days()
-        historical_forecast = self.model.historical_forecasts(
+        self.predicted_series, self.actual_series = forecasting.historical_forecast(
             self.timeseries,
-            forecast_horizon=forecast_horizon,
-            start=365 - forecast_horizon + 1,
-            verbose=False,
+            self.model,
+            st.session_state["year"],
+            st.session_state["forecast_horizon"],
         )
-        year = st.session_state["year"]
-        split_point = pd.to_datetime(f"{year}-12-31")
-        self.predicted_series = historical_forecast
-        self.actual_series = self.timeseries.drop_before(split_point)
 
     def plot(self):
         """
@@ -246,13 +165,7 @@ class Forecaster:
         Returns:
             int: Number of days in the forecast horizon
         """
-        forecast_horizon = st.session_state["forecast_horizon"]
-        if forecast_horizon == "Day":
-            return 1
-        elif forecast_horizon == "Week":
-            return 7
-        elif forecast_horizon == "Month":
-            return 30
+        return forecasting.forecast_horizon_days(st.session_state["forecast_horizon"])
 
     def score(self):
         """
@@ -263,23 +176,12 @@ class Forecaster:
         """
         actual_values = self.actual_series.pd_dataframe()["Value"]
         predicted_values = self.predicted_series.pd_dataframe()["Value"]
-        non_zero_indices = np.where(actual_values != 0)[0]
+        actual_values, predicted_values = actual_values.align(
+            predicted_values, join="inner"
+        )
 
         # Calculate performance metrics
-        bias = round(np.mean(predicted_values - actual_values))
-        mae = round(np.mean(np.abs(predicted_values - actual_values)))
-        mape = round(
-            np.mean(
-                np.abs(
-                    (
-                        predicted_values[non_zero_indices]
-                        - actual_values[non_zero_indices]
-                    )
-                    / actual_values[non_zero_indices]
-                )
-            )
-            * 100
-        )
+        bias, mae, mape = forecasting.forecast_scores(actual_values, predicted_values)
 
         # Compare with baseline
         mae_baseline = st.session_state["mae_baseline"]
@@ -348,27 +250,9 @@ class BaselineForecaster:
         """
         year = st.session_state["year"]
         year_forecast = year + 1
-
-        start_date = f"{year}-01-01"
-        end_date = f"{year_forecast}-12-31"
-
-        df_filtered = df.loc[(df["Date"] >= start_date) & (df["Date"] <= end_date)]
-        df_filtered = df_filtered[["Date", "Order_Demand"]]
-        df_filtered = df_filtered.groupby("Date").sum().reset_index()
-
-        date_range = pd.date_range(start=start_date, end=end_date, freq="D")
-        df_forecast = pd.DataFrame(
-            {
-                "Date": date_range,
-            }
+        return forecasting.prepare_timeseries(
+            df, f"{year}-01-01", f"{year_forecast}-12-31"
         )
-        df_forecast = pd.merge(df_forecast, df_filtered, on="Date", how="left")
-        df_forecast.fillna(value=0, inplace=True)
-        df_forecast["Order_Demand"] = df_forecast["Order_Demand"].clip(lower=0)
-        df_forecast = df_forecast[["Date", "Order_Demand"]]
-        df_forecast.columns = ["Date", "Value"]
-        series = TimeSeries.from_dataframe(df_forecast, "Date", "Value", freq="D")
-        return series
 
     def prepare_model(self):
         """
@@ -377,7 +261,7 @@ class BaselineForecaster:
         Returns:
             object: Instance of the Naive Drift forecasting model
         """
-        return NaiveDrift()
+        return forecasting.build_model("Naive Drift")
 
     def generate_historical_forecasts(self):
         """
@@ -386,15 +270,18 @@ class BaselineForecaster:
         Creates forecasts for historical data to evaluate model performance
         and stores both predicted and actual values.
         """
-        historical_forecast = self.model.historical_forecasts(
+        year = st.session_state["year"]
+        self.predicted_series, actual_series = forecasting.historical_forecast(
             self.timeseries,
-            forecast_horizon=self.get_forecast_horizon_days(),
+            self.model,
+            year,
+            st.session_state["forecast_horizon"],
             start=365 - self.get_forecast_horizon_days() + 2,
         )
-        year = st.session_state["year"] + 1
-        split_point = pd.to_datetime(f"{year}-01-01")
-        self.predicted_series = historical_forecast
-        self.actual_series = self.timeseries.drop_before(split_point)
+        # The baseline is scored from the second day of the next year
+        self.actual_series = actual_series.drop_before(
+            pd.Timestamp(f"{year + 1}-01-01")
+        )
 
     def get_forecast_horizon_days(self):
         """
@@ -403,13 +290,7 @@ class BaselineForecaster:
         Returns:
             int: Number of days in the forecast horizon
         """
-        forecast_horizon = st.session_state["forecast_horizon"]
-        if forecast_horizon == "Day":
-            return 1
-        elif forecast_horizon == "Week":
-            return 7
-        elif forecast_horizon == "Month":
-            return 30
+        return forecasting.forecast_horizon_days(st.session_state["forecast_horizon"])
 
     def score(self):
         """
@@ -419,22 +300,10 @@ class BaselineForecaster:
         """
         actual_values = self.actual_series.pd_dataframe()["Value"]
         predicted_values = self.predicted_series.pd_dataframe()["Value"]
-        non_zero_indices = np.where(actual_values != 0)[0]
-
-        # bias = round(np.mean(predicted_values - actual_values))
-        mae = round(np.mean(np.abs(predicted_values - actual_values)))
-        mape = round(
-            np.mean(
-                np.abs(
-                    (
-                        predicted_values[non_zero_indices]
-                        - actual_values[non_zero_indices]
-                    )
-                    / actual_values[non_zero_indices]
-                )
-            )
-            * 100
+        actual_values, predicted_values = actual_values.align(
+            predicted_values, join="inner"
         )
+        _, mae, mape = forecasting.forecast_scores(actual_values, predicted_values)
 
         st.session_state["mae_baseline"] = mae
         st.session_state["mape_baseline"] = mape
@@ -487,29 +356,7 @@ class FutureForecaster:
         """
         # Get the selected year from session state
         year = st.session_state["year"]
-        start_date = f"{year}-01-01"
-        end_date = f"{year}-12-31"
-
-        # Filter data for selected time range
-        df_filtered = df.loc[(df["Date"] >= start_date) & (df["Date"] <= end_date)]
-        df_filtered = df_filtered[["Date", "Order_Demand"]]
-        df_filtered = df_filtered.groupby("Date").sum().reset_index()
-
-        # Create continuous date range and merge with filtered data
-        date_range = pd.date_range(start=start_date, end=end_date, freq="D")
-        df_forecast = pd.DataFrame(
-            {
-                "Date": date_range,
-            }
-        )
-        df_forecast = pd.merge(df_forecast, df_filtered, on="Date", how="left")
-        df_forecast.fillna(value=0, inplace=True)
-        df_forecast["Order_Demand"] = df_forecast["Order_Demand"].clip(lower=0)
-        df_forecast = df_forecast[["Date", "Order_Demand"]]
-        df_forecast.columns = ["Date", "Value"]
-        series = TimeSeries.from_dataframe(df_forecast, "Date", "Value", freq="D")
-
-        return series
+        return forecasting.prepare_timeseries(df, f"{year}-01-01", f"{year}-12-31")
 
     def prepare_model(self):
         """
@@ -517,35 +364,14 @@ class FutureForecaster:
 
         Creates and returns an instance of the forecasting model selected in the
         Streamlit session state. Supports multiple model types including naive
-        methods, statistical models, and machine learning approaches.
+        methods, statistical models, and machine learning approaches, restricted
+        to models suited to the product's demand pattern.
 
         Returns:
             object: Instance of the selected forecasting model
         """
-        model = st.session_state["forecast_model"]
-
-        # Handle moving average models
-        if "Moving Average" in model:
-            input_chunk_length = 3  # Default to 3 periods
-            return NaiveMovingAverage(input_chunk_length=input_chunk_length)
-
-        # Other models
-        if model == "Naive Drift":
-            return NaiveDrift()
-        elif model == "Linear Regression":
-            param_grid = self.define_param_grid()
-            return self.optimize_model(param_grid)
-        elif model == "ARIMA":
-            return StatsForecastAutoARIMA()
-        elif model == "Exponential Smoothing":
-            return StatsForecastAutoETS()
-        elif model == "Theta":
-            return StatsForecastAutoTheta()
-        elif model == "Kalman Filter":
-            return KalmanForecaster()
-        elif model == "Random Forest":
-            param_grid = self.define_param_grid()
-            return self.optimize_model(param_grid)
+        model = route_forecast_model()
+        return select_model(model, self.timeseries, self.get_forecast_horizon_days())
 
     def predict(self):
         """
@@ -554,8 +380,12 @@ class FutureForecaster:
         Fits the model to the prepared time series data and generates
         predictions for the specified forecast horizon.
         """
-        self.model.fit(self.timeseries)
-        self.predicted_series = self.model.predict(self.get_forecast_horizon_days())
+        self.predicted_series = forecasting.future_forecast(
+            self.timeseries,
+            self.model,
+            st.session_state["year"],
+            st.session_state["forecast_horizon"],
+        )
 
     def get_forecast_horizon_days(self):
         """
@@ -567,13 +397,7 @@ class FutureForecaster:
         Returns:
             int: Number of days in the forecast horizon
         """
-        forecast_horizon = st.session_state["forecast_horizon"]
-        if forecast_horizon == "Day":
-            return 1
-        elif forecast_horizon == "Week":
-            return 7
-        elif forecast_horizon == "Month":
-            return 30
+        return forecasting.forecast_horizon_days(st.session_state["forecast_horizon"])
 
     def define_param_grid(self):
         """
@@ -587,82 +411,7 @@ class FutureForecaster:
             dict: Parameter grid for model optimization
         """
         model = st.session_state["forecast_model"]
-        if model == "Linear Regression":
-            return {
-                "lags": [
-                    [-1],
-                    [-1, -2],
-                    [-1, -2, -3],
-                    [-1, -2, -3, -4, -5, -6, -7],
-                ],  # Different lag values to test
-                "output_chunk_length": [
-                    self.get_forecast_horizon_days()
-                ],  # Different forecast horizons
-                "n_jobs": [-1],  # Use all available cores
-            }
-        elif model == "Random Forest":
-            return {
-                "n_estimators": [50, 100],  # Reduced number of options for tree count
-                "max_depth": [10, 20],  # Reduced depth options
-                "lags": [
-                    [-1],
-                    [-1, -2, -3],
-                    [-1, -2, -3, -4, -5, -6, -7],
-                ],  # Key lag values
-                "output_chunk_length": [
-                    self.get_forecast_horizon_days()
-                ],  # Reduced forecast horizons
-                "n_jobs": [-1],  # Use all available cores
-            }
-
-    def optimize_model(self, param_grid):
-        """
-        Perform grid search to optimize model parameters.
-
-        Uses cross-validation to find the best parameters for the selected model.
-        Splits the data into training and validation sets, performs grid search,
-        and displays the best parameters found.
-
-        Args:
-            param_grid (dict): Parameter grid to search
-
-        Returns:
-            object: Optimized model instance with best parameters
-        """
-        # Define training period
-        year = st.session_state["year"]
-        split_point = pd.to_datetime(f"{year}-11-01")
-        series = self.timeseries.drop_after(split_point)
-
-        # Define validation period
-        split_point = pd.to_datetime(f"{year}-10-31")
-        val_series = self.timeseries.drop_before(split_point)
-
-        # Configure grid search parameters
-        args = {
-            "parameters": param_grid,
-            "series": series,
-            "val_series": val_series,
-            "n_jobs": -1,
-            "metric": darts.metrics.mae,
-            "show_warnings": False,
-        }
-
-        # Perform grid search for selected model
-        forecast_model = st.session_state["forecast_model"]
-        if forecast_model == "Linear Regression":
-            gridsearch = LinearRegressionModel.gridsearch(**args)
-        elif forecast_model == "Random Forest":
-            gridsearch = RandomForest.gridsearch(**args)
-
-        best_model = gridsearch[0]
-        best_params = gridsearch[1]
-
-        # Display best parameters in Streamlit UI
-        with st.popover("Best parameters"):
-            st.write(best_params)
-
-        return best_model
+        return forecasting.param_grid(model, self.get_forecast_horizon_days())
 
     def plot(self):
         """
@@ -37,9 +37,11 @@ def input_demand_sd(col, df, key):
 
 # Function to create input field for average lead time
 # Uses time unit from session state and calculates default from historical data
-def input_avg_lead_time(col, df, key):
+# The default value can be given, e.g. the mean of a fitted distribution
+def input_avg_lead_time(col, df, key, value=None):
     time_unit = st.session_state["time_unit"]
-    value = calculate_avg_lead_time(df)
+    if value is None:
+        value = calculate_avg_lead_time(df)
     st.session_state["avg_lead_time"] = col.number_input(
         f"Specify Average Lead Time ({time_unit})", value=value, key=key
     )
@@ -47,9 +49,10 @@ def input_avg_lead_time(col, df, key):
 
 # Function to create input field for lead time standard deviation
 # Calculates default value from historical data
-def input_sd_lead_time(col, df):
+def input_sd_lead_time(col, df, value=None):
     time_unit = st.session_state["time_unit"]
-    value = calculate_sd_lead_time(df)
+    if value is None:
+        value = calculate_sd_lead_time(df)
 
     st.session_state["sd_lead_time"] = col.number_input(
         f"Specify Lead Time Std Dev ({time_unit})", value=value
@@ -86,16 +89,27 @@ def input_stockout_cost(col, key):
     )
 
 
+# Function to create an integer input field starting at 0
+# A keyed field keeps its value in session state only, so that callbacks
+# can set it without a default value conflicting with it
+def input_quantity(col, label, key=None):
+    if key is None:
+        return col.number_input(label, value=0)
+    if key not in st.session_state:
+        st.session_state[key] = 0
+    return col.number_input(label, step=1, key=key)
+
+
 # Function to create input field for safety stock level
 def input_ss(col, key=None):
-    return col.number_input("Specify Safety Stock (SS)", value=0, key=key)
+    return input_quantity(col, "Specify Safety Stock (SS)", key)
 
 
 # Function to create input field for reorder point
 def input_rop(col, key=None):
-    return col.number_input("Specify Reorder Point (ROP)", value=0, key=key)
+    return input_quantity(col, "Specify Reorder Point (ROP)", key)
 
 
 # Function to create input field for order quantity
 def input_oq(col, key=None):
-    return col.number_input("Specify Order Quantity (Q)", value=0, key=key)
+    return input_quantity(col, "Specify Order Quantity (Q)", key)
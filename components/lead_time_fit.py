@@ -0,0 +1,20 @@
+"""Lead time distribution fitting components"""
+
+import streamlit as st
+from core import lead_time_fit
+
+
+@st.cache_data(show_spinner=False)
+def fit_lead_time_distributions(df):
+    """
+    Fits gamma, lognormal and empirical lead time distributions for every product.
+
+    The fitted parameters are cached on the input data.
+
+    Args:
+        df (pandas.DataFrame): Lead time data with 'Product_Code' and 'Lead_Time_Days' columns
+
+    Returns:
+        pandas.DataFrame: One row per Product_Code, see core.lead_time_fit
+    """
+    return lead_time_fit.fit_lead_time_distributions(df)
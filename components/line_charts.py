@@ -2,6 +2,20 @@
 
 import streamlit as st
 import pandas as pd
+from core.simulation import year_daily_demand, simulate_inventory
+from core.simulation_cache import SimulationCache, simulation_key
+from core.utils import data_fingerprint
+
+
+@st.cache_resource
+def simulation_cache():
+    """
+    Simulation result cache shared by all sessions.
+
+    Returns:
+        SimulationCache: Bounded LRU cache of simulated years
+    """
+    return SimulationCache()
 
 
 def product_daily_inventory_levels_chart(df):
@@ -37,62 +51,66 @@ def product_daily_inventory_levels_chart(df):
     )
 
 
+def simulate_year(df_demand, year_sim, ss, rop, q, L):
+    """
+    Simulates the inventory of a year of demand.
+
+    Args:
+        df_demand (pd.DataFrame): DataFrame with demand data
+        year_sim (int): Year to simulate
+        ss (float): Safety stock level
+        rop (float or array-like): Reorder point, a scalar or one value per day
+        q (float): Order quantity
+        L (int): Lead time in days
+
+    Returns:
+        pd.DataFrame: Daily demand of the year with the simulated inventory
+            levels, units received and lost sales of every day
+    """
+    df = year_daily_demand(df_demand, year_sim)
+    inventory, receipts, stockouts = simulate_inventory(
+        df["Order_Demand"].to_numpy(), ss, rop, q, L, flows=True
+    )
+    df["Inventory_Quantity"] = inventory
+    df["Received_Quantity"] = receipts
+    df["Lost_Sales"] = stockouts
+    return df
+
+
 def simulation_chart(df_demand, year_sim, ss, rop, q, L):
     """
     Simulates and visualizes inventory levels over time based on demand data and inventory parameters.
+    Results are kept in the shared simulation cache, keyed by the product,
+    the parameters and the fingerprint of the demand data, so coming back to
+    previous parameters does not simulate again.
 
     Args:
         df_demand (pd.DataFrame): DataFrame with demand data
         year_sim (int): Year to simulate
         ss (float): Safety stock level
-        rop (float): Reorder point
+        rop (float or array-like): Reorder point, either a scalar or one value
+            per day of the simulated year for a time-varying reorder point
         q (float): Order quantity
         L (int): Lead time in days
 
     Returns:
-        pd.DataFrame: DataFrame containing simulated inventory levels
+        pd.DataFrame: DataFrame containing simulated inventory levels, units
+            received and lost sales of every day
     """
-    # Filter and prepare demand data for specified year
-    df_demand = df_demand.loc[df_demand["Date"].dt.year == year_sim]
-    df_demand = df_demand.sort_values(by="Date")
-    df_demand = df_demand[["Date", "Order_Demand"]]
-    df_demand = df_demand.groupby("Date").sum().reset_index()
-    df_demand.columns = ["Date", "Order_Demand"]
-
-    # Create complete date range for the year
-    start_date = pd.to_datetime(f"{year_sim}-01-01")
-    end_date = pd.to_datetime(f"{year_sim}-12-31")
-    dates = pd.date_range(start=start_date, end=end_date, freq="D")
-
-    # Merge demand data with complete date range
-    df = pd.DataFrame({"Date": dates})
-    df = pd.merge(df, df_demand, on="Date", how="left")
-    df = df.fillna(0)
-
-    # Initialize inventory simulation parameters
-    initial_inventory = q + ss
-    inventory_levels = []
-    current_inventory = initial_inventory
-    day_since_trigger_rop = 0
-
-    # Simulate daily inventory changes
-    for index, row in df.iterrows():
-        demand = row["Order_Demand"]
-
-        # Check reorder point and handle lead time
-        if current_inventory <= rop:
-            if day_since_trigger_rop == L:
-                current_inventory += q
-                day_since_trigger_rop = 0
-            else:
-                day_since_trigger_rop += 1
-
-        # Update inventory levels based on demand
-        inventory_levels.append(current_inventory)
-        current_inventory -= demand
-        current_inventory = max(current_inventory, 0)
-
-    df["Inventory_Quantity"] = inventory_levels
+    key = simulation_key(
+        st.session_state.get("product_code"),
+        year_sim,
+        ss,
+        rop,
+        q,
+        L,
+        data_fingerprint(df_demand),
+    )
+    df = simulation_cache().get_or_compute(
+        key, lambda: simulate_year(df_demand, year_sim, ss, rop, q, L)
+    )
+    # Copy so that callers cannot change the cached result
+    df = df.copy()
 
     # Display chart showing demand and inventory levels
     st.line_chart(
@@ -1,3 +1,6 @@
+from core.simulation import fill_rate as simulated_fill_rate
+
+
 def ytd_product_fill_rate(df, col):
     """
     Calculate and display the year-to-date fill rate for products.
@@ -31,22 +34,8 @@ def ytd_product_fill_rate(df, col):
         col.metric("Fill Rate", "0.0")
         return
 
-    # Filter out rows where there is no demand
-    # Only consider positive demand for fill rate calculation
-    df = df[df["Order_Demand"] > 0]
-
-    # Check if any rows remain after filtering
-    if df.empty:
-        col.metric("Fill Rate", "0.0")
-        return
-
-    # Calculate total demand and filled quantities
-    total_demand = df["Order_Demand"].sum()
-    total_filled = df["Inventory_Quantity"].sum()
-
-    # Calculate fill rate, capped at 100%
-    # If total_demand is 0, return 0.0 to avoid division by zero
-    fill_rate = min(total_filled / total_demand, 1.0) if total_demand > 0 else 0.0
+    # Fill rate over the days with positive demand, capped at 100%
+    fill_rate = simulated_fill_rate(df["Order_Demand"], df["Inventory_Quantity"])
 
     # Display the fill rate metric with one decimal place
     col.metric("Fill Rate", f"{fill_rate:.1f}")
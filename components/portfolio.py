@@ -0,0 +1,742 @@
+"""Portfolio components for product-wide analysis"""
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+from components.classification import portfolio_abc_xyz, portfolio_demand_patterns
+from components.cleaning import warehouse_demand_matrix
+from core.safety_stock import (
+    METHODS,
+    eoq,
+    portfolio_inputs,
+    portfolio_safety_stock,
+    ss_uncertain_demand_lead_time_ind,
+    cycle_service_curve,
+    fill_rate_curve,
+)
+from core.order_quantity import DISCOUNT_TYPES, batch_eoq
+from core.lead_time_demand import (
+    portfolio_fft_safety_stock,
+    portfolio_rolling_safety_stock,
+)
+from core.monte_carlo import portfolio_mc_safety_stock
+from core.allocation import OBJECTIVES, portfolio_allocation
+from core.joint_replenishment import portfolio_joint_replenishment
+from core.sensitivity import portfolio_lead_time_sensitivity
+from core.network import network_policies, simulate_network
+from core.policy_optimization import optimize_policy
+from core.simulation import (
+    matrix_chunks,
+    portfolio_simulation,
+    portfolio_simulation_stream,
+)
+
+
+def download_table(df, file_name, key):
+    """
+    Displays a download button for a portfolio table as CSV.
+
+    Args:
+        df (pd.DataFrame): Table to download, indexed by Product_Code
+        file_name (str): Name of the downloaded file
+        key: Unique key for the download button
+    """
+    st.download_button(
+        label="Download table",
+        data=df.to_csv().encode("utf-8"),
+        file_name=file_name,
+        mime="text/csv",
+        key=key,
+    )
+
+
+def abc_xyz(daily_demand):
+    """
+    Displays the ABC/XYZ classification of all products.
+
+    Shows the number of products per class and the full classification table.
+
+    Args:
+        daily_demand (pd.DataFrame): Daily demand matrix (Date x Product_Code)
+    """
+    result = portfolio_abc_xyz(daily_demand)
+
+    st.markdown("Number of products per class")
+    counts = pd.crosstab(result["ABC"], result["XYZ"])
+    st.dataframe(counts)
+
+    st.dataframe(
+        result,
+        column_config={
+            "Volume_Share": st.column_config.NumberColumn(format="%.4f"),
+            "Cumulative_Share": st.column_config.NumberColumn(format="%.4f"),
+            "CV": st.column_config.NumberColumn(format="%.2f"),
+        },
+    )
+    download_table(result, "abc_xyz.csv", key=50001)
+
+
+def demand_patterns(daily_demand):
+    """
+    Displays the Syntetos-Boylan demand pattern of all products.
+
+    Args:
+        daily_demand (pd.DataFrame): Daily demand matrix (Date x Product_Code)
+    """
+    result = portfolio_demand_patterns(daily_demand)
+
+    st.markdown("Number of products per demand pattern")
+    st.bar_chart(result["Pattern"].value_counts(), height=200)
+
+    st.dataframe(
+        result,
+        column_config={
+            "ADI": st.column_config.NumberColumn(format="%.2f"),
+            "CV2": st.column_config.NumberColumn("CV²", format="%.2f"),
+        },
+    )
+    download_table(result, "demand_patterns.csv", key=50002)
+
+
+def selectbox_portfolio_year(col, daily_demand, key):
+    """
+    Creates a selectbox for choosing the year of the portfolio analysis,
+    defaulting to the latest year in the data.
+
+    Args:
+        col: Streamlit column object where the selectbox will be rendered
+        daily_demand (pd.DataFrame): Daily demand matrix (Date x Product_Code)
+        key: Unique key for the selectbox component
+
+    Returns:
+        int: Selected year
+    """
+    years = sorted(daily_demand.index.year.unique().tolist())
+    return col.selectbox("Select Year", years, index=max(len(years) - 1, 0), key=key)
+
+
+def safety_stock(data, lead_time_data):
+    """
+    Displays safety stock and reorder point of all products with every method.
+
+    Inputs are computed per product from the selected year's daily demand and
+    lead times (in days); targets and costs apply to all products.
+
+    Args:
+        data (Dataset): Demand dataset with daily demand matrices
+        lead_time_data (pd.DataFrame): Lead time data of all products
+    """
+    col1, col2, col3 = st.columns(3)
+    col4, col5, col6 = st.columns(3)
+    col7, col8, col9 = st.columns(3)
+
+    year = selectbox_portfolio_year(col1, data.daily_demand, key=50010)
+    lead_time_distribution = col2.selectbox(
+        "Select Lead Time Distribution", ["sample", "gamma", "lognormal"], key=50011
+    )
+    safety_days = col3.number_input("Specify Number of Safety Days", value=5, key=50012)
+    cycle_service_rate = col4.number_input(
+        "Specify Targeted Cycle Service Rate",
+        min_value=0.00,
+        max_value=1.00,
+        value=0.90,
+        step=0.01,
+        key=50013,
+    )
+    fill_rate = col5.number_input(
+        "Specify Targeted Fill Rate",
+        min_value=0.00,
+        max_value=0.99,
+        value=0.90,
+        step=0.01,
+        key=50014,
+    )
+    holding_cost = col6.number_input(
+        "Specify Holding cost / unit / year (H)", value=0.20, key=50015
+    )
+    stockout_cost = col7.number_input(
+        "Specify Stockout cost per unit (p)", value=0.20, key=50016
+    )
+
+    inputs = portfolio_inputs(
+        data.daily_demand,
+        data.daily_demand_clean,
+        lead_time_data,
+        year,
+        lead_time_distribution,
+    )
+    result = portfolio_safety_stock(
+        **inputs,
+        cycle_service_rate=cycle_service_rate,
+        fill_rate=fill_rate,
+        holding_cost=holding_cost,
+        stockout_cost=stockout_cost,
+        safety_days=safety_days,
+        index=inputs.index,
+    )
+    result = inputs.round(2).join(result)
+    result = result.join(
+        empirical_safety_stock(
+            data.daily_demand, lead_time_data, year, cycle_service_rate
+        )
+    )
+    if col8.checkbox("Add Monte Carlo SS / ROP", key=50030):
+        result = result.join(
+            mc_safety_stock(data.daily_demand, lead_time_data, year, cycle_service_rate)
+        )
+
+    st.dataframe(result)
+    st.caption(
+        "The formulas are those of the single product tabs, but σd is the "
+        "standard deviation of the Hampel-cleaned daily demand including days "
+        "without demand, while the tabs use the IQR-filtered standard deviation "
+        "of the days with transactions: SS and ROP of a product can differ."
+    )
+    download_table(result, f"safety_stock_{year}.csv", key=50017)
+
+    service_level_tradeoff(inputs, holding_cost, year)
+    safety_stock_allocation(inputs, holding_cost, year)
+    lead_time_sensitivity(inputs, cycle_service_rate, year)
+
+
+@st.cache_data(show_spinner=False)
+def empirical_safety_stock(daily_demand, lead_time_data, year, cycle_service_rate):
+    """
+    Cached safety stock and reorder point of all products from their lead time
+    demand distribution (FFT convolution) and from their historical demand
+    over windows of their lead times, in the selected year.
+
+    Args:
+        daily_demand (pd.DataFrame): Daily demand matrix (Date x Product_Code)
+        lead_time_data (pd.DataFrame): Lead time data of all products
+        year (int): Selected year
+        cycle_service_rate (float): Targeted cycle service rate
+
+    Returns:
+        pd.DataFrame: See core.lead_time_demand.portfolio_fft_safety_stock and
+            core.lead_time_demand.portfolio_rolling_safety_stock
+    """
+    daily_demand = daily_demand.loc[daily_demand.index.year == year]
+    lead_time_data = lead_time_data.loc[lead_time_data["Received_Date"].dt.year == year]
+    fft = portfolio_fft_safety_stock(daily_demand, lead_time_data, cycle_service_rate)
+    rolling = portfolio_rolling_safety_stock(
+        daily_demand, lead_time_data, cycle_service_rate
+    )
+    return fft.join(rolling)
+
+
+@st.cache_data(show_spinner="Sampling lead time demand of all products...")
+def mc_safety_stock(daily_demand, lead_time_data, year, cycle_service_rate):
+    """
+    Cached Monte Carlo safety stock and reorder point of all products in the
+    selected year, with products split across a process pool.
+
+    Args:
+        daily_demand (pd.DataFrame): Daily demand matrix (Date x Product_Code)
+        lead_time_data (pd.DataFrame): Lead time data of all products
+        year (int): Selected year
+        cycle_service_rate (float): Targeted cycle service rate
+
+    Returns:
+        pd.DataFrame: See core.monte_carlo.portfolio_mc_safety_stock
+    """
+    daily_demand = daily_demand.loc[daily_demand.index.year == year]
+    lead_time_data = lead_time_data.loc[lead_time_data["Received_Date"].dt.year == year]
+    return portfolio_mc_safety_stock(daily_demand, lead_time_data, cycle_service_rate)
+
+
+@st.cache_data(show_spinner=False)
+def portfolio_service_level_curves(service_type, inputs, holding_cost):
+    """
+    Cached service level vs. inventory cost curves of all products.
+
+    Cycle service rates use the demand and lead time uncertainty (independent),
+    products with a single lead time only have demand uncertainty.
+
+    Args:
+        service_type (str): 'Cycle service rate' or 'Fill rate'
+        inputs (pd.DataFrame): Per-product inputs, see core.safety_stock.portfolio_inputs
+        holding_cost (float): Holding cost per unit per year (H)
+
+    Returns:
+        pd.DataFrame: One row per product and service level
+    """
+    if service_type == "Fill rate":
+        return fill_rate_curve(
+            inputs["avg_sales"],
+            inputs["demand_sd"],
+            inputs["avg_lead_time"],
+            holding_cost,
+            index=inputs.index,
+        )
+    lead_time_demand_sd = ss_uncertain_demand_lead_time_ind(
+        1,
+        inputs["avg_lead_time"].to_numpy(),
+        inputs["demand_sd"].to_numpy(),
+        inputs["avg_sales"].to_numpy(),
+        np.nan_to_num(inputs["sd_lead_time"].to_numpy()),
+    )
+    return cycle_service_curve(
+        inputs["avg_sales"],
+        inputs["avg_lead_time"],
+        lead_time_demand_sd,
+        holding_cost,
+        index=inputs.index,
+    )
+
+
+def service_level_tradeoff(inputs, holding_cost, year):
+    """
+    Displays the total holding cost and expected shortage of all products
+    at service levels from 0.50 to 0.999.
+
+    Args:
+        inputs (pd.DataFrame): Per-product inputs, see core.safety_stock.portfolio_inputs
+        holding_cost (float): Holding cost per unit per year (H)
+        year (int): Selected year, used in the file name of the download
+    """
+    st.markdown("**Service Level Trade-off**")
+    col1, col2, col3 = st.columns(3)
+    service_type = col1.selectbox(
+        "Select Service Level Type", ["Cycle service rate", "Fill rate"], key=50018
+    )
+
+    curves = portfolio_service_level_curves(service_type, inputs, holding_cost)
+    total = curves.groupby("Service_Level")[["Holding_Cost", "Expected_Shortage"]].sum()
+
+    col4, col5 = st.columns(2)
+    col4.line_chart(total, y="Holding_Cost", y_label="Holding Cost / Year", height=250)
+    col5.line_chart(
+        total,
+        x="Expected_Shortage",
+        y="Holding_Cost",
+        x_label="Expected Shortage per Cycle",
+        y_label="Holding Cost / Year",
+        height=250,
+    )
+    download_table(
+        curves.set_index("Product_Code"),
+        f"service_level_curves_{year}.csv",
+        key=50019,
+    )
+
+
+@st.cache_data(show_spinner="Allocating the budget...")
+def cached_portfolio_allocation(inputs, holding_cost, budget, objective, order_cost):
+    """
+    Cached budget-constrained safety stocks of all products.
+
+    Returns:
+        tuple: See core.allocation.portfolio_allocation
+    """
+    return portfolio_allocation(inputs, holding_cost, budget, objective, order_cost)
+
+
+def safety_stock_allocation(inputs, holding_cost, year):
+    """
+    Displays the safety stocks of all products that maximize the portfolio
+    fill rate (or minimize the expected shortages) within a holding cost budget.
+
+    Args:
+        inputs (pd.DataFrame): Per-product inputs, see core.safety_stock.portfolio_inputs
+        holding_cost (float): Holding cost per unit per year (H)
+        year (int): Selected year, used in the file name of the download
+    """
+    st.markdown("**Budget Allocation**")
+    col1, col2, col3 = st.columns(3)
+    budget = col1.number_input(
+        "Specify Safety Stock Budget / Year", min_value=0.0, value=1000.0, key=50040
+    )
+    objective = col2.selectbox("Select Objective", OBJECTIVES, key=50041)
+    order_cost = col3.number_input(
+        "Specify Order Cost (K)", min_value=0.0, value=20.0, key=50042
+    )
+
+    result, fill_rate = cached_portfolio_allocation(
+        inputs, holding_cost, budget, objective, order_cost
+    )
+    col4, col5 = st.columns(2)
+    col4.metric("Allocated Holding Cost / Year", f"{result['Holding_Cost'].sum():,.2f}")
+    if fill_rate is not None:
+        col5.metric("Portfolio Fill Rate", f"{fill_rate:.2%}")
+    else:
+        col5.metric(
+            "Expected Shortage per Cycle", f"{result['Expected_Shortage'].sum():,.0f}"
+        )
+
+    st.dataframe(result)
+    download_table(result, f"safety_stock_allocation_{year}.csv", key=50043)
+
+
+def lead_time_sensitivity(inputs, cycle_service_rate, year):
+    """
+    Displays the products whose safety stock (demand and lead time uncertainty,
+    independent) is the most sensitive to their lead time variance.
+
+    Args:
+        inputs (pd.DataFrame): Per-product inputs, see core.safety_stock.portfolio_inputs
+        cycle_service_rate (float): Targeted cycle service rate
+        year (int): Selected year, used in the file name of the download
+    """
+    st.markdown("**Lead Time Variance Sensitivity**")
+    result = portfolio_lead_time_sensitivity(inputs, cycle_service_rate).round(3)
+    st.caption(
+        "dSS_dVar_LT: increase of SS per unit of lead time variance (days²). "
+        "Lead_Time_Variance_Share: share of the lead time demand variance due "
+        "to lead times, i.e. % change of SS per 1% change of the lead time "
+        "standard deviation."
+    )
+    st.dataframe(result)
+    download_table(result, f"lead_time_sensitivity_{year}.csv", key=50044)
+
+
+def order_quantity(daily_demand):
+    """
+    Displays the order quantity minimizing the total annual cost of all products,
+    with minimum order quantity, lot size and quantity discounts.
+
+    Args:
+        daily_demand (pd.DataFrame): Daily demand matrix (Date x Product_Code)
+    """
+    col1, col2, col3 = st.columns(3)
+    col4, col5, col6 = st.columns(3)
+    col7, col8, col9 = st.columns(3)
+
+    year = selectbox_portfolio_year(col1, daily_demand, key=50020)
+    order_cost = col2.number_input(
+        "Specify Order Cost per purchase order (K)", value=20.0, key=50021
+    )
+    holding_cost = col3.number_input(
+        "Specify Holding cost / unit / year (H)", value=0.20, key=50022
+    )
+    holding_rate = col4.number_input(
+        "Specify Holding rate / year (% of unit price)",
+        min_value=0.0,
+        value=0.0,
+        step=1.0,
+        key=50023,
+    )
+    moq = col5.number_input("Specify Minimum Order Quantity", min_value=0, value=0, key=50024)
+    lot_size = col6.number_input("Specify Lot size", min_value=1, value=100, key=50025)
+    discount_type = col7.selectbox(
+        "Select Quantity Discount", DISCOUNT_TYPES, key=50026
+    )
+
+    if discount_type == "None":
+        unit_price = col8.number_input("Specify Unit Price", value=0.0, key=50027)
+        schedule = pd.DataFrame({"Min_Quantity": [0], "Unit_Price": [unit_price]})
+    else:
+        schedule = st.data_editor(
+            pd.DataFrame(
+                {"Min_Quantity": [0, 500, 1000], "Unit_Price": [10.0, 9.5, 9.0]}
+            ),
+            num_rows="dynamic",
+            hide_index=True,
+            key=50028,
+        ).dropna()
+
+    demand_per_year = daily_demand.loc[daily_demand.index.year == year].sum()
+    try:
+        result = batch_eoq(
+            demand_per_year.to_numpy(),
+            order_cost,
+            holding_cost,
+            holding_rate / 100,
+            schedule["Unit_Price"].to_numpy(),
+            schedule["Min_Quantity"].to_numpy(),
+            discount_type,
+            moq,
+            lot_size,
+            index=demand_per_year.index,
+        )
+    except ValueError as e:
+        st.error(f"Invalid price breaks: {e}")
+        return
+
+    result.insert(0, "Demand_per_Year", demand_per_year)
+    st.dataframe(result)
+    download_table(result, f"order_quantity_{year}.csv", key=50029)
+
+
+def joint_replenishment(data):
+    """
+    Displays the joint replenishment policy of the products of every group
+    (warehouse or product category): a base order cycle per group and an
+    integer multiple of it per product.
+
+    Args:
+        data (pd.DataFrame): Demand data with 'Warehouse', 'Product_Category',
+            'Product_Code', 'Date' and 'Order_Demand' columns
+    """
+    col1, col2, col3 = st.columns(3)
+    col4, col5, col6 = st.columns(3)
+
+    years = sorted(data["Date"].dt.year.unique().tolist())
+    year = col1.selectbox("Select Year", years, index=max(len(years) - 1, 0), key=50050)
+    group_by = col2.selectbox(
+        "Select Group", ["Warehouse", "Product_Category"], key=50051
+    )
+    major_cost = col3.number_input(
+        "Specify Order Cost per joint order (S)", min_value=0.0, value=100.0, key=50052
+    )
+    minor_cost = col4.number_input(
+        "Specify Order Cost per product in an order (s)",
+        min_value=0.0,
+        value=20.0,
+        key=50053,
+    )
+    holding_cost = col5.number_input(
+        "Specify Holding cost / unit / year (H)", value=0.20, key=50054
+    )
+
+    demand_per_year = (
+        data.loc[data["Date"].dt.year == year]
+        .groupby([group_by, "Product_Code"])["Order_Demand"]
+        .sum()
+    )
+    products, groups = portfolio_joint_replenishment(
+        demand_per_year,
+        demand_per_year.index.get_level_values(group_by),
+        major_cost,
+        minor_cost,
+        holding_cost,
+    )
+
+    st.dataframe(groups)
+    st.dataframe(products.drop(columns="Group"))
+    download_table(products, f"joint_replenishment_{year}.csv", key=50055)
+
+
+def inventory_simulation(data, lead_time_data):
+    """
+    Simulates the (ROP, Q) policy of every product over the selected year:
+    SS and ROP of the selected method, Q from the EOQ and the average lead
+    time rounded to days.
+
+    Args:
+        data (Dataset): Demand dataset with daily demand matrices
+        lead_time_data (pd.DataFrame): Lead time data of all products
+    """
+    col1, col2, col3 = st.columns(3)
+    col4, col5, col6 = st.columns(3)
+
+    year = selectbox_portfolio_year(col1, data.daily_demand, key=50060)
+    method = col2.selectbox(
+        "Select Safety Stock Method", METHODS, index=4, key=50061
+    )
+    cycle_service_rate = col3.number_input(
+        "Specify Targeted Cycle Service Rate",
+        min_value=0.00,
+        max_value=0.99,
+        value=0.90,
+        step=0.01,
+        key=50062,
+    )
+    order_cost = col4.number_input(
+        "Specify Order Cost per purchase order (K)", value=20.0, key=50063
+    )
+    holding_cost = col5.number_input(
+        "Specify Holding cost / unit / year (H)", value=0.20, key=50064
+    )
+
+    inputs = portfolio_inputs(
+        data.daily_demand, data.daily_demand_clean, lead_time_data, year
+    )
+    policy = portfolio_safety_stock(
+        **inputs,
+        cycle_service_rate=cycle_service_rate,
+        fill_rate=cycle_service_rate,
+        holding_cost=holding_cost,
+        index=inputs.index,
+    )
+    ss = policy[f"{method} SS"].to_numpy()
+    rop = policy[f"{method} ROP"].to_numpy()
+    q = np.ceil(eoq(inputs["avg_sales"].to_numpy() * 365, order_cost, holding_cost))
+    L = inputs["avg_lead_time"].round().to_numpy()
+
+    q_policy = np.where(q > 0, q, np.nan)
+    if col6.checkbox("Simulate all years continuously", key=50066):
+        # Inventory carries over from one year to the next
+        daily_demand = data.daily_demand[inputs.index]
+        progress = st.progress(0.0, text="Simulating...")
+        result = None
+        for n_days, result, fill_rate in portfolio_simulation_stream(
+            matrix_chunks(daily_demand), ss, rop, q_policy, L
+        ):
+            progress.progress(
+                n_days / len(daily_demand),
+                text=f"Simulated {n_days:,} of {len(daily_demand):,} days",
+            )
+        progress.empty()
+        if result is None:
+            st.warning("No demand data to simulate.")
+            return
+    else:
+        daily_demand = data.daily_demand.loc[data.daily_demand.index.year == year]
+        result, fill_rate = portfolio_simulation(
+            daily_demand[inputs.index], ss, rop, q_policy, L
+        )
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Portfolio Fill Rate", f"{fill_rate:.2%}")
+    col2.metric("Products Simulated", int(result["Fill_Rate"].notna().sum()))
+    col3.metric("Stockout Days", f"{result['Stockout_Days'].sum():,.0f}")
+
+    result.insert(0, "SS", ss)
+    result.insert(1, "ROP", rop)
+    result.insert(2, "Q", q)
+    result.insert(3, "L", L)
+    result = result.round(2)
+    st.dataframe(result)
+    download_table(result, f"inventory_simulation_{year}.csv", key=50065)
+
+
+@st.cache_data(show_spinner="Optimizing ROP and Q of all products...")
+def cached_policy_optimization(daily_demand, L, target, order_cost, holding_cost):
+    """
+    Cached cost-optimal Q and minimum ROP of every product.
+
+    Returns:
+        pd.DataFrame: See core.policy_optimization.optimize_policy
+    """
+    return optimize_policy(daily_demand, L, target, order_cost, holding_cost)
+
+
+def policy_optimization(data, lead_time_data):
+    """
+    Finds the cost-optimal order quantity and the minimum reorder point
+    achieving a target fill rate of every product over the selected year,
+    with the average lead time rounded to days.
+
+    Args:
+        data (Dataset): Demand dataset with daily demand matrices
+        lead_time_data (pd.DataFrame): Lead time data of all products
+    """
+    col1, col2, col3, col4 = st.columns(4)
+    year = selectbox_portfolio_year(col1, data.daily_demand, key=50080)
+    target = col2.number_input(
+        "Specify Target Fill Rate",
+        min_value=0.50,
+        max_value=0.999,
+        value=0.95,
+        step=0.01,
+        format="%.3f",
+        key=50081,
+    )
+    order_cost = col3.number_input(
+        "Specify Order Cost per purchase order (K)", value=20.0, key=50082
+    )
+    holding_cost = col4.number_input(
+        "Specify Holding cost / unit / year (H)", value=0.20, key=50083
+    )
+    # Simulation-based search over all products, only run on request
+    if not st.checkbox("Optimize ROP and Q of all products", key=50085):
+        return
+
+    inputs = portfolio_inputs(
+        data.daily_demand, data.daily_demand_clean, lead_time_data, year
+    )
+    # Products without lead time data are not optimized
+    inputs = inputs.loc[inputs["avg_lead_time"].notna()]
+    daily_demand = data.daily_demand.loc[data.daily_demand.index.year == year]
+    result = cached_policy_optimization(
+        daily_demand[inputs.index],
+        inputs["avg_lead_time"].round().to_numpy(),
+        target,
+        order_cost,
+        holding_cost,
+    )
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Products Optimized", int(result["Feasible"].sum()))
+    col2.metric("Total Cost / Year", f"{result['Cost'].sum():,.2f}")
+    col3.metric("Average Inventory", f"{result['Avg_Inventory'].sum():,.0f}")
+
+    result.insert(3, "L", inputs["avg_lead_time"].round())
+    result = result.round(2)
+    st.dataframe(result)
+    download_table(result, f"policy_optimization_{year}.csv", key=50084)
+
+
+def network_simulation(data, lead_time_data):
+    """
+    Simulates the warehouse network over the selected year: every warehouse
+    holds stock of its products and is replenished by a central DC, itself
+    replenished by the supplier with the average lead time of the product.
+    Displays the fill rate of every echelon.
+
+    Args:
+        data (pd.DataFrame): Demand data with 'Date', 'Warehouse', 'Product_Code'
+            and 'Order_Demand'
+        lead_time_data (pd.DataFrame): Lead time data of all products
+    """
+    daily_demand = warehouse_demand_matrix(data)
+    if daily_demand.empty:
+        st.warning("No demand data.")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    col4, col5, col6 = st.columns(3)
+    year = selectbox_portfolio_year(col1, daily_demand, key=50070)
+    cycle_service_rate = col2.number_input(
+        "Specify Targeted Cycle Service Rate",
+        min_value=0.00,
+        max_value=0.99,
+        value=0.90,
+        step=0.01,
+        key=50071,
+    )
+    lead_time = col3.number_input(
+        "Specify DC to Warehouse Lead Time (days)", min_value=1, value=3, key=50072
+    )
+    order_cost = col4.number_input(
+        "Specify Order Cost per purchase order (K)", value=20.0, key=50073
+    )
+    holding_cost = col5.number_input(
+        "Specify Holding cost / unit / year (H)", value=0.20, key=50074
+    )
+    if not col6.checkbox("Simulate the network", key=50076):
+        return
+
+    # Supplier lead time of the DC, the average of all products when unknown
+    lead_times = lead_time_data.groupby("Product_Code")["Lead_Time_Days"].mean()
+    products = daily_demand.columns.get_level_values("Product_Code").unique()
+    dc_lead_time = lead_times.reindex(products).fillna(
+        lead_time_data["Lead_Time_Days"].mean()
+    )
+
+    daily_demand = daily_demand.loc[daily_demand.index.year == year]
+    warehouses, dc = network_policies(
+        daily_demand, lead_time, dc_lead_time, cycle_service_rate, order_cost, holding_cost
+    )
+    result, dc_result, echelons = simulate_network(
+        daily_demand,
+        warehouses["SS"].to_numpy(),
+        warehouses["ROP"].to_numpy(),
+        warehouses["Q"].to_numpy(),
+        warehouses["L"].to_numpy(),
+        dc["SS"],
+        dc["ROP"],
+        dc["Q"],
+        dc["L"],
+    )
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Warehouse Fill Rate", f"{echelons.loc['Warehouses', 'Fill_Rate']:.2%}")
+    col2.metric("DC Fill Rate", f"{echelons.loc['DC', 'Fill_Rate']:.2%}")
+    col3.metric("Warehouses", daily_demand.columns.get_level_values("Warehouse").nunique())
+
+    by_warehouse = result.groupby(level="Warehouse").sum()
+    demand = daily_demand.clip(lower=0).sum().groupby(level="Warehouse").sum()
+    by_warehouse["Fill_Rate"] = 1 - by_warehouse["Lost_Sales"] / demand
+    st.bar_chart(by_warehouse["Fill_Rate"], y_label="Fill Rate", height=250)
+
+    tab1, tab2, tab3 = st.tabs(["Echelons", "Warehouses", "DC"])
+    tab1.dataframe(echelons.round(4))
+    tab2.dataframe(pd.concat([warehouses, result], axis=1).round(2))
+    tab3.dataframe(pd.concat([dc, dc_result], axis=1).round(2))
+    download_table(
+        pd.concat([warehouses, result], axis=1).round(2),
+        f"network_simulation_{year}.csv",
+        key=50075,
+    )
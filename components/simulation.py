@@ -1,4 +1,6 @@
 import streamlit as st
+import numpy as np
+import pandas as pd
 from components.inputs import *
 from components.line_charts import *
 from components.bar_charts import *
@@ -7,6 +9,20 @@ from components.metrics import *
 from components.filters import *
 from components.forecaster import *
 from components.dataframe import dataframe_models_result
+from core.cleaning import product_daily_demand, daily_demand_matrix
+from core.seasonality import seasonal_indices, seasonal_rop, daily_schedule
+from core.simulation import (
+    year_daily_demand,
+    parameter_sweep,
+    simulate_replications,
+    demand_chunks,
+    simulate_stream,
+    confidence_bands,
+    mean_confidence_interval,
+)
+from core.event_simulation import simulate_events, daily_states, event_summary
+from core.policy_optimization import optimize_policy
+from components.classification import portfolio_abc_xyz, portfolio_demand_patterns
 
 
 @st.fragment
@@ -19,10 +35,19 @@ def simulation(lead_time_data):
         lead_time_data: Data containing lead time information for inventory management
     """
     # Filter dataset for selected product code and sort by date
-    df = Dataset().data
-    df = df.loc[df["Product_Code"] == st.session_state["product_code"]]
+    dataset = Dataset()
+    if st.toggle("Use outlier-cleaned demand (Hampel filter)"):
+        df = product_daily_demand(
+            dataset.daily_demand_clean, st.session_state["product_code"]
+        )
+    else:
+        df = dataset.data
+        df = df.loc[df["Product_Code"] == st.session_state["product_code"]]
     df = df.sort_values(by=["Date"])
 
+    product_class(dataset.daily_demand)
+    product_demand_pattern(dataset.daily_demand)
+
     tab1, tab2 = st.tabs(["Actual Data", "Forecast"])
     with tab1:
         simulation_actual_data(df, lead_time_data, 3000)
@@ -31,6 +56,48 @@ def simulation(lead_time_data):
         simulation_forecast(df, lead_time_data)
 
 
+def product_class(daily_demand):
+    """
+    Looks up the ABC/XYZ class of the selected product in the portfolio
+    classification, stores it in session state and displays it.
+
+    Args:
+        daily_demand: Daily demand matrix of all products
+    """
+    product_code = st.session_state["product_code"]
+    classes = portfolio_abc_xyz(daily_demand)
+    if product_code not in classes.index:
+        st.session_state["abc_xyz_class"] = None
+        return
+
+    abc_xyz_class = classes.loc[product_code, "Class"]
+    st.session_state["abc_xyz_class"] = abc_xyz_class
+    st.caption(f"ABC/XYZ class of {product_code}: **{abc_xyz_class}**")
+
+
+def product_demand_pattern(daily_demand):
+    """
+    Looks up the demand pattern (smooth, erratic, intermittent or lumpy) of
+    the selected product, stores it in session state and displays it.
+    The forecast model choices are restricted to this pattern.
+
+    Args:
+        daily_demand: Daily demand matrix of all products
+    """
+    product_code = st.session_state["product_code"]
+    patterns = portfolio_demand_patterns(daily_demand)
+    if product_code not in patterns.index:
+        st.session_state["demand_pattern"] = None
+        return
+
+    pattern = patterns.loc[product_code]
+    st.session_state["demand_pattern"] = pattern["Pattern"]
+    st.caption(
+        f"Demand pattern: **{pattern['Pattern']}** "
+        f"(ADI = {pattern['ADI']:.2f}, CV² = {pattern['CV2']:.2f})"
+    )
+
+
 @st.fragment
 def simulation_actual_data(df, lead_time_data, key):
     """
@@ -51,15 +118,421 @@ def simulation_actual_data(df, lead_time_data, key):
     q = input_oq(col4, key + 3)
     input_avg_lead_time(col5, lead_time_data, key + 4)
     L = round(st.session_state["avg_lead_time"])
+    use_seasonal_rop = col6.checkbox("Seasonal ROP (monthly)", key=key + 5)
+
+    if st.toggle("Parameter sweep", key=key + 6):
+        simulation_sweep(df, year_sim, ss, rop, q, L, key + 7)
+        return
+
+    if st.toggle("Event-driven (sampled lead times)", key=key + 21):
+        if ss >= 0 and rop > 0 and q > 0:
+            simulation_events(df, lead_time_data, year_sim, ss, rop, q, key + 22)
+        return
+
+    if st.toggle("Monte Carlo replications", key=key + 23):
+        if ss >= 0 and rop > 0 and q > 0:
+            simulation_replications(df, lead_time_data, year_sim, ss, rop, q, key + 24)
+        return
+
+    if st.toggle("Continuous simulation (date range)", key=key + 26):
+        if ss >= 0 and rop > 0 and q > 0:
+            simulation_continuous(df, ss, rop, q, L, key + 27)
+        return
+
+    if st.toggle("Optimize ROP and Q", key=key + 28):
+        simulation_optimizer(df, year_sim, L, key + 29)
+        return
 
     # Calculate and display simulation results if all inputs are valid
-    if ss > 0 and rop > 0 and q > 0:
+    if ss >= 0 and rop > 0 and q > 0:
+        if use_seasonal_rop:
+            rop = seasonal_rop_schedule(df, year_sim, ss, rop)
         df_calculation = simulation_chart(df, year_sim, ss, rop, q, L)
         col1, col2, col3 = st.columns(3)
         ytd_product_fill_rate(df_calculation, col1)
+        col2.metric("Lost Sales", f"{df_calculation['Lost_Sales'].sum():,.0f}")
+        col3.metric(
+            "Orders Received", int((df_calculation["Received_Quantity"] > 0).sum())
+        )
         product_fill_rate_chart(df_calculation)
 
 
+def simulation_events(df, lead_time_data, year_sim, ss, rop, q, key):
+    """
+    Simulates the (ROP, Q) policy event by event with a lead time drawn for
+    every order from the product's lead time history, and displays on-hand
+    inventory, inventory on order, backorders and inventory position.
+
+    Args:
+        df: DataFrame containing historical data
+        lead_time_data: Lead time history of the product
+        year_sim: Year to simulate
+        ss: Safety stock
+        rop: Reorder point, compared to the inventory position
+        q: Order quantity
+        key: Key of the backorders checkbox
+    """
+    lead_times = lead_time_data["Lead_Time_Days"].dropna()
+    if lead_times.empty:
+        st.warning("No lead time data for the selected product and year.")
+        return
+
+    backorders = st.checkbox("Backorder unmet demand", value=True, key=key)
+    df_demand = year_daily_demand(df, year_sim)
+    demand = df_demand["Order_Demand"].to_numpy()
+    events = simulate_events(demand, ss, rop, q, lead_times, backorders)
+
+    states = daily_states(events, len(demand))
+    states.insert(0, "Date", df_demand["Date"].to_numpy())
+    st.line_chart(
+        states,
+        x="Date",
+        y=["On_Hand", "On_Order", "Backorders", "Inventory_Position"],
+        y_label="Quantity",
+    )
+
+    summary = event_summary(events, demand)
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Fill Rate", f"{summary['Fill_Rate']:.2%}")
+    col2.metric("Orders Placed", summary["Orders"])
+    col3.metric("Max Outstanding Orders", summary["Max_Outstanding_Orders"])
+    col4.metric("Max Backorders", f"{summary['Max_Backorders']:,.0f}")
+
+    events.insert(1, "Date", df_demand["Date"].reindex(events["Day"]).to_numpy())
+    st.dataframe(events.drop(columns="Day"), hide_index=True)
+
+
+def simulation_continuous(df, ss, rop, q, L, key):
+    """
+    Simulates the (ROP, Q) policy continuously over a date range, carrying
+    the inventory across year boundaries. Demand is built and simulated one
+    year at a time with a progress bar.
+
+    Args:
+        df: DataFrame containing historical data
+        ss: Safety stock
+        rop: Reorder point
+        q: Order quantity
+        L: Lead time in days
+        key: Key of the date range input
+    """
+    if df.empty:
+        return
+    first, last = df["Date"].min().date(), df["Date"].max().date()
+    dates = st.date_input(
+        "Select Date Range", value=(first, last), min_value=first, key=key
+    )
+    if len(dates) != 2:
+        return
+    start, end = pd.Timestamp(dates[0]), pd.Timestamp(dates[1])
+
+    n_days = (end - start).days + 1
+    progress = st.progress(0.0, text="Simulating...")
+    chunks = []
+    for chunk in simulate_stream(demand_chunks(df, start, end), ss, rop, q, L):
+        chunks.append(chunk)
+        done = sum(len(c) for c in chunks)
+        progress.progress(done / n_days, text=f"Simulated {done:,} of {n_days:,} days")
+    progress.empty()
+    result = pd.concat(chunks, ignore_index=True)
+
+    st.line_chart(
+        result, x="Date", y=["Order_Demand", "Inventory_Quantity"], y_label="Quantity"
+    )
+    total_demand = result["Order_Demand"].clip(lower=0).sum()
+    col1, col2, col3 = st.columns(3)
+    if total_demand > 0:
+        col1.metric(
+            "Fill Rate", f"{1 - result['Lost_Sales'].sum() / total_demand:.2%}"
+        )
+    col2.metric("Lost Sales", f"{result['Lost_Sales'].sum():,.0f}")
+    col3.metric("Orders Received", int((result["Received_Quantity"] > 0).sum()))
+
+
+@st.cache_data(show_spinner="Optimizing ROP and Q...")
+def cached_policy_optimization(demand, L, target, order_cost, holding_cost):
+    """
+    Cached cost-optimal Q and minimum ROP of a daily demand series.
+
+    Returns:
+        pd.DataFrame: See core.policy_optimization.optimize_policy
+    """
+    return optimize_policy(demand, L, target, order_cost, holding_cost)
+
+
+def apply_policy(key, ss, rop, q):
+    """
+    Callback copying an optimized policy into the simulation inputs and
+    switching back to the simulation.
+
+    Args:
+        key: Key of the simulation inputs, SS, ROP and Q use key + 1 to key + 3
+            and the optimizer toggle key + 28
+        ss: Safety stock
+        rop: Reorder point
+        q: Order quantity
+    """
+    st.session_state[key + 1] = int(np.ceil(ss))
+    st.session_state[key + 2] = int(np.ceil(rop))
+    st.session_state[key + 3] = int(np.ceil(q))
+    st.session_state[key + 28] = False
+
+
+def simulation_optimizer(df, year_sim, L, key):
+    """
+    Finds the cost-optimal order quantity and the minimum reorder point
+    achieving a target fill rate over the demand of the simulated year,
+    searching over simulations of the (ROP, Q) policy.
+
+    Args:
+        df: DataFrame containing historical data
+        year_sim: Year to simulate
+        L: Lead time in days
+        key: Key of the target fill rate, order cost, holding cost and apply
+            button, key - 29 being the key of the simulation inputs
+    """
+    col1, col2, col3 = st.columns(3)
+    target = col1.number_input(
+        "Specify Target Fill Rate",
+        min_value=0.50,
+        max_value=0.999,
+        value=0.95,
+        step=0.01,
+        format="%.3f",
+        key=key,
+    )
+    order_cost = col2.number_input(
+        "Specify Order Cost per purchase order (K)", value=20.0, key=key + 1
+    )
+    holding_cost = col3.number_input(
+        "Specify Holding cost / unit / year (H)", value=0.20, key=key + 2
+    )
+
+    demand = year_daily_demand(df, year_sim)["Order_Demand"].to_numpy()
+    if demand.sum() <= 0:
+        st.warning("No demand in the selected year.")
+        return
+    result = cached_policy_optimization(demand, L, target, order_cost, holding_cost)
+    policy = result.iloc[0]
+    if not policy["Feasible"]:
+        st.warning("No policy reaches the target fill rate.")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Reorder Point (ROP)", f"{np.ceil(policy['ROP']):,.0f}")
+    col2.metric("Order Quantity (Q)", f"{np.ceil(policy['Q']):,.0f}")
+    col3.metric("Safety Stock (SS)", f"{np.ceil(policy['SS']):,.0f}")
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Fill Rate", f"{policy['Fill_Rate']:.2%}")
+    col2.metric("Cost / Year", f"{policy['Cost']:,.2f}")
+    col3.metric("Orders Received", int(policy["Orders"]))
+    st.button(
+        "Apply to the simulation",
+        on_click=apply_policy,
+        args=(key - 29, policy["SS"], policy["ROP"], policy["Q"]),
+        key=key + 3,
+    )
+
+
+@st.cache_data(show_spinner="Simulating the replications...")
+def cached_replications(demand, lead_times, ss, rop, q, n_replications, seed):
+    """
+    Cached Monte Carlo replications of a (ROP, Q) policy.
+
+    Returns:
+        tuple: See core.simulation.simulate_replications
+    """
+    return simulate_replications(demand, lead_times, ss, rop, q, n_replications, seed)
+
+
+def simulation_replications(df, lead_time_data, year_sim, ss, rop, q, key):
+    """
+    Simulates the (ROP, Q) policy over synthetic years bootstrapped from the
+    demand of the simulated year, with lead times drawn from the product's
+    lead time history, and displays the distributions of fill rate and
+    stockout days and the 90% band of the inventory level.
+
+    Args:
+        df: DataFrame containing historical data
+        lead_time_data: Lead time history of the product
+        year_sim: Year to simulate
+        ss: Safety stock
+        rop: Reorder point
+        q: Order quantity
+        key: Key of the number of replications, the seed uses key + 1
+    """
+    lead_times = lead_time_data["Lead_Time_Days"].dropna().to_numpy()
+    if len(lead_times) == 0:
+        st.warning("No lead time data for the selected product and year.")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    n_replications = col1.number_input(
+        "Specify Number of Replications",
+        min_value=100,
+        max_value=100_000,
+        value=1000,
+        step=1000,
+        key=key,
+    )
+    seed = col2.number_input("Specify Seed", min_value=0, value=0, key=key + 1)
+
+    df_demand = year_daily_demand(df, year_sim)
+    result, inventory = cached_replications(
+        df_demand["Order_Demand"].to_numpy(), lead_times, ss, rop, q, n_replications, seed
+    )
+
+    mean, half_width = mean_confidence_interval(result["Fill_Rate"])
+    lower, median, upper = confidence_bands(result["Fill_Rate"])
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Mean Fill Rate", f"{mean:.2%}", f"± {half_width:.2%} (95% CI)", "off")
+    col2.metric("Fill Rate 90% Band", f"{lower:.2%} – {upper:.2%}")
+    col3.metric(
+        "Stockout Days (median)",
+        f"{np.median(result['Stockout_Days']):.0f}",
+        "90% band {:.0f} – {:.0f}".format(*confidence_bands(result["Stockout_Days"])[::2]),
+        "off",
+    )
+
+    lower, median, upper = confidence_bands(inventory, axis=1)
+    st.line_chart(
+        pd.DataFrame(
+            {"Date": df_demand["Date"], "P5": lower, "Median": median, "P95": upper}
+        ),
+        x="Date",
+        y=["P5", "Median", "P95"],
+        y_label="Inventory Quantity",
+    )
+
+    col4, col5 = st.columns(2)
+    counts, edges = np.histogram(result["Fill_Rate"], bins=30)
+    col4.bar_chart(
+        pd.DataFrame({"Fill_Rate": edges[:-1].round(3), "Replications": counts}),
+        x="Fill_Rate",
+        y="Replications",
+        height=250,
+    )
+    col5.bar_chart(
+        result["Stockout_Days"].value_counts().sort_index().rename("Replications"),
+        x_label="Stockout Days",
+        height=250,
+    )
+
+
+@st.cache_data(show_spinner="Simulating the parameter grid...")
+def cached_parameter_sweep(demand, ss_values, rop_values, q_values, L_values):
+    """
+    Cached simulation of every combination of the parameter grid.
+
+    Returns:
+        pd.DataFrame: See core.simulation.parameter_sweep
+    """
+    return parameter_sweep(demand, ss_values, rop_values, q_values, L_values)
+
+
+def input_sweep_range(label, value, upper, key, integer=False):
+    """
+    Displays the inputs of the range of a swept parameter.
+
+    Args:
+        label (str): Name of the parameter
+        value (float): Default lower bound
+        upper (float): Default upper bound
+        key (int): Key of the lower bound, the upper bound and the number of
+            values use key + 1 and key + 2
+        integer (bool): Round the values to whole numbers
+
+    Returns:
+        numpy.ndarray: Values of the parameter
+    """
+    col1, col2, col3 = st.columns(3)
+    low = col1.number_input(f"{label} from", min_value=0, value=int(value), key=key)
+    high = col2.number_input(
+        f"{label} to", min_value=0, value=int(max(upper, value)), key=key + 1
+    )
+    n_values = col3.number_input(
+        f"Number of {label} values", min_value=1, max_value=100, value=10, key=key + 2
+    )
+    values = np.linspace(low, max(high, low), n_values)
+    return np.unique(np.rint(values)) if integer else np.unique(values.round(2))
+
+
+def simulation_sweep(df, year_sim, ss, rop, q, L, key):
+    """
+    Simulates every combination of ranges of safety stock, reorder point,
+    order quantity and lead time, and displays the fill rate and average
+    inventory as heatmaps of reorder point x order quantity.
+
+    Args:
+        df: DataFrame containing historical data
+        year_sim: Year to simulate
+        ss: Safety stock, default upper bound of its range
+        rop: Reorder point, default upper bound of its range
+        q: Order quantity, default upper bound of its range
+        L: Lead time in days, default bounds of its range
+        key: Key of the first input, the inputs use key to key + 13
+    """
+    demand = year_daily_demand(df, year_sim)["Order_Demand"].to_numpy()
+    lead_time_demand = demand.mean() * max(L, 1)
+
+    ss_values = input_sweep_range("SS", 0, ss, key)
+    rop_values = input_sweep_range("ROP", 0, max(rop, 2 * lead_time_demand), key + 3)
+    q_values = input_sweep_range("Q", 1, max(q, 60 * demand.mean()), key + 6)
+    L_values = input_sweep_range("L", L, L, key + 9, integer=True)
+
+    result = cached_parameter_sweep(demand, ss_values, rop_values, q_values, L_values)
+    st.caption(f"{len(result):,} combinations simulated")
+
+    col1, col2 = st.columns(2)
+    ss_slice = col1.select_slider("Select SS", ss_values, key=key + 12)
+    L_slice = col2.select_slider("Select L", L_values, key=key + 13)
+    grid = result.loc[(result["SS"] == ss_slice) & (result["L"] == L_slice)]
+
+    for column, label, cmap in [
+        ("Fill_Rate", "Fill Rate", "RdYlGn"),
+        ("Avg_Inventory", "Average Inventory", "Blues"),
+    ]:
+        st.markdown(f"**{label}** (rows: ROP, columns: Q)")
+        heatmap = grid.pivot(index="ROP", columns="Q", values=column)
+        st.dataframe(
+            heatmap.style.background_gradient(cmap=cmap, axis=None).format("{:.2f}")
+        )
+
+    st.markdown("**Best combinations**")
+    st.dataframe(
+        result.sort_values(["Fill_Rate", "Avg_Inventory"], ascending=[False, True])
+        .head(10)
+        .round(2),
+        hide_index=True,
+    )
+
+
+def seasonal_rop_schedule(df, year_sim, ss, rop):
+    """
+    Builds a daily reorder point for the simulated year from the product's
+    month-of-year seasonal index, keeping the safety stock fixed.
+
+    Args:
+        df: DataFrame containing historical data of the product
+        year_sim: Year to simulate
+        ss: Safety stock
+        rop: Reorder point of an average month
+
+    Returns:
+        numpy.ndarray: Reorder point of every day of the simulated year
+    """
+    df = df.assign(Product_Code=st.session_state["product_code"])
+    _, month_index = seasonal_indices(daily_demand_matrix(df))
+    monthly_rop = seasonal_rop(ss, rop, month_index.iloc[0])
+
+    st.dataframe(
+        pd.DataFrame([monthly_rop.round()], columns=month_index.columns),
+        hide_index=True,
+    )
+    dates = pd.date_range(start=f"{year_sim}-01-01", end=f"{year_sim}-12-31", freq="D")
+    return daily_schedule(monthly_rop, dates)
+
+
 @st.fragment
 def simulation_forecast(df, lead_time_data):
     """
@@ -91,6 +564,13 @@ def simulation_forecast(df, lead_time_data):
     # Update the previous horizon
     st.session_state["previous_horizon"] = st.session_state["forecast_horizon"]
 
+    # Low value (C) or unpredictable (Z) items rarely justify expensive models
+    abc_xyz_class = st.session_state.get("abc_xyz_class")
+    if abc_xyz_class and (abc_xyz_class[0] == "C" or abc_xyz_class[1] == "Z"):
+        st.caption(
+            f"Class {abc_xyz_class} item: a naive or smoothing model is usually sufficient."
+        )
+
     # Create input controls for forecast parameters
     col1, col2, col3 = st.columns(3)
     selectbox_forecast_horizon(col1, 20002)
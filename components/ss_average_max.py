@@ -1,4 +1,5 @@
 import streamlit as st
+from core import safety_stock as core_ss
 
 
 @st.fragment
@@ -34,11 +35,13 @@ def ss_average_max():
 
     # Calculate Safety Stock (SS)
     # Formula: (Max Lead Time × Max Sales) - (Average Lead Time × Average Sales)
-    ss = round((max_lead_time * max_sales) - (average_lead_time * avg_sales))
+    ss = round(
+        core_ss.ss_average_max(max_lead_time, max_sales, average_lead_time, avg_sales)
+    )
 
     # Calculate Reorder Point (ROP)
     # Formula: Safety Stock + (Average Lead Time × Average Sales)
-    rop = round(ss + (average_lead_time * avg_sales))
+    rop = round(core_ss.reorder_point(ss, average_lead_time, avg_sales))
 
     # Display Safety Stock calculation and result
     st.info(
@@ -1,4 +1,5 @@
 import streamlit as st
+from core import safety_stock as core_ss
 
 
 def eoq():
@@ -29,7 +30,7 @@ def eoq():
     st.session_state["lot_size"] = lot_size
 
     # Calculate EOQ using Wilson formula
-    Q = (2 * (D * K) / H) ** (1 / 2)
+    Q = core_ss.eoq(D, K, H)
     Q_rounded = round(Q / lot_size) * lot_size
     st.session_state["EOQ"] = Q_rounded
 
@@ -64,11 +65,11 @@ def rop():
     st.session_state["delivery_lead_time"] = delivery_lead_time
 
     # Calculate Safety Stock
-    safety_stock = round(avg_daily_sales * nb_safety_days)
+    safety_stock = round(core_ss.ss_basic(avg_daily_sales, nb_safety_days))
     st.session_state["safety_stock"] = safety_stock
 
     # Calculate Reorder Point
-    ROP = avg_daily_sales * delivery_lead_time + safety_stock
+    ROP = core_ss.reorder_point(safety_stock, delivery_lead_time, avg_daily_sales)
     st.session_state["ROP"] = ROP
 
     # Display Safety Stock calculation
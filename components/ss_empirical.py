@@ -0,0 +1,148 @@
+"""Empirical lead time demand safety stock components"""
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+from core.simulation import year_daily_demand
+from core import lead_time_demand, monte_carlo
+from core.stats import avg_lead_time
+
+METHODS = ["FFT convolution", "Monte Carlo", "Rolling windows"]
+
+
+@st.cache_data(show_spinner=False)
+def fft_lead_time_demand(demand, lead_times):
+    """
+    Lead time demand distribution of the empirical daily demand over the
+    empirical lead times, built by FFT convolution.
+
+    Args:
+        demand (numpy.ndarray): Daily demand
+        lead_times (numpy.ndarray): Observed lead times in days
+
+    Returns:
+        tuple: Lead time demand PMF and the demand bin width
+    """
+    pmf, bin_width = lead_time_demand.demand_pmf(demand)
+    lead_time_pmf = lead_time_demand.lead_time_pmf(lead_times)
+    return lead_time_demand.compound_pmf(pmf, lead_time_pmf), bin_width
+
+
+@st.cache_data(show_spinner="Sampling lead time demand...")
+def mc_lead_time_demand(demand, lead_times, n_samples, seed):
+    """
+    Lead time demand samples of the empirical daily demand over the empirical
+    lead times.
+
+    Args:
+        demand (numpy.ndarray): Daily demand
+        lead_times (numpy.ndarray): Observed lead times in days
+        n_samples (int): Number of samples
+        seed (int): Seed of the random stream
+
+    Returns:
+        numpy.ndarray: Lead time demand samples
+    """
+    rng = np.random.default_rng(seed)
+    return monte_carlo.sample_lead_time_demand(demand, lead_times, n_samples, rng)
+
+
+@st.fragment
+def ss_empirical(filtered_data, lead_time_data):
+    """
+    Calculate safety stock and reorder point from the distribution of demand
+    during lead time instead of assuming normal demand and lead time.
+    ROP is the cycle service rate quantile of lead time demand and
+    SS = ROP - average lead time demand.
+
+    Args:
+        filtered_data (pd.DataFrame): Historical demand data
+        lead_time_data (pd.DataFrame): Historical lead time data
+    """
+    col1, col2, col3 = st.columns(3)
+    service_level = col1.number_input(
+        label="Specify Targeted Cycle Service Rate",
+        min_value=0.00,
+        max_value=0.99,
+        value=0.90,
+        step=0.01,
+        key=10025,
+    )
+    method = col2.selectbox("Select Method", METHODS, key=10026)
+
+    lead_times = lead_time_data["Lead_Time_Days"].dropna().to_numpy()
+    if len(lead_times) == 0:
+        st.warning("No lead time data for the selected product and year.")
+        return
+
+    demand = year_daily_demand(filtered_data, st.session_state["year"])
+    demand = demand["Order_Demand"].to_numpy()
+
+    if method == "FFT convolution":
+        pmf, bin_width = fft_lead_time_demand(demand, lead_times)
+        distribution = pd.DataFrame(
+            {
+                "Lead_Time_Demand": np.arange(len(pmf)) * bin_width,
+                "Probability": pmf,
+            }
+        )
+        ss, rop, mean = lead_time_demand.pmf_ss_rop(pmf, bin_width, service_level)
+    elif method == "Monte Carlo":
+        n_samples = col3.number_input(
+            "Specify Number of Samples",
+            min_value=1000,
+            value=monte_carlo.N_SAMPLES,
+            step=10000,
+            key=10027,
+        )
+        samples = mc_lead_time_demand(demand, lead_times, n_samples, seed=0)
+        counts, edges = np.histogram(samples, bins=100)
+        distribution = pd.DataFrame(
+            {"Lead_Time_Demand": edges[:-1], "Probability": counts / len(samples)}
+        )
+        ss, rop, mean = monte_carlo.samples_ss_rop(samples, service_level)
+    elif method == "Rolling windows":
+        window = col3.selectbox(
+            "Select Window Length",
+            ["Observed lead times", "Average lead time"],
+            key=10028,
+        )
+        if window == "Average lead time":
+            lead_times = [avg_lead_time(lead_time_data, "Days")]
+        windows, weights = lead_time_demand.rolling_lead_time_demand(
+            demand, lead_time_demand.lead_time_pmf(lead_times)
+        )
+        if not len(windows):
+            st.warning(
+                "Lead times are longer than the demand history of the selected year."
+            )
+            return
+        counts, edges = np.histogram(windows, bins=100, weights=weights)
+        distribution = pd.DataFrame(
+            {"Lead_Time_Demand": edges[:-1], "Probability": counts / counts.sum()}
+        )
+        ss, rop, mean = lead_time_demand.weighted_ss_rop(windows, weights, service_level)
+
+    st.info(
+        f"""
+    Reorder Point (ROP)
+          \n = {service_level:.0%} quantile of Lead Time Demand
+          \n = **{rop:.0f}**
+  """
+    )
+    st.info(
+        f"""
+    SS:
+      \n = ROP - Average Lead Time Demand
+      \n = {rop:.0f} - {mean:.0f}
+      \n = **{ss:.0f}**
+  """
+    )
+
+    st.area_chart(
+        distribution,
+        x="Lead_Time_Demand",
+        y="Probability",
+        x_label="Demand during Lead Time",
+        height=250,
+    )
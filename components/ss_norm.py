@@ -1,7 +1,20 @@
 from components.filters import *
 from components.inputs import *
 from components.utils import *
+from components.lead_time_fit import fit_lead_time_distributions
+from core.lead_time_fit import lead_time_moments, lead_time_quantile
+from core.stats import TIME_UNIT_DAYS
+from core.cleaning import daily_demand_matrix
+from core import safety_stock as core_ss
+from core import sensitivity
+from core.seasonality import (
+    seasonal_indices,
+    monthly_ss_rop_schedule,
+    MONTH_NAMES,
+)
 import scipy.stats as stats
+import numpy as np
+import pandas as pd
 
 
 @st.fragment
@@ -31,6 +44,215 @@ def ss_cycle_service_rate(filtered_data, lead_time_data):
     elif uncertainty_type == "Uncertain demand and lead time (dependent)":
         uncertain_demand_lead_time_dep(filtered_data, lead_time_data)
 
+    service_level_tradeoff(
+        "Cycle service rate", lead_time_demand_sd(uncertainty_type), key=10023
+    )
+    sensitivity_panel(uncertainty_type, key=10029)
+
+
+def lead_time_demand_sd(uncertainty_type):
+    """
+    Standard deviation of demand during lead time (σLT) of an uncertainty type,
+    i.e. its safety stock at Z = 1, from the inputs in session state.
+
+    Args:
+        uncertainty_type (str): Uncertainty type of the cycle service rate method
+
+    Returns:
+        float: Standard deviation of demand during lead time
+    """
+    if uncertainty_type == "Uncertain demand":
+        return core_ss.ss_uncertain_demand(
+            1, st.session_state["demand_sd"], st.session_state["avg_lead_time"]
+        )
+    elif uncertainty_type == "Uncertain lead time":
+        return core_ss.ss_uncertain_lead_time(
+            1, st.session_state["sd_lead_time"], st.session_state["avg_sales"]
+        )
+
+    args = (
+        1,
+        st.session_state["avg_lead_time"],
+        st.session_state["demand_sd"],
+        st.session_state["avg_sales"],
+        st.session_state["sd_lead_time"],
+    )
+    if uncertainty_type == "Uncertain demand and lead time (independent)":
+        return core_ss.ss_uncertain_demand_lead_time_ind(*args)
+    return core_ss.ss_uncertain_demand_lead_time_dep(*args)
+
+
+@st.cache_data(show_spinner=False)
+def cached_service_level_curve(
+    service_type, avg_sales, demand_sd, avg_lead_time, lead_time_demand_sd, holding_cost
+):
+    """
+    Cached service level vs. inventory cost curve of a product.
+
+    Args:
+        service_type (str): 'Cycle service rate' or 'Fill rate'
+        avg_sales (float): Average demand (D)
+        demand_sd (float): Standard deviation of demand (σd), used for fill rates
+        avg_lead_time (float): Average lead time (L)
+        lead_time_demand_sd (float): Standard deviation of demand during lead time,
+            used for cycle service rates
+        holding_cost (float): Holding cost per unit per year (H)
+
+    Returns:
+        pd.DataFrame: See core.safety_stock.service_level_curve
+    """
+    if service_type == "Fill rate":
+        return core_ss.fill_rate_curve(avg_sales, demand_sd, avg_lead_time, holding_cost)
+    return core_ss.cycle_service_curve(
+        avg_sales, avg_lead_time, lead_time_demand_sd, holding_cost
+    )
+
+
+def service_level_tradeoff(service_type, lead_time_demand_sd, key):
+    """
+    Displays SS, ROP, holding cost and expected shortage of service levels
+    from 0.50 to 0.999 with the inputs in session state.
+
+    Args:
+        service_type (str): 'Cycle service rate' or 'Fill rate'
+        lead_time_demand_sd (float): Standard deviation of demand during lead time
+        key (int): Key of the holding cost input
+    """
+    if not st.checkbox("Show service level trade-off", key=f"tradeoff_{key}"):
+        return
+
+    col1, col2, col3 = st.columns(3)
+    input_holding_cost(col1, key)
+
+    curve = cached_service_level_curve(
+        service_type,
+        st.session_state["avg_sales"],
+        st.session_state.get("demand_sd"),
+        st.session_state["avg_lead_time"],
+        lead_time_demand_sd,
+        st.session_state["holding_cost"],
+    )
+
+    col4, col5 = st.columns(2)
+    col4.line_chart(
+        curve, x="Service_Level", y=["SS", "ROP"], y_label="Quantity", height=250
+    )
+    col5.line_chart(
+        curve,
+        x="Expected_Shortage",
+        y="Holding_Cost",
+        x_label="Expected Shortage per Cycle",
+        y_label="Holding Cost / Year",
+        height=250,
+    )
+    st.dataframe(curve, hide_index=True)
+
+
+def sensitivity_panel(uncertainty_type, key):
+    """
+    Displays the effect of every input on SS and ROP with the inputs in
+    session state: a tornado chart of SS with every input lowered and raised
+    by 20% (cycle service rate by 5 points), the partial derivatives and
+    elasticities, and SS over a two-way grid of two inputs.
+
+    Args:
+        uncertainty_type (str): Uncertainty type of the cycle service rate method
+        key (int): Key of the first grid input, the second uses key + 1
+    """
+    if not st.checkbox("Show sensitivity analysis", key=f"sensitivity_{key}"):
+        return
+
+    names = sensitivity.UNCERTAINTY_INPUTS[uncertainty_type]
+    inputs = {name: st.session_state[name] for name in names}
+
+    bars = sensitivity.tornado(uncertainty_type, inputs)
+    base_ss, _ = sensitivity.cycle_service_ss_rop(uncertainty_type, **inputs)
+    col1, col2 = st.columns(2)
+    col1.bar_chart(
+        pd.DataFrame(
+            {"Low": bars["SS_Low"] - base_ss, "High": bars["SS_High"] - base_ss}
+        ),
+        x_label="Change of SS",
+        horizontal=True,
+        height=250,
+    )
+    col2.dataframe(
+        sensitivity.sensitivities(uncertainty_type, inputs)
+        .replace({"Input": sensitivity.INPUTS})
+        .round(3),
+        hide_index=True,
+    )
+
+    col3, col4, col5 = st.columns(3)
+    x = col3.selectbox(
+        "Select Grid Rows",
+        names,
+        index=len(names) - 1,
+        format_func=sensitivity.INPUTS.get,
+        key=key,
+    )
+    y = col4.selectbox(
+        "Select Grid Columns",
+        names,
+        index=0,
+        format_func=sensitivity.INPUTS.get,
+        key=key + 1,
+    )
+    if x == y:
+        st.warning("Select two different inputs for the grid.")
+        return
+
+    ss, _ = sensitivity.sensitivity_grid(
+        uncertainty_type,
+        inputs,
+        x,
+        sensitivity.grid_values(x, inputs[x]),
+        y,
+        sensitivity.grid_values(y, inputs[y]),
+    )
+    st.dataframe(ss.style.background_gradient(axis=None).format("{:.0f}"))
+
+
+def lead_time_distribution_moments(lead_time_data, key=10032):
+    """
+    Lets the user choose the lead time moments of the formulas: the sample
+    mean and standard deviation, or those of a fitted gamma or lognormal
+    distribution. Displays the best fitting distribution of the selected
+    product and its 95% quantile.
+
+    Args:
+        lead_time_data (pd.DataFrame): Historical lead time data
+        key (int): Key of the distribution selectbox
+
+    Returns:
+        tuple: Mean and standard deviation of lead time in the time unit,
+            None for the sample moments or when no distribution can be fitted
+    """
+    distribution = st.selectbox(
+        "Select Lead Time Distribution", ["sample", "gamma", "lognormal"], key=key
+    )
+    if "Product_Code" not in lead_time_data.columns or lead_time_data.empty:
+        return None, None
+
+    fits = fit_lead_time_distributions(lead_time_data)
+    if fits.empty or fits["n"].iloc[0] < 2:
+        return None, None
+
+    fit = fits.iloc[0]
+    best_fit = fit["best_fit"]
+    ks = fit["gamma_ks"] if best_fit == "gamma" else fit["lognorm_ks"]
+    p95 = lead_time_quantile(fit, 0.95, best_fit)
+    st.caption(
+        f"Best fitting lead time distribution: **{best_fit}** (KS = {ks:.2f}), "
+        f"95% of lead times within **{p95:.1f}** days"
+    )
+    if distribution == "sample":
+        return None, None
+
+    mean, sd = lead_time_moments(fit, distribution)
+    days = TIME_UNIT_DAYS[st.session_state["time_unit"]]
+    return round(float(mean) / days, 2), round(float(sd) / days, 2)
+
 
 def uncertain_demand(filtered_data, lead_time_data):
     """
@@ -51,10 +273,10 @@ def uncertain_demand(filtered_data, lead_time_data):
     input_demand_sd(col3, filtered_data, 1003)
 
     cycle_service_rate = st.session_state["cycle_service_rate"]
-    Z = round(stats.norm.ppf(cycle_service_rate), 2)
+    Z = float(core_ss.safety_factor(cycle_service_rate))
     sd = st.session_state["demand_sd"]
     L = st.session_state["avg_lead_time"]
-    ss = round(Z * sd * (L**0.5))
+    ss = round(core_ss.ss_uncertain_demand(Z, sd, L))
 
     # Display safety stock calculation
     st.info(
@@ -78,6 +300,34 @@ def uncertain_demand(filtered_data, lead_time_data):
   """
     )
 
+    seasonal_schedule(filtered_data, Z, sd, L, avg_sales)
+
+
+def seasonal_schedule(filtered_data, Z, sd, L, avg_sales):
+    """
+    Display monthly safety stock and reorder point schedules.
+    Average demand and its standard deviation are scaled by the product's
+    month-of-year seasonal index before applying SS = Z × σd × √L.
+
+    Args:
+        filtered_data (pd.DataFrame): Historical demand data
+        Z (float): Safety factor
+        sd (float): Standard deviation of demand
+        L (float): Average lead time
+        avg_sales (float): Average demand
+    """
+    if "Product_Code" not in filtered_data.columns or filtered_data.empty:
+        return
+    if not st.checkbox("Show monthly SS / ROP schedule (seasonal)"):
+        return
+
+    _, month_index = seasonal_indices(daily_demand_matrix(filtered_data))
+    ss, rop = monthly_ss_rop_schedule(avg_sales, sd, L, Z, month_index.iloc[[0]])
+    st.dataframe(
+        pd.DataFrame({"Month": MONTH_NAMES, "SS": ss[0], "ROP": rop[0]}),
+        hide_index=True,
+    )
+
 
 def uncertain_lead_time(filtered_data, lead_time_data):
     """
@@ -92,17 +342,18 @@ def uncertain_lead_time(filtered_data, lead_time_data):
         filtered_data (pd.DataFrame): Historical demand data
         lead_time_data (pd.DataFrame): Historical lead time data
     """
+    avg_lead_time, sd_lead_time = lead_time_distribution_moments(lead_time_data)
     col1, col2, col3 = st.columns(3)
     input_avg_sales(col1, filtered_data, 1006)
-    input_avg_lead_time(col2, lead_time_data, 1007)
-    input_sd_lead_time(col3, lead_time_data)
+    input_avg_lead_time(col2, lead_time_data, 1007, avg_lead_time)
+    input_sd_lead_time(col3, lead_time_data, sd_lead_time)
 
     cycle_service_rate = st.session_state["cycle_service_rate"]
     avg_sales = st.session_state["avg_sales"]
     sd_lead_time = st.session_state["sd_lead_time"]
 
-    Z = round(stats.norm.ppf(cycle_service_rate), 2)
-    ss = round(Z * sd_lead_time * avg_sales)
+    Z = float(core_ss.safety_factor(cycle_service_rate))
+    ss = round(core_ss.ss_uncertain_lead_time(Z, sd_lead_time, avg_sales))
 
     st.info(
         f"""
@@ -141,11 +392,12 @@ def uncertain_demand_lead_time_ind(filtered_data, lead_time_data):
         filtered_data (pd.DataFrame): Historical demand data
         lead_time_data (pd.DataFrame): Historical lead time data
     """
+    avg_lead_time, sd_lead_time = lead_time_distribution_moments(lead_time_data)
     col1, col2, col3 = st.columns(3)
     col4, col5, col6 = st.columns(3)
 
-    input_avg_lead_time(col2, lead_time_data, 1008)
-    input_sd_lead_time(col3, lead_time_data)
+    input_avg_lead_time(col2, lead_time_data, 1008, avg_lead_time)
+    input_sd_lead_time(col3, lead_time_data, sd_lead_time)
     input_avg_sales(col5, filtered_data, 1009)
     input_demand_sd(col6, filtered_data, 10010)
 
@@ -155,10 +407,12 @@ def uncertain_demand_lead_time_ind(filtered_data, lead_time_data):
     avg_sales = st.session_state["avg_sales"]
     sd_lead_time = st.session_state["sd_lead_time"]
 
-    Z = round(stats.norm.ppf(cycle_service_rate), 2)
-    temp_1 = avg_lead_time * (sd_demand**2)
-    temp_2 = (avg_lead_time * sd_lead_time) ** 2
-    ss = round(Z * ((temp_1 + temp_2) ** 0.5))
+    Z = float(core_ss.safety_factor(cycle_service_rate))
+    ss = round(
+        core_ss.ss_uncertain_demand_lead_time_ind(
+            Z, avg_lead_time, sd_demand, avg_sales, sd_lead_time
+        )
+    )
     rop = round(ss + avg_lead_time * avg_sales)
 
     st.info(
@@ -195,11 +449,12 @@ def uncertain_demand_lead_time_dep(filtered_data, lead_time_data):
         filtered_data (pd.DataFrame): Historical demand data
         lead_time_data (pd.DataFrame): Historical lead time data
     """
+    avg_lead_time, sd_lead_time = lead_time_distribution_moments(lead_time_data)
     col1, col2, col3 = st.columns(3)
     col4, col5, col6 = st.columns(3)
 
-    input_avg_lead_time(col2, lead_time_data, 10011)
-    input_sd_lead_time(col3, lead_time_data)
+    input_avg_lead_time(col2, lead_time_data, 10011, avg_lead_time)
+    input_sd_lead_time(col3, lead_time_data, sd_lead_time)
     input_avg_sales(col5, filtered_data, 10012)
     input_demand_sd(col6, filtered_data, 10013)
 
@@ -209,10 +464,12 @@ def uncertain_demand_lead_time_dep(filtered_data, lead_time_data):
     avg_sales = st.session_state["avg_sales"]
     sd_lead_time = st.session_state["sd_lead_time"]
 
-    Z = round(stats.norm.ppf(cycle_service_rate), 2)
-    temp_1 = Z * sd_demand * (avg_lead_time**0.5)
-    temp_2 = Z * avg_sales * sd_lead_time
-    ss = round(temp_1 + temp_2)
+    Z = float(core_ss.safety_factor(cycle_service_rate))
+    ss = round(
+        core_ss.ss_uncertain_demand_lead_time_dep(
+            Z, avg_lead_time, sd_demand, avg_sales, sd_lead_time
+        )
+    )
     rop = round(ss + avg_lead_time * avg_sales)
 
     st.info(
@@ -238,7 +495,7 @@ def uncertain_demand_lead_time_dep(filtered_data, lead_time_data):
 def ss_fill_rate(filtered_data, lead_time_data):
     """
     Calculate safety stock based on fill rate criterion.
-    Uses an approximation function to determine safety factor.
+    The safety factor is the exact inverse of the standard normal loss function.
 
     Args:
         filtered_data (pd.DataFrame): Historical demand data
@@ -258,16 +515,19 @@ def ss_fill_rate(filtered_data, lead_time_data):
     sigma = st.session_state["demand_sd"]
     L = st.session_state["avg_lead_time"]
 
-    z_std_normal_loss = mu * (1 - beta) / sigma
-    z = 4.85 - (z_std_normal_loss**1.3) * 0.3924 - (z_std_normal_loss**0.135) * 5.359
-    ss = round(z * sigma * (L**0.5))
+    k = core_ss.fill_rate_safety_factor(mu, sigma, beta)
+    ss = round(k * sigma * (L**0.5))
     rop = ss + L * mu
 
     st.info(
         f"""
-    Safety Stock (SS): **{ss}**
+    SS:
+      \n = k x Demand Standard Deviation x sqrt(Average Lead Time)
+      \n = {k:.2f} x {sigma:.2f} x sqrt({L})
+      \n = **{ss}**
+    \nk solves G(k) = Average Sales x (1 - Fill Rate) / Demand Standard Deviation,
+    where G is the standard normal loss function.
     \n[Formula reference](https://or.stackexchange.com/questions/5589/safety-stock-with-fill-rate-criterion) 
-    (using approximation function)
   """
     )
     st.info(
@@ -279,6 +539,8 @@ def ss_fill_rate(filtered_data, lead_time_data):
   """
     )
 
+    service_level_tradeoff("Fill rate", None, key=10024)
+
 
 @st.fragment
 def ss_holding_stockout(filtered_data, lead_time_data):
@@ -307,7 +569,7 @@ def ss_holding_stockout(filtered_data, lead_time_data):
     L = st.session_state["avg_lead_time"]
 
     # Calculate optimal safety stock based on costs
-    ss = round((mu + sigma * stats.norm.cdf(p / (p + h))) * (L**0.5))
+    ss = round(core_ss.ss_holding_stockout(mu, sigma, L, h, p))
     rop = ss + L * mu
 
     st.info(
@@ -0,0 +1,6 @@
+"""Streamlit-free computation core.
+
+Every function takes its parameters as explicit arguments and returns its
+results, so it can be called in loops, from a process pool or from a batch
+job. The Streamlit components are thin wrappers around this package.
+"""
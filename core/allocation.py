@@ -0,0 +1,152 @@
+"""Budget-constrained safety stock allocation engine"""
+
+import heapq
+import numpy as np
+import pandas as pd
+from core.safety_stock import (
+    eoq,
+    standard_normal_loss,
+    ss_uncertain_demand_lead_time_ind,
+)
+
+# Safety factor increment and maximum of the greedy allocation
+SAFETY_FACTOR_STEP = 0.05
+MAX_SAFETY_FACTOR = 4.0
+
+OBJECTIVES = ["Fill rate", "Expected shortages"]
+
+
+def allocate_safety_stock(
+    lead_time_demand_sd,
+    holding_cost,
+    budget,
+    shortage_weights=1.0,
+    step=SAFETY_FACTOR_STEP,
+    max_safety_factor=MAX_SAFETY_FACTOR,
+    index=None,
+):
+    """
+    Spreads a holding cost budget over the safety stocks of all products by
+    greedy marginal analysis.
+
+    The safety stock of every product starts at 0 and grows by steps of
+    step × σLT. The expected shortage of a product w × σLT × G(k) is evaluated
+    for all products and safety factors in one array operation; since G is
+    convex, the shortage saved per unit of holding cost decreases with every
+    step. A heap keeps the next step of every product ordered by that ratio
+    and the best step is bought until the budget runs out.
+
+    Args:
+        lead_time_demand_sd (array-like): Standard deviation of demand during
+            lead time of each product (σLT)
+        holding_cost (float or array-like): Holding cost per unit per year (H)
+        budget (float): Total holding cost per year of the safety stocks
+        shortage_weights (float or array-like): Weight of the expected shortage
+            per replenishment cycle of each product (w), e.g. replenishment
+            cycles per year to minimize the yearly shortage (fill rate)
+        step (float): Safety factor increment
+        max_safety_factor (float): Maximum safety factor of a product
+        index (array-like): Product of each row
+
+    Returns:
+        pd.DataFrame: One row per product with 'Safety_Factor', 'SS',
+            'Holding_Cost' and 'Expected_Shortage' (weighted)
+    """
+    sd = np.nan_to_num(np.atleast_1d(np.asarray(lead_time_demand_sd, dtype=float)))
+    n_products = len(sd)
+    H = np.broadcast_to(np.asarray(holding_cost, dtype=float), sd.shape)
+    weights = np.nan_to_num(
+        np.broadcast_to(np.asarray(shortage_weights, dtype=float), sd.shape)
+    )
+
+    # Expected shortage of every product at every safety factor
+    safety_factors = np.arange(0, max_safety_factor + step / 2, step)
+    n_steps = len(safety_factors) - 1
+    shortage = (weights * sd)[:, None] * standard_normal_loss(safety_factors)
+
+    # Shortage saved per unit of holding cost of every step
+    step_cost = H * sd * step
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = (shortage[:, :-1] - shortage[:, 1:]) / step_cost[:, None]
+    ratio = np.where(step_cost[:, None] > 0, np.nan_to_num(ratio), 0).ravel()
+
+    steps = [0] * n_products
+    first = ratio[::n_steps]
+    heap = [(-first.item(i), i) for i in np.flatnonzero(first > 0).tolist()]
+    heapq.heapify(heap)
+    remaining = float(budget)
+    while heap:
+        _, i = heap[0]
+        cost = step_cost.item(i)
+        if cost > remaining:
+            # Steps of this product are not affordable anymore
+            heapq.heappop(heap)
+            continue
+        remaining -= cost
+        steps[i] += 1
+        if steps[i] < n_steps and ratio.item(i * n_steps + steps[i]) > 0:
+            heapq.heapreplace(heap, (-ratio.item(i * n_steps + steps[i]), i))
+        else:
+            heapq.heappop(heap)
+
+    steps = np.array(steps)
+    k = safety_factors[steps]
+    ss = k * sd
+    return pd.DataFrame(
+        {
+            "Safety_Factor": k,
+            "SS": ss,
+            "Holding_Cost": H * ss,
+            "Expected_Shortage": shortage[np.arange(n_products), steps],
+        },
+        index=index,
+    )
+
+
+def portfolio_allocation(
+    inputs, holding_cost, budget, objective="Fill rate", order_cost=20.0
+):
+    """
+    Budget-constrained safety stocks of all products from their inputs.
+
+    Demand during lead time accounts for demand and lead time uncertainty
+    (independent). For the fill rate objective, expected shortages per cycle
+    are weighted by the replenishment cycles per year D / EOQ so that the
+    yearly shortage of the portfolio is minimized.
+
+    Args:
+        inputs (pd.DataFrame): Per-product inputs in days, see
+            core.safety_stock.portfolio_inputs
+        holding_cost (float): Holding cost per unit per year (H)
+        budget (float): Total holding cost per year of the safety stocks
+        objective (str): 'Fill rate' or 'Expected shortages'
+        order_cost (float): Fixed cost per order (K), for the EOQ
+
+    Returns:
+        tuple: One row per product with the allocation, and the portfolio
+            fill rate (None for the expected shortages objective)
+    """
+    D = inputs["avg_sales"].to_numpy()
+    sd = ss_uncertain_demand_lead_time_ind(
+        1,
+        inputs["avg_lead_time"].to_numpy(),
+        inputs["demand_sd"].to_numpy(),
+        D,
+        np.nan_to_num(inputs["sd_lead_time"].to_numpy()),
+    )
+
+    weights = 1.0
+    demand_per_year = D * 365
+    if objective == "Fill rate":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weights = demand_per_year / eoq(demand_per_year, order_cost, holding_cost)
+
+    result = allocate_safety_stock(
+        sd, holding_cost, budget, np.nan_to_num(weights), index=inputs.index
+    )
+    fill_rate = None
+    if objective == "Fill rate":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result["Fill_Rate"] = 1 - result["Expected_Shortage"] / demand_per_year
+        fill_rate = 1 - result["Expected_Shortage"].sum() / np.nansum(demand_per_year)
+    return result.round(2), fill_rate
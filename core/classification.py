@@ -0,0 +1,151 @@
+"""Portfolio-wide SKU segmentation"""
+
+import numpy as np
+import pandas as pd
+
+
+def abc_xyz_classification(
+    matrix, a_share=0.8, b_share=0.95, x_cv=0.5, y_cv=1.0, period="W"
+):
+    """
+    Classifies every product by annual volume (ABC) and demand variability (XYZ).
+
+    Products are ranked by annual volume; the products making up the first
+    a_share of the cumulative volume are A items, up to b_share B items and
+    the rest C items. XYZ uses the coefficient of variation of the demand
+    aggregated per period: X below x_cv, Y below y_cv, Z otherwise.
+    Negative demand (returns) is ignored.
+
+    Args:
+        matrix (pandas.DataFrame): Daily demand matrix (Date x Product_Code)
+        a_share (float): Cumulative volume share of A items
+        b_share (float): Cumulative volume share of A and B items
+        x_cv (float): Upper coefficient of variation of X items
+        y_cv (float): Upper coefficient of variation of Y items
+        period (str): Pandas frequency used to aggregate demand for the CV
+
+    Returns:
+        pandas.DataFrame: One row per Product_Code with Annual_Volume,
+        Volume_Share, Cumulative_Share, CV, ABC, XYZ and Class columns
+    """
+    matrix = matrix.clip(lower=0)
+    years = max(len(matrix) / 365, 1 / 365)
+    annual_volume = matrix.to_numpy().sum(axis=0) / years
+
+    # Cumulative volume share of all better ranked products
+    order = np.argsort(-annual_volume, kind="stable")
+    total = annual_volume.sum()
+    share = annual_volume / total if total > 0 else np.zeros_like(annual_volume)
+    cumulative = np.empty_like(share)
+    cumulative[order] = np.cumsum(share[order])
+    share_before = cumulative - share
+    abc = np.select([share_before < a_share, share_before < b_share], ["A", "B"], "C")
+
+    periods = matrix.resample(period).sum().to_numpy()
+    mean = periods.mean(axis=0) if len(periods) else np.zeros(matrix.shape[1])
+    sd = periods.std(axis=0, ddof=1) if len(periods) > 1 else np.zeros(matrix.shape[1])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cv = np.where(mean > 0, sd / mean, np.inf)
+    xyz = np.select([cv < x_cv, cv < y_cv], ["X", "Y"], "Z")
+
+    result = pd.DataFrame(
+        {
+            "Annual_Volume": annual_volume.round(),
+            "Volume_Share": share,
+            "Cumulative_Share": cumulative,
+            "CV": cv,
+            "ABC": abc,
+            "XYZ": xyz,
+        },
+        index=matrix.columns,
+    )
+    result["Class"] = result["ABC"] + result["XYZ"]
+    return result
+
+
+# Syntetos-Boylan cut-off values of the average demand interval and squared CV
+ADI_CUTOFF = 1.32
+CV2_CUTOFF = 0.49
+
+# Forecasting models worth fitting for each demand pattern. The grid searched
+# and auto-fitted models are left out for intermittent and lumpy demand,
+# where they are slow and rarely beat Croston-type methods.
+PATTERN_MODELS = {
+    "smooth": None,
+    "erratic": None,
+    "intermittent": ["Croston (SBA)", "Naive Drift", "Moving Average"],
+    "lumpy": ["Croston (SBA)", "Naive Drift", "Moving Average"],
+    "no demand": ["Naive Drift", "Moving Average"],
+}
+
+
+def demand_pattern_classification(matrix, adi_cutoff=ADI_CUTOFF, cv2_cutoff=CV2_CUTOFF):
+    """
+    Classifies the demand pattern of every product (Syntetos-Boylan).
+
+    ADI is the average number of days between positive demands and CV² the
+    squared coefficient of variation of the positive demand sizes:
+        smooth: ADI < 1.32 and CV² < 0.49
+        erratic: ADI < 1.32 and CV² >= 0.49
+        intermittent: ADI >= 1.32 and CV² < 0.49
+        lumpy: ADI >= 1.32 and CV² >= 0.49
+    Products without positive demand are classified as 'no demand'.
+
+    Args:
+        matrix (pandas.DataFrame): Daily demand matrix (Date x Product_Code)
+        adi_cutoff (float): Cut-off value of the average demand interval
+        cv2_cutoff (float): Cut-off value of the squared coefficient of variation
+
+    Returns:
+        pandas.DataFrame: One row per Product_Code with Demand_Days, ADI, CV2
+        and Pattern columns
+    """
+    values = matrix.to_numpy(dtype=float)
+    positive = values > 0
+    sizes = np.where(positive, values, 0.0)
+
+    n_positive = positive.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        adi = np.where(n_positive > 0, len(values) / n_positive, np.inf)
+        mean = sizes.sum(axis=0) / n_positive
+        var = (sizes**2).sum(axis=0) / n_positive - mean**2
+        cv2 = np.where(n_positive > 0, np.maximum(var, 0) / mean**2, np.nan)
+
+    pattern = np.select(
+        [
+            n_positive == 0,
+            (adi < adi_cutoff) & (cv2 < cv2_cutoff),
+            adi < adi_cutoff,
+            cv2 < cv2_cutoff,
+        ],
+        ["no demand", "smooth", "erratic", "intermittent"],
+        "lumpy",
+    )
+
+    return pd.DataFrame(
+        {"Demand_Days": n_positive, "ADI": adi, "CV2": cv2, "Pattern": pattern},
+        index=matrix.columns,
+    )
+
+
+def suitable_models(pattern, models):
+    """
+    Filters a list of forecasting models down to those suited to a demand pattern.
+
+    Moving average models match 'Moving Average' whatever their window.
+
+    Args:
+        pattern (str or None): Demand pattern, None keeps every model
+        models (list): Forecasting model names
+
+    Returns:
+        list: Suitable model names in their original order
+    """
+    allowed = PATTERN_MODELS.get(pattern)
+    if allowed is None:
+        return list(models)
+    return [
+        model
+        for model in models
+        if model in allowed or ("Moving Average" in model and "Moving Average" in allowed)
+    ]
@@ -0,0 +1,128 @@
+"""Robust outlier filtering of daily demand"""
+
+import pandas as pd
+
+# Scale factor that makes the MAD a consistent estimator of the standard deviation
+MAD_SCALE = 1.4826
+
+
+def daily_demand_matrix(df):
+    """
+    Pivots demand transactions into a dense daily demand matrix.
+
+    Transactions are summed per Date and Product_Code, and every calendar day
+    between the first and last date is present (days without demand are 0).
+
+    Args:
+        df (pandas.DataFrame): Demand data with 'Date', 'Product_Code' and 'Order_Demand' columns
+
+    Returns:
+        pandas.DataFrame: Matrix indexed by Date with one column per Product_Code
+    """
+    if df.empty:
+        return pd.DataFrame(index=pd.DatetimeIndex([], name="Date"), dtype=float)
+
+    matrix = (
+        df[["Date", "Product_Code", "Order_Demand"]]
+        .groupby(["Date", "Product_Code"])["Order_Demand"]
+        .sum()
+        .unstack(fill_value=0)
+    )
+    dates = pd.date_range(start=matrix.index.min(), end=matrix.index.max(), freq="D")
+    matrix = matrix.reindex(dates, fill_value=0).astype(float)
+    matrix.index.name = "Date"
+    matrix.columns.name = "Product_Code"
+    return matrix
+
+
+def warehouse_demand_matrix(df):
+    """
+    Pivots demand transactions into a dense daily demand matrix of every
+    product at every warehouse.
+
+    Args:
+        df (pandas.DataFrame): Demand data with 'Date', 'Warehouse', 'Product_Code'
+            and 'Order_Demand' columns
+
+    Returns:
+        pandas.DataFrame: Matrix indexed by Date with one column per
+            (Warehouse, Product_Code)
+    """
+    if df.empty:
+        columns = pd.MultiIndex.from_tuples([], names=["Warehouse", "Product_Code"])
+        return pd.DataFrame(
+            index=pd.DatetimeIndex([], name="Date"), columns=columns, dtype=float
+        )
+
+    matrix = (
+        df[["Date", "Warehouse", "Product_Code", "Order_Demand"]]
+        .groupby(["Date", "Warehouse", "Product_Code"])["Order_Demand"]
+        .sum()
+        .unstack(["Warehouse", "Product_Code"], fill_value=0)
+        .sort_index(axis=1)
+    )
+    dates = pd.date_range(start=matrix.index.min(), end=matrix.index.max(), freq="D")
+    matrix = matrix.reindex(dates, fill_value=0).astype(float)
+    matrix.index.name = "Date"
+    return matrix
+
+
+def hampel_filter(matrix, window=15, n_sigmas=3.0):
+    """
+    Applies a Hampel filter to every column of a daily demand matrix at once.
+
+    A value is flagged as an outlier when it lies more than n_sigmas robust
+    standard deviations (1.4826 x rolling MAD) away from the centred rolling
+    median, and is replaced by that median. Windows with a zero MAD, such as
+    runs of zero-demand days, are left untouched so that the demand spikes of
+    an intermittent series are not all flagged.
+
+    Args:
+        matrix (pandas.DataFrame): Daily demand matrix (Date x Product_Code)
+        window (int): Size of the centred rolling window in days
+        n_sigmas (float): Number of robust standard deviations tolerated
+
+    Returns:
+        pandas.DataFrame: Cleaned matrix with the same shape as the input
+    """
+    rolling_median = matrix.rolling(window, center=True, min_periods=1).median()
+    deviation = (matrix - rolling_median).abs()
+    mad = deviation.rolling(window, center=True, min_periods=1).median()
+
+    outliers = (mad > 0) & (deviation > n_sigmas * MAD_SCALE * mad)
+    return matrix.mask(outliers, rolling_median)
+
+
+def clean_daily_demand(df, window=15, n_sigmas=3.0):
+    """
+    Builds the raw and Hampel-cleaned daily demand matrices for all products.
+
+    Args:
+        df (pandas.DataFrame): Demand data with 'Date', 'Product_Code' and 'Order_Demand' columns
+        window (int): Size of the centred rolling window in days
+        n_sigmas (float): Number of robust standard deviations tolerated
+
+    Returns:
+        tuple: (raw matrix, cleaned matrix), both indexed by Date with one column per Product_Code
+    """
+    matrix = daily_demand_matrix(df)
+    return matrix, hampel_filter(matrix, window, n_sigmas)
+
+
+def product_daily_demand(matrix, product_code):
+    """
+    Extracts one product's daily series from a daily demand matrix.
+
+    Args:
+        matrix (pandas.DataFrame): Raw or cleaned daily demand matrix
+        product_code (str): Product code to extract
+
+    Returns:
+        pandas.DataFrame: DataFrame with 'Date' and 'Order_Demand' columns
+    """
+    if product_code not in matrix.columns:
+        return pd.DataFrame({"Date": pd.to_datetime([]), "Order_Demand": []})
+
+    df = matrix[product_code].rename("Order_Demand").reset_index()
+    df.columns = ["Date", "Order_Demand"]
+    return df
@@ -0,0 +1,153 @@
+"""Event-driven inventory simulation engine"""
+
+import heapq
+import numpy as np
+import pandas as pd
+
+EVENT_COLUMNS = [
+    "Day",
+    "Event",
+    "Quantity",
+    "On_Hand",
+    "On_Order",
+    "Backorders",
+    "Inventory_Position",
+]
+
+
+def simulate_events(demand, ss, rop, q, lead_times, backorders=True, seed=0):
+    """
+    Event-driven simulation of a continuous review (ROP, Q) policy with
+    stochastic lead times.
+
+    The simulation jumps from event to event instead of ticking through the
+    days: demand events on the days with demand and receipt events kept in
+    a priority queue of outstanding orders by arrival day. Receipts arrive
+    before the demand of their day. After every event, as many orders of Q
+    as needed are placed to bring the inventory position (on hand + on
+    order - backorders) above the reorder point, each with a lead time
+    drawn from the observed lead times, so several orders can be
+    outstanding at once. The simulation starts with Q + SS units on hand.
+
+    Args:
+        demand (array-like): Daily demand
+        ss (float): Safety stock level
+        rop (float): Reorder point, compared to the inventory position
+        q (float): Order quantity
+        lead_times (array-like): Observed lead times in days, rounded to whole days
+        backorders (bool): Unmet demand is backordered, otherwise it is lost
+        seed (int): Seed of the lead time draws
+
+    Returns:
+        pd.DataFrame: Event log with one row per event and the state after
+            it, see EVENT_COLUMNS
+
+    Raises:
+        ValueError: If Q is not positive or there are no lead times
+    """
+    if q <= 0:
+        raise ValueError("The order quantity must be positive")
+    lead_times = np.asarray(lead_times, dtype=float)
+    lead_times = np.rint(lead_times[~np.isnan(lead_times)]).clip(min=0).astype(int)
+    if len(lead_times) == 0:
+        raise ValueError("At least one lead time is needed")
+
+    demand = np.asarray(demand, dtype=float)
+    demand_days = np.flatnonzero(demand > 0).tolist()
+    rng = np.random.default_rng(seed)
+
+    on_hand = float(q + ss)
+    on_order = 0.0
+    backordered = 0.0
+    outstanding = []
+    events = []
+    order_id = 0
+
+    def log(day, event, quantity):
+        position = on_hand + on_order - backordered
+        events.append((day, event, quantity, on_hand, on_order, backordered, position))
+
+    def review(day):
+        nonlocal on_order, order_id
+        while on_hand + on_order - backordered <= rop:
+            arrival = day + int(rng.choice(lead_times))
+            heapq.heappush(outstanding, (arrival, order_id, q))
+            order_id += 1
+            on_order += q
+            log(day, "Order", q)
+
+    log(0, "Start", 0.0)
+    review(0)
+    next_demand = 0
+    while next_demand < len(demand_days) or outstanding:
+        if outstanding and (
+            next_demand == len(demand_days) or outstanding[0][0] <= demand_days[next_demand]
+        ):
+            day, _, quantity = heapq.heappop(outstanding)
+            if day >= len(demand):
+                break
+            on_order -= quantity
+            filled = min(backordered, quantity)
+            backordered -= filled
+            on_hand += quantity - filled
+            log(day, "Receipt", quantity)
+        else:
+            day = demand_days[next_demand]
+            next_demand += 1
+            quantity = demand[day]
+            shortage = max(quantity - on_hand, 0.0)
+            on_hand = max(on_hand - quantity, 0.0)
+            if backorders:
+                backordered += shortage
+            log(day, "Demand", quantity)
+            if shortage > 0:
+                log(day, "Backorder" if backorders else "Lost Sale", shortage)
+        review(day)
+
+    return pd.DataFrame(events, columns=EVENT_COLUMNS)
+
+
+def daily_states(events, n_days):
+    """
+    State at the end of every day from an event log.
+
+    Args:
+        events (pd.DataFrame): Event log, see simulate_events
+        n_days (int): Number of simulated days
+
+    Returns:
+        pd.DataFrame: 'On_Hand', 'On_Order', 'Backorders' and
+            'Inventory_Position' indexed by day
+    """
+    states = events.groupby("Day")[EVENT_COLUMNS[3:]].last()
+    return states.reindex(range(n_days)).ffill().fillna(0)
+
+
+def event_summary(events, demand):
+    """
+    Service and inventory measures of an event-driven simulation.
+
+    Args:
+        events (pd.DataFrame): Event log, see simulate_events
+        demand (array-like): Daily demand
+
+    Returns:
+        dict: 'Fill_Rate' (share of demand served from stock), 'Orders',
+            'Avg_On_Hand', 'Max_Backorders', 'Max_Outstanding_Orders' and
+            'Shortage' (units backordered or lost)
+    """
+    demand = np.asarray(demand, dtype=float)
+    states = daily_states(events, len(demand))
+    shortage = events.loc[events["Event"].isin(["Backorder", "Lost Sale"]), "Quantity"]
+    total_demand = demand[demand > 0].sum()
+
+    # Outstanding orders after every event, +1 per order and -1 per receipt
+    change = events["Event"].map({"Order": 1, "Receipt": -1}).fillna(0)
+    return {
+        "Fill_Rate": 1 - shortage.sum() / total_demand if total_demand > 0 else np.nan,
+        "Orders": int((events["Event"] == "Order").sum()),
+        "Avg_On_Hand": states["On_Hand"].mean(),
+        "Max_Backorders": events["Backorders"].max(),
+        "Max_Outstanding_Orders": int(change.cumsum().max()) if len(change) else 0,
+        "Shortage": shortage.sum(),
+    }
@@ -0,0 +1,335 @@
+"""Forecasting engine"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from darts import TimeSeries
+from darts.models import NaiveDrift, NaiveMovingAverage, LinearRegressionModel
+from darts.models import StatsForecastAutoARIMA, StatsForecastAutoETS, RandomForest
+from darts.models import StatsForecastAutoTheta, KalmanForecaster, Croston
+import darts.metrics
+
+FORECAST_HORIZON_DAYS = {"Day": 1, "Week": 7, "Month": 30}
+
+# Models tuned by a grid search instead of being used with their defaults
+GRIDSEARCH_MODELS = {
+    "Linear Regression": LinearRegressionModel,
+    "Random Forest": RandomForest,
+}
+
+
+class CrostonSBA(Croston):
+    """
+    Croston model with the Syntetos-Boylan Approximation for intermittent demand.
+
+    Croston.predict does not accept the show_warnings argument passed by
+    historical_forecasts, so it is dropped here.
+    """
+
+    def __init__(self):
+        super().__init__(version="sba")
+
+    def predict(self, n, num_samples=1, verbose=False, show_warnings=True):
+        return super().predict(n, num_samples=num_samples, verbose=verbose)
+
+
+def forecast_horizon_days(forecast_horizon):
+    """
+    Convert a forecast horizon setting to number of days.
+
+    Args:
+        forecast_horizon (str): 'Day', 'Week' or 'Month'
+
+    Returns:
+        int: Number of days in the forecast horizon
+    """
+    return FORECAST_HORIZON_DAYS.get(forecast_horizon)
+
+
+def prepare_timeseries(df, start_date, end_date):
+    """
+    Prepare a continuous daily time series of the demand between two dates.
+
+    Days without demand are filled with 0 and negative demand is clipped to 0.
+
+    Args:
+        df (pandas.DataFrame): Input DataFrame with Date and Order_Demand columns
+        start_date (str): First day of the series, e.g. '2023-01-01'
+        end_date (str): Last day of the series, e.g. '2023-12-31'
+
+    Returns:
+        TimeSeries: Darts TimeSeries object ready for forecasting
+    """
+    # Filter data for selected time range
+    df_filtered = df.loc[(df["Date"] >= start_date) & (df["Date"] <= end_date)]
+    df_filtered = df_filtered[["Date", "Order_Demand"]]
+    df_filtered = df_filtered.groupby("Date").sum().reset_index()
+
+    # Create continuous date range and merge with filtered data
+    date_range = pd.date_range(start=start_date, end=end_date, freq="D")
+    df_forecast = pd.DataFrame({"Date": date_range})
+    df_forecast = pd.merge(df_forecast, df_filtered, on="Date", how="left")
+    df_forecast.fillna(value=0, inplace=True)
+    df_forecast["Order_Demand"] = df_forecast["Order_Demand"].clip(lower=0)
+
+    df_forecast = df_forecast[["Date", "Order_Demand"]]
+    df_forecast.columns = ["Date", "Value"]
+    return TimeSeries.from_dataframe(df_forecast, "Date", "Value", freq="D")
+
+
+def build_model(model):
+    """
+    Creates a forecasting model that is used with its default parameters.
+
+    Args:
+        model (str): Name of the forecasting model
+
+    Returns:
+        object: Instance of the forecasting model, None for the grid search
+            models (see GRIDSEARCH_MODELS) and unknown names
+    """
+    if "Moving Average" in model:
+        return NaiveMovingAverage(input_chunk_length=3)  # Default to 3 periods
+    if model == "Naive Drift":
+        return NaiveDrift()
+    elif model == "ARIMA":
+        return StatsForecastAutoARIMA()
+    elif model == "Exponential Smoothing":
+        return StatsForecastAutoETS()
+    elif model == "Theta":
+        return StatsForecastAutoTheta()
+    elif model == "Kalman Filter":
+        return KalmanForecaster()
+    elif model == "Croston (SBA)":
+        return CrostonSBA()
+
+
+def param_grid(model, horizon_days):
+    """
+    Define parameter grid for model optimization.
+
+    Args:
+        model (str): 'Linear Regression' or 'Random Forest'
+        horizon_days (int): Number of days in the forecast horizon
+
+    Returns:
+        dict: Parameter grid for model optimization
+    """
+    if model == "Linear Regression":
+        return {
+            "lags": [
+                [-1],
+                [-1, -2],
+                [-1, -2, -3],
+                [-1, -2, -3, -4, -5, -6, -7],
+            ],  # Different lag values to test
+            "output_chunk_length": [horizon_days],
+            "n_jobs": [-1],  # Use all available cores
+        }
+    elif model == "Random Forest":
+        return {
+            "n_estimators": [50, 100],  # Reduced number of options for tree count
+            "max_depth": [10, 20],  # Reduced depth options
+            "lags": [
+                [-1],
+                [-1, -2, -3],
+                [-1, -2, -3, -4, -5, -6, -7],
+            ],  # Key lag values
+            "output_chunk_length": [horizon_days],
+            "n_jobs": [-1],  # Use all available cores
+        }
+
+
+def optimize_model(model, parameters, series, val_series):
+    """
+    Perform grid search to optimize model parameters.
+
+    Args:
+        model (str): 'Linear Regression' or 'Random Forest'
+        parameters (dict): Parameter grid to search
+        series (TimeSeries): Training series
+        val_series (TimeSeries): Validation series
+
+    Returns:
+        tuple: Optimized model instance and its best parameters
+    """
+    gridsearch = GRIDSEARCH_MODELS[model].gridsearch(
+        parameters=parameters,
+        series=series,
+        val_series=val_series,
+        n_jobs=-1,
+        metric=darts.metrics.mae,
+        show_warnings=False,
+    )
+    return gridsearch[0], gridsearch[1]
+
+
+def select_model(model, series, year, horizon_days):
+    """
+    Creates a forecasting model, tuned by a grid search for the models of
+    GRIDSEARCH_MODELS: trained on the series until October of the year and
+    validated on its last two months.
+
+    Args:
+        model (str): Name of the forecasting model
+        series (TimeSeries): Daily demand from the start of the year
+        year (int): Year of the training data
+        horizon_days (int): Number of days in the forecast horizon
+
+    Returns:
+        tuple: Model instance and the best parameters of the grid search,
+            None for the models used with their defaults
+    """
+    if model not in GRIDSEARCH_MODELS:
+        return build_model(model), None
+
+    train_series = series.drop_after(pd.Timestamp(f"{year}-11-01"))
+    val_series = series.slice(
+        pd.Timestamp(f"{year}-11-01"), pd.Timestamp(f"{year}-12-31")
+    )
+    return optimize_model(
+        model, param_grid(model, horizon_days), train_series, val_series
+    )
+
+
+def historical_forecast(series, model, year, horizon, start=None):
+    """
+    Backtest of a model over the year following the training year: every
+    day is forecast from the data available a forecast horizon earlier.
+
+    Args:
+        series (TimeSeries): Daily demand over the year and the next one,
+            see prepare_timeseries
+        model (str or object): Name of the forecasting model, see
+            select_model, or a model instance
+        year (int): Year of the training data
+        horizon (str): Forecast horizon, 'Day', 'Week' or 'Month'
+        start (int): Position of the first forecast window, by default the
+            one whose forecast is the first day of the next year
+
+    Returns:
+        tuple: Forecast and actual values (TimeSeries) of the next year
+    """
+    horizon_days = forecast_horizon_days(horizon)
+    if isinstance(model, str):
+        model, _ = select_model(model, series, year, horizon_days)
+    if start is None:
+        start = 365 - horizon_days + 1
+
+    predicted_series = model.historical_forecasts(
+        series, forecast_horizon=horizon_days, start=start, verbose=False
+    )
+    actual_series = series.drop_before(pd.Timestamp(f"{year}-12-31"))
+    return predicted_series, actual_series
+
+
+def future_forecast(series, model, year, horizon):
+    """
+    Forecast of the days following the series over a forecast horizon.
+
+    Args:
+        series (TimeSeries): Daily demand of the year, see prepare_timeseries
+        model (str or object): Name of the forecasting model, see
+            select_model, or a model instance
+        year (int): Year of the series
+        horizon (str): Forecast horizon, 'Day', 'Week' or 'Month'
+
+    Returns:
+        TimeSeries: Forecast values
+    """
+    horizon_days = forecast_horizon_days(horizon)
+    if isinstance(model, str):
+        model, _ = select_model(model, series, year, horizon_days)
+    model.fit(series)
+    return model.predict(horizon_days)
+
+
+def portfolio_forecast_scores(df, model, year, horizon, n_workers=None):
+    """
+    Backtests a model on every product, see historical_forecast, with the
+    products split across a process pool.
+
+    Args:
+        df (pandas.DataFrame): Transactions with Product_Code, Date and
+            Order_Demand columns
+        model (str): Name of the forecasting model
+        year (int): Year of the training data
+        horizon (str): Forecast horizon, 'Day', 'Week' or 'Month'
+        n_workers (int): Number of worker processes, all CPUs when None and
+            no pool when 1
+
+    Returns:
+        pd.DataFrame: 'Bias', 'MAE' and 'MAPE' (in %) per Product_Code
+    """
+    products = sorted(df["Product_Code"].unique())
+    series = [
+        prepare_timeseries(
+            df.loc[df["Product_Code"] == product],
+            f"{year}-01-01",
+            f"{year + 1}-12-31",
+        )
+        for product in products
+    ]
+    tasks = [(s, model, year, horizon) for s in series]
+
+    n_workers = n_workers or os.cpu_count()
+    if n_workers == 1 or len(tasks) <= 1:
+        scores = [_forecast_scores_task(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            scores = list(executor.map(_forecast_scores_task, *zip(*tasks)))
+
+    return pd.DataFrame(
+        scores,
+        index=pd.Index(products, name="Product_Code"),
+        columns=["Bias", "MAE", "MAPE"],
+    )
+
+
+def _forecast_scores_task(series, model, year, horizon):
+    """
+    Scores of the backtest of one product, run in a worker process.
+
+    Returns:
+        tuple: Bias, MAE and MAPE (in %)
+    """
+    predicted_series, actual_series = historical_forecast(series, model, year, horizon)
+    actual_values, predicted_values = (
+        actual_series.pd_series().align(predicted_series.pd_series(), join="inner")
+    )
+    return forecast_scores(actual_values, predicted_values)
+
+
+def forecast_scores(actual_values, predicted_values):
+    """
+    Calculate forecast performance metrics.
+
+    MAPE only considers the days with non-zero actual values, and is NaN
+    without any.
+
+    Args:
+        actual_values (array-like): Actual values
+        predicted_values (array-like): Forecast values
+
+    Returns:
+        tuple: Rounded bias, MAE and MAPE (in %)
+    """
+    actual_values = np.asarray(actual_values, dtype=float)
+    predicted_values = np.asarray(predicted_values, dtype=float)
+    non_zero = actual_values != 0
+
+    bias = round(np.mean(predicted_values - actual_values))
+    mae = round(np.mean(np.abs(predicted_values - actual_values)))
+    if not non_zero.any():
+        return bias, mae, np.nan
+    mape = round(
+        np.mean(
+            np.abs(
+                (predicted_values[non_zero] - actual_values[non_zero])
+                / actual_values[non_zero]
+            )
+        )
+        * 100
+    )
+    return bias, mae, mape
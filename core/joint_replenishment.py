@@ -0,0 +1,162 @@
+"""Joint replenishment engine for products sharing an order cost"""
+
+import numpy as np
+import pandas as pd
+
+# Number of base cycles evaluated per group before the refinement
+N_BASE_CYCLES = 256
+
+
+def optimal_multipliers(base_cycle, minor_cost, holding_demand):
+    """
+    Integer order cycle multipliers minimizing the cost of every product for
+    base cycles T.
+
+    The cost s / (k × T) + k × T × D × H / 2 of a product is convex in k, so
+    its integer optimum is the smallest k with k × (k + 1) >= 2s / (D × H × T²).
+
+    Args:
+        base_cycle (float or numpy.ndarray): Base cycles T in years, shape () or (cycles, 1)
+        minor_cost (numpy.ndarray): Order cost of each product added to an order (s)
+        holding_demand (numpy.ndarray): Annual demand × holding cost of each product (D × H)
+
+    Returns:
+        numpy.ndarray: Multipliers k >= 1, broadcast of T and the products
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = 2 * minor_cost / (holding_demand * base_cycle**2)
+    k = np.ceil((np.sqrt(1 + 4 * np.nan_to_num(ratio, posinf=1e12)) - 1) / 2)
+    return np.maximum(k, 1)
+
+
+def joint_cost(base_cycle, multipliers, major_cost, minor_cost, holding_demand):
+    """
+    Annual ordering and holding cost of a joint replenishment policy:
+        TC(T, k) = (S + Σ s / k) / T + T / 2 × Σ k × D × H
+
+    Args:
+        base_cycle (float or numpy.ndarray): Base cycles T in years, shape () or (cycles, 1)
+        multipliers (numpy.ndarray): Multipliers k, broadcast of T and the products
+        major_cost (float): Order cost of every joint order (S)
+        minor_cost (numpy.ndarray): Order cost of each product added to an order (s)
+        holding_demand (numpy.ndarray): Annual demand × holding cost of each product (D × H)
+
+    Returns:
+        numpy.ndarray: Total cost per base cycle
+    """
+    base_cycle = np.asarray(base_cycle, dtype=float)
+    ordering = (major_cost + (minor_cost / multipliers).sum(axis=-1)) / base_cycle[..., 0]
+    holding = base_cycle[..., 0] / 2 * (multipliers * holding_demand).sum(axis=-1)
+    return ordering + holding
+
+
+def joint_replenishment(
+    demand_per_year, major_cost, minor_cost, holding_cost, n_cycles=N_BASE_CYCLES
+):
+    """
+    Base cycle and integer multipliers of a group of products sharing an order
+    cost: product i is ordered every k_i base cycles.
+
+    Costs of all products at all candidate base cycles are evaluated in one
+    array pass on a log-spaced grid between the bounds of the optimum, then
+    the best candidate is refined by alternating the optimal base cycle
+    for fixed multipliers and the optimal multipliers for a fixed base cycle
+    until the multipliers do not change.
+
+    Args:
+        demand_per_year (array-like): Annual demand of each product (D)
+        major_cost (float): Order cost of every joint order (S)
+        minor_cost (float or array-like): Order cost of each product added to an order (s)
+        holding_cost (float or array-like): Holding cost per unit per year (H)
+        n_cycles (int): Number of candidate base cycles
+
+    Returns:
+        tuple: Base cycle T in years, multipliers of the products and the
+            total annual cost, T is NaN when no product has demand
+    """
+    D = np.atleast_1d(np.asarray(demand_per_year, dtype=float))
+    s = np.broadcast_to(np.asarray(minor_cost, dtype=float), D.shape)
+    DH = D * np.broadcast_to(np.asarray(holding_cost, dtype=float), D.shape)
+    if not (DH > 0).any():
+        return np.nan, np.ones_like(D), 0.0
+
+    # Ordering every product every cycle (k = 1) gives the longest base cycle,
+    # the product with the shortest own cycle the shortest one
+    upper = np.sqrt(2 * (major_cost + s.sum()) / DH.sum())
+    with np.errstate(divide="ignore"):
+        own_cycles = np.sqrt(2 * (major_cost + s[DH > 0]) / DH[DH > 0])
+    lower = min(np.sqrt(2 * major_cost / DH.sum()), own_cycles.min()) / 2
+    lower = min(max(lower, upper * 1e-4), upper)
+    cycles = np.geomspace(lower, upper, n_cycles)[:, None]
+
+    k = optimal_multipliers(cycles, s, DH)
+    costs = joint_cost(cycles, k, major_cost, s, DH)
+    best = np.argmin(costs)
+    T, k = cycles[best, 0], k[best]
+
+    for _ in range(100):
+        T = np.sqrt(2 * (major_cost + (s / k).sum()) / (k * DH).sum())
+        new_k = optimal_multipliers(T, s, DH)
+        if (new_k == k).all():
+            break
+        k = new_k
+
+    cost = joint_cost(np.array([T]), k, major_cost, s, DH)[()]
+    if cost > costs[best]:
+        T, k, cost = cycles[best, 0], optimal_multipliers(cycles[best, 0], s, DH), costs[best]
+    return T, k, float(cost)
+
+
+def portfolio_joint_replenishment(
+    demand_per_year, groups, major_cost, minor_cost, holding_cost
+):
+    """
+    Joint replenishment policy of every group of products, e.g. warehouses.
+
+    Args:
+        demand_per_year (pd.Series): Annual demand of each product (D), indexed
+            by product
+        groups (array-like): Group of each product, e.g. its warehouse
+        major_cost (float): Order cost of every joint order of a group (S)
+        minor_cost (float): Order cost of each product added to an order (s)
+        holding_cost (float): Holding cost per unit per year (H)
+
+    Returns:
+        tuple: Products with their 'Group', 'Multiplier', 'Cycle_Days' and
+            'Order_Quantity', and groups with 'Base_Cycle_Days',
+            'Joint_Cost' and 'Independent_Cost' (every product ordered on
+            its own EOQ at S + s) and 'Savings'
+    """
+    demand_per_year = demand_per_year.clip(lower=0)
+    groups = pd.Series(np.asarray(groups), index=demand_per_year.index)
+
+    products = []
+    summary = {}
+    for group, demand in demand_per_year.groupby(groups, sort=True):
+        D = demand.to_numpy(dtype=float)
+        T, k, cost = joint_replenishment(D, major_cost, minor_cost, holding_cost)
+        k = np.where(D > 0, k, np.nan)
+        products.append(
+            pd.DataFrame(
+                {
+                    "Group": group,
+                    "Demand_per_Year": D,
+                    "Multiplier": k,
+                    "Cycle_Days": k * T * 365,
+                    "Order_Quantity": D * k * T,
+                },
+                index=demand.index,
+            )
+        )
+        independent = np.sqrt(2 * (major_cost + minor_cost) * D * holding_cost).sum()
+        summary[group] = {
+            "Base_Cycle_Days": T * 365,
+            "Joint_Cost": cost,
+            "Independent_Cost": independent,
+            "Savings": independent - cost,
+        }
+
+    products = pd.concat(products) if products else pd.DataFrame()
+    summary = pd.DataFrame.from_dict(summary, orient="index")
+    summary.index.name = "Group"
+    return products.round(2), summary.round(2)
@@ -0,0 +1,289 @@
+"""Lead time demand distribution engine"""
+
+import numpy as np
+import pandas as pd
+import scipy.fft
+
+# Number of bins of the daily demand probability mass vectors
+MAX_DEMAND_BINS = 128
+
+
+def demand_pmf(demand, max_bins=MAX_DEMAND_BINS):
+    """
+    Empirical probability mass vectors of daily demand.
+
+    Demand is discretized in bins of a width chosen per product so that its
+    maximum falls in the last bin, e.g. a maximum demand of 5,000 with 128
+    bins gives a bin width of 40 units.
+
+    Args:
+        demand (array-like): Daily demand, shape (days,) for a product or
+            (days, products) for a daily demand matrix
+        max_bins (int): Number of bins
+
+    Returns:
+        tuple: Probability mass vectors of shape (bins,) or (products, bins),
+            and the bin width of each product
+    """
+    demand = np.clip(np.asarray(demand, dtype=float), 0, None)
+    single = demand.ndim == 1
+    if single:
+        demand = demand[:, None]
+    days, n_products = demand.shape
+
+    bin_width = np.maximum(np.ceil(demand.max(axis=0, initial=0) / (max_bins - 1)), 1)
+    bins = np.rint(demand / bin_width).astype(int)
+
+    # Histogram of every product in a single bincount
+    flat_bins = (bins + np.arange(n_products) * max_bins).ravel()
+    pmf = np.bincount(flat_bins, minlength=n_products * max_bins)
+    pmf = pmf.reshape(n_products, max_bins) / max(days, 1)
+
+    if single:
+        return pmf[0], bin_width[0]
+    return pmf, bin_width
+
+
+def lead_time_pmf(lead_times):
+    """
+    Empirical probability mass vector of lead times rounded to whole days.
+
+    Args:
+        lead_times (array-like): Observed lead times in days
+
+    Returns:
+        numpy.ndarray: Probability of each lead time, indexed by days
+    """
+    lead_times = np.rint(np.asarray(lead_times, dtype=float))
+    lead_times = lead_times[~np.isnan(lead_times)].clip(min=0).astype(int)
+    return np.bincount(lead_times) / len(lead_times)
+
+
+def portfolio_lead_time_pmf(lead_time_data, products):
+    """
+    Empirical probability mass vectors of the lead times of every product.
+
+    Args:
+        lead_time_data (pd.DataFrame): Lead time data with 'Product_Code' and
+            'Lead_Time_Days' columns
+        products (array-like): Products of the rows
+
+    Returns:
+        numpy.ndarray: Shape (products, days), rows of products without lead
+            times are NaN
+    """
+    lead_time_data = lead_time_data.dropna(subset=["Lead_Time_Days"])
+    days = lead_time_data["Lead_Time_Days"].round().clip(lower=0)
+    counts = pd.crosstab(lead_time_data["Product_Code"], days.astype(int))
+    counts = counts.reindex(
+        index=products, columns=range(int(days.max()) + 1 if len(days) else 1)
+    ).fillna(0)
+    totals = counts.sum(axis=1).to_numpy()[:, None]
+    with np.errstate(invalid="ignore"):
+        return np.where(totals > 0, counts.to_numpy() / totals, np.nan)
+
+
+def compound_pmf(demand_pmf, lead_time_pmf):
+    """
+    Probability mass vector of the demand during a random lead time.
+
+    The lead time demand is a random sum of L daily demands, so its
+    distribution is Σ P(L = l) × (daily demand PMF convolved l times). All
+    convolutions are done at once in the Fourier domain, where the compound
+    is the lead time probability generating function evaluated at the
+    transform of the daily demand PMF (Horner's scheme), in O(n log n)
+    per product.
+
+    Args:
+        demand_pmf (numpy.ndarray): Daily demand PMF, shape (bins,) or (products, bins)
+        lead_time_pmf (numpy.ndarray): Lead time PMF indexed by days, shape
+            (days,) or (products, days)
+
+    Returns:
+        numpy.ndarray: Lead time demand PMF in demand bins, shape
+            (size,) or (products, size) with size = (bins - 1) x (days - 1) + 1
+    """
+    n_bins = demand_pmf.shape[-1]
+    n_days = lead_time_pmf.shape[-1]
+    size = (n_bins - 1) * (n_days - 1) + 1
+    n_fft = scipy.fft.next_fast_len(size, real=True)
+
+    transform = scipy.fft.rfft(demand_pmf, n_fft)
+    generating = np.broadcast_to(lead_time_pmf[..., -1:], transform.shape).astype(complex)
+    for day in range(n_days - 2, -1, -1):
+        generating = generating * transform + lead_time_pmf[..., day : day + 1]
+
+    pmf = scipy.fft.irfft(generating, n_fft)[..., :size]
+    # Remove the round-off of the transforms
+    return np.clip(pmf, 0, None)
+
+
+def pmf_ss_rop(pmf, bin_width, service_level):
+    """
+    Reorder point and safety stock of a cycle service level read from the
+    lead time demand distribution.
+
+    ROP is the service level quantile of the lead time demand and
+    SS = ROP - average lead time demand.
+
+    Args:
+        pmf (numpy.ndarray): Lead time demand PMF, shape (size,) or (products, size)
+        bin_width (float or array-like): Demand bin width of each product
+        service_level (float): Targeted cycle service rate
+
+    Returns:
+        tuple: Safety stock, reorder point and average lead time demand
+    """
+    cdf = np.cumsum(pmf, axis=-1)
+    total = cdf[..., -1:]
+    quantile = (cdf < service_level * total).sum(axis=-1)
+    with np.errstate(invalid="ignore"):
+        mean = (pmf * np.arange(pmf.shape[-1])).sum(axis=-1) / total[..., 0]
+    rop = quantile * bin_width
+    mean = mean * bin_width
+    return rop - mean, rop, mean
+
+
+def portfolio_fft_safety_stock(
+    daily_demand, lead_time_data, service_level, max_bins=MAX_DEMAND_BINS, chunk_size=256
+):
+    """
+    Safety stock and reorder point of every product from its lead time demand
+    distribution, built from the empirical daily demand and lead times.
+
+    Args:
+        daily_demand (pd.DataFrame): Daily demand matrix (Date x Product_Code)
+        lead_time_data (pd.DataFrame): Lead time data with 'Product_Code' and
+            'Lead_Time_Days' columns
+        service_level (float): Targeted cycle service rate
+        max_bins (int): Number of bins of the daily demand PMF
+        chunk_size (int): Number of products transformed at once, to bound memory
+
+    Returns:
+        pd.DataFrame: 'Lead Time Demand (FFT) SS' and 'Lead Time Demand (FFT) ROP'
+            per Product_Code, NaN for products without lead times
+    """
+    products = daily_demand.columns
+    pmf, bin_width = demand_pmf(daily_demand.to_numpy(), max_bins)
+    lead_times = portfolio_lead_time_pmf(lead_time_data, products)
+
+    ss = np.full(len(products), np.nan)
+    rop = np.full(len(products), np.nan)
+    for start in range(0, len(products), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        lead_time_demand = compound_pmf(pmf[chunk], np.nan_to_num(lead_times[chunk]))
+        ss[chunk], rop[chunk], _ = pmf_ss_rop(
+            lead_time_demand, bin_width[chunk], service_level
+        )
+
+    missing = np.isnan(lead_times).all(axis=1)
+    ss[missing] = np.nan
+    rop[missing] = np.nan
+    return pd.DataFrame(
+        {"Lead Time Demand (FFT) SS": ss, "Lead Time Demand (FFT) ROP": rop},
+        index=products,
+    ).round()
+
+
+def rolling_lead_time_demand(demand, lead_time_pmf):
+    """
+    Historical demand totals of every window of every lead time length.
+
+    All window totals come from one cumulative sum: the total of the L days
+    ending at day t is c[t] - c[t - L]. Windows are weighted by the
+    probability of their length over the number of windows of that length,
+    so every lead time weighs as observed.
+
+    Args:
+        demand (array-like): Daily demand, shape (days,) or (days, products)
+        lead_time_pmf (array-like): Lead time PMF indexed by days, shape
+            (lead_days,) or (products, lead_days)
+
+    Returns:
+        tuple: Window totals and their weights, shape (windows,) or
+            (windows, products)
+    """
+    demand = np.asarray(demand, dtype=float)
+    lead_time_pmf = np.asarray(lead_time_pmf, dtype=float)
+    days = len(demand)
+    totals = np.concatenate([np.zeros((1,) + demand.shape[1:]), np.cumsum(demand, axis=0)])
+
+    # Window lengths with a probability, as long as the history at most
+    lengths = np.flatnonzero(lead_time_pmf.reshape(-1, lead_time_pmf.shape[-1]).sum(axis=0))
+    lengths = lengths[lengths <= days]
+    counts = days - lengths + 1
+
+    # Window ends of all lengths at once, without a loop over windows
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    window_lengths = np.repeat(lengths, counts)
+    ends = window_lengths + np.arange(counts.sum()) - offsets
+    windows = totals[ends] - totals[ends - window_lengths]
+
+    weights = lead_time_pmf[..., lengths] / counts
+    weights = np.repeat(weights, counts, axis=-1)
+    return windows, weights.T
+
+
+def weighted_ss_rop(samples, weights, service_level):
+    """
+    Reorder point and safety stock of a cycle service level read from weighted
+    lead time demand samples: ROP is the weighted service level quantile and
+    SS = ROP - weighted average lead time demand.
+
+    Args:
+        samples (numpy.ndarray): Lead time demand samples, shape (samples,) or
+            (samples, products)
+        weights (numpy.ndarray): Weights of the samples, same shape as samples
+        service_level (float): Targeted cycle service rate
+
+    Returns:
+        tuple: Safety stock, reorder point and average lead time demand, NaN
+            for products without weights
+    """
+    order = np.argsort(samples, axis=0)
+    samples = np.take_along_axis(samples, order, axis=0)
+    cumulative = np.cumsum(np.take_along_axis(weights, order, axis=0), axis=0)
+    total = cumulative[-1]
+
+    quantile = (cumulative < service_level * total).sum(axis=0)
+    quantile = np.minimum(quantile, len(samples) - 1)
+    rop = np.take_along_axis(samples, np.expand_dims(quantile, 0), axis=0)[0]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = (samples * np.take_along_axis(weights, order, axis=0)).sum(axis=0) / total
+    rop = np.where(total > 0, rop, np.nan)
+    return (rop - mean)[()], rop[()], np.asarray(mean)[()]
+
+
+def portfolio_rolling_safety_stock(
+    daily_demand, lead_time_data, service_level, chunk_size=256
+):
+    """
+    Safety stock and reorder point of every product from its historical
+    demand totals over windows of its observed lead times.
+
+    Args:
+        daily_demand (pd.DataFrame): Daily demand matrix (Date x Product_Code)
+        lead_time_data (pd.DataFrame): Lead time data with 'Product_Code' and
+            'Lead_Time_Days' columns
+        service_level (float): Targeted cycle service rate
+        chunk_size (int): Number of products computed at once, to bound memory
+
+    Returns:
+        pd.DataFrame: 'Rolling Windows SS' and 'Rolling Windows ROP' per
+            Product_Code, NaN for products without lead times
+    """
+    products = daily_demand.columns
+    demand = daily_demand.to_numpy(dtype=float)
+    lead_times = np.nan_to_num(portfolio_lead_time_pmf(lead_time_data, products))
+
+    ss = np.full(len(products), np.nan)
+    rop = np.full(len(products), np.nan)
+    for start in range(0, len(products), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        windows, weights = rolling_lead_time_demand(demand[:, chunk], lead_times[chunk])
+        if len(windows):
+            ss[chunk], rop[chunk], _ = weighted_ss_rop(windows, weights, service_level)
+
+    return pd.DataFrame(
+        {"Rolling Windows SS": ss, "Rolling Windows ROP": rop}, index=products
+    ).round()
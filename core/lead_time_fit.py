@@ -0,0 +1,195 @@
+"""Lead time distribution fitting"""
+
+import numpy as np
+import pandas as pd
+from scipy import special, stats
+
+# Quantiles stored for the empirical lead time distribution
+EMPIRICAL_QUANTILES = [0.5, 0.9, 0.95, 0.99]
+
+# Smallest log-dispersion used for the gamma fit (constant lead times have none)
+MIN_LOG_DISPERSION = 1e-8
+
+
+def group_lead_times(df):
+    """
+    Sorts positive lead times into contiguous per-product arrays.
+
+    Args:
+        df (pandas.DataFrame): Lead time data with 'Product_Code' and 'Lead_Time_Days' columns
+
+    Returns:
+        tuple: (products, codes, values) where products is the sorted index of
+        product codes, codes the product position of every observation and
+        values the lead times in days, sorted by product then value
+    """
+    df = df.loc[df["Lead_Time_Days"] > 0, ["Product_Code", "Lead_Time_Days"]]
+    codes, products = pd.factorize(df["Product_Code"], sort=True)
+    values = df["Lead_Time_Days"].to_numpy(dtype=float)
+
+    order = np.lexsort((values, codes))
+    return pd.Index(products, name="Product_Code"), codes[order], values[order]
+
+
+def fit_gamma(codes, values, n_products, iterations=5):
+    """
+    Fits a gamma distribution to every product by maximum likelihood.
+
+    Starts from Minka's closed-form approximation of the shape and refines it
+    with Newton steps on all products at once.
+
+    Args:
+        codes (numpy.ndarray): Product position of every observation
+        values (numpy.ndarray): Lead time observations
+        n_products (int): Number of products
+        iterations (int): Number of Newton refinements
+
+    Returns:
+        tuple: (shape, scale) arrays with one entry per product
+    """
+    n = np.bincount(codes, minlength=n_products)
+    mean = np.bincount(codes, weights=values, minlength=n_products) / n
+    mean_log = np.bincount(codes, weights=np.log(values), minlength=n_products) / n
+    s = np.maximum(np.log(mean) - mean_log, MIN_LOG_DISPERSION)
+
+    shape = (3 - s + np.sqrt((s - 3) ** 2 + 24 * s)) / (12 * s)
+    for _ in range(iterations):
+        step = (np.log(shape) - special.digamma(shape) - s) / (
+            1 / shape - special.polygamma(1, shape)
+        )
+        shape = np.maximum(shape - step, MIN_LOG_DISPERSION)
+
+    return shape, mean / shape
+
+
+def fit_lognormal(codes, values, n_products):
+    """
+    Fits a lognormal distribution to every product by maximum likelihood.
+
+    Args:
+        codes (numpy.ndarray): Product position of every observation
+        values (numpy.ndarray): Lead time observations
+        n_products (int): Number of products
+
+    Returns:
+        tuple: (mu, sigma) arrays of the underlying normal distribution
+    """
+    n = np.bincount(codes, minlength=n_products)
+    log_values = np.log(values)
+    mu = np.bincount(codes, weights=log_values, minlength=n_products) / n
+    var = np.bincount(codes, weights=(log_values - mu[codes]) ** 2, minlength=n_products) / n
+    return mu, np.sqrt(var)
+
+
+def ks_statistic(codes, cdf_values, n_products):
+    """
+    Computes the Kolmogorov-Smirnov statistic of every product at once.
+
+    Args:
+        codes (numpy.ndarray): Product position of every observation, sorted by product then value
+        cdf_values (numpy.ndarray): Fitted CDF evaluated at every observation
+        n_products (int): Number of products
+
+    Returns:
+        numpy.ndarray: KS statistic per product
+    """
+    if len(codes) == 0:
+        return np.array([])
+
+    n = np.bincount(codes, minlength=n_products)
+    starts = np.concatenate(([0], np.cumsum(n)[:-1]))
+    rank = np.arange(len(codes)) - starts[codes]
+
+    distance = np.maximum((rank + 1) / n[codes] - cdf_values, cdf_values - rank / n[codes])
+    return np.maximum.reduceat(distance, starts)
+
+
+def fit_lead_time_distributions(df):
+    """
+    Fits gamma, lognormal and empirical lead time distributions for every product.
+
+    All products are fitted together on grouped arrays.
+
+    Args:
+        df (pandas.DataFrame): Lead time data with 'Product_Code' and 'Lead_Time_Days' columns
+
+    Returns:
+        pandas.DataFrame: One row per Product_Code with the sample moments, the
+        fitted parameters, the KS statistic of each fit, the empirical
+        quantiles and the name of the best fitting parametric distribution
+    """
+    products, codes, values = group_lead_times(df)
+    n_products = len(products)
+
+    gamma_shape, gamma_scale = fit_gamma(codes, values, n_products)
+    lognorm_mu, lognorm_sigma = fit_lognormal(codes, values, n_products)
+
+    gamma_cdf = stats.gamma.cdf(values, gamma_shape[codes], scale=gamma_scale[codes])
+    lognorm_cdf = stats.norm.cdf(
+        (np.log(values) - lognorm_mu[codes])
+        / np.maximum(lognorm_sigma[codes], MIN_LOG_DISPERSION)
+    )
+
+    fits = pd.DataFrame(
+        {
+            "n": np.bincount(codes, minlength=n_products),
+            "gamma_shape": gamma_shape,
+            "gamma_scale": gamma_scale,
+            "gamma_ks": ks_statistic(codes, gamma_cdf, n_products),
+            "lognorm_mu": lognorm_mu,
+            "lognorm_sigma": lognorm_sigma,
+            "lognorm_ks": ks_statistic(codes, lognorm_cdf, n_products),
+        },
+        index=products,
+    )
+
+    grouped = pd.Series(values, index=products[codes]).groupby(level=0)
+    fits.insert(1, "mean", grouped.mean())
+    fits.insert(2, "sd", grouped.std())
+    quantiles = grouped.quantile(EMPIRICAL_QUANTILES).unstack()
+    for q in EMPIRICAL_QUANTILES:
+        fits[f"empirical_p{round(q * 100)}"] = quantiles[q]
+
+    fits["best_fit"] = np.where(fits["gamma_ks"] <= fits["lognorm_ks"], "gamma", "lognormal")
+    return fits
+
+
+def lead_time_moments(fit, distribution):
+    """
+    Returns the mean and standard deviation implied by a fitted distribution.
+
+    Args:
+        fit (pandas.Series or pandas.DataFrame): Row(s) of fit_lead_time_distributions
+        distribution (str): 'gamma', 'lognormal' or 'empirical'
+
+    Returns:
+        tuple: (mean, sd) in days
+    """
+    if distribution == "gamma":
+        mean = fit["gamma_shape"] * fit["gamma_scale"]
+        sd = np.sqrt(fit["gamma_shape"]) * fit["gamma_scale"]
+    elif distribution == "lognormal":
+        mean = np.exp(fit["lognorm_mu"] + fit["lognorm_sigma"] ** 2 / 2)
+        sd = mean * np.sqrt(np.expm1(fit["lognorm_sigma"] ** 2))
+    else:
+        mean, sd = fit["mean"], fit["sd"]
+    return mean, sd
+
+
+def lead_time_quantile(fit, q, distribution):
+    """
+    Returns the q-quantile of the lead time under a fitted distribution.
+
+    Args:
+        fit (pandas.Series or pandas.DataFrame): Row(s) of fit_lead_time_distributions
+        q (float): Probability level, one of EMPIRICAL_QUANTILES for 'empirical'
+        distribution (str): 'gamma', 'lognormal' or 'empirical'
+
+    Returns:
+        float or numpy.ndarray: Lead time quantile in days
+    """
+    if distribution == "gamma":
+        return stats.gamma.ppf(q, fit["gamma_shape"], scale=fit["gamma_scale"])
+    elif distribution == "lognormal":
+        return np.exp(fit["lognorm_mu"] + fit["lognorm_sigma"] * stats.norm.ppf(q))
+    return fit[f"empirical_p{round(q * 100)}"]
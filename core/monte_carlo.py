@@ -0,0 +1,156 @@
+"""Monte Carlo lead time demand engine"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+
+# Number of samples drawn per product
+N_SAMPLES = 100_000
+
+
+def sample_lead_time_demand(demand, lead_times, n_samples, rng):
+    """
+    Samples the demand during lead time by bootstrapping the history.
+
+    Every sample draws a lead time from the observed lead times and as many
+    daily demands from the daily demand series. All draws are made in one
+    batch and summed per sample with a cumulative sum.
+
+    Args:
+        demand (array-like): Daily demand
+        lead_times (array-like): Observed lead times in days
+        n_samples (int): Number of samples
+        rng (numpy.random.Generator): Random number generator
+
+    Returns:
+        numpy.ndarray: Lead time demand samples
+    """
+    demand = np.asarray(demand, dtype=float)
+    lead_times = np.rint(np.asarray(lead_times, dtype=float)).clip(min=0).astype(np.int64)
+
+    sizes = rng.choice(lead_times, size=n_samples)
+    days = rng.integers(0, len(demand), size=sizes.sum())
+    totals = np.concatenate([[0.0], np.cumsum(demand[days])])
+    ends = np.cumsum(sizes)
+    return totals[ends] - totals[ends - sizes]
+
+
+def samples_ss_rop(samples, service_level):
+    """
+    Reorder point and safety stock of a cycle service level read from lead
+    time demand samples: ROP is the service level quantile and
+    SS = ROP - average lead time demand.
+
+    Args:
+        samples (numpy.ndarray): Lead time demand samples
+        service_level (float): Targeted cycle service rate
+
+    Returns:
+        tuple: Safety stock, reorder point and average lead time demand
+    """
+    rop = np.quantile(samples, service_level)
+    mean = samples.mean()
+    return rop - mean, rop, mean
+
+
+def mc_ss_rop(demand, lead_times, service_level, n_samples=N_SAMPLES, seed=0):
+    """
+    Monte Carlo safety stock and reorder point of a product.
+
+    Args:
+        demand (array-like): Daily demand
+        lead_times (array-like): Observed lead times in days
+        service_level (float): Targeted cycle service rate
+        n_samples (int): Number of samples
+        seed (int or numpy.random.SeedSequence): Seed of the random stream
+
+    Returns:
+        tuple: Safety stock, reorder point and average lead time demand
+    """
+    rng = np.random.default_rng(seed)
+    samples = sample_lead_time_demand(demand, lead_times, n_samples, rng)
+    return samples_ss_rop(samples, service_level)
+
+
+def _mc_chunk(demands, lead_times, service_level, n_samples, seeds):
+    """
+    Monte Carlo SS and ROP of a chunk of products, run by a worker process.
+
+    Returns:
+        numpy.ndarray: Shape (products, 2) with SS and ROP, NaN without lead times
+    """
+    result = np.full((len(demands), 2), np.nan)
+    for i, (demand, product_lead_times, seed) in enumerate(
+        zip(demands, lead_times, seeds)
+    ):
+        if len(product_lead_times) == 0:
+            continue
+        ss, rop, _ = mc_ss_rop(demand, product_lead_times, service_level, n_samples, seed)
+        result[i] = ss, rop
+    return result
+
+
+def portfolio_mc_safety_stock(
+    daily_demand,
+    lead_time_data,
+    service_level,
+    n_samples=N_SAMPLES,
+    seed=0,
+    n_workers=None,
+    chunk_size=64,
+):
+    """
+    Monte Carlo safety stock and reorder point of every product.
+
+    Each product draws from its own stream spawned from one SeedSequence, so
+    the results do not depend on the number of workers or the chunking.
+    Chunks of products are split across a process pool.
+
+    Args:
+        daily_demand (pd.DataFrame): Daily demand matrix (Date x Product_Code)
+        lead_time_data (pd.DataFrame): Lead time data with 'Product_Code' and
+            'Lead_Time_Days' columns
+        service_level (float): Targeted cycle service rate
+        n_samples (int): Number of samples per product
+        seed (int): Seed of the SeedSequence
+        n_workers (int): Number of worker processes, all CPUs when None and
+            no pool when 1
+        chunk_size (int): Number of products per task
+
+    Returns:
+        pd.DataFrame: 'Monte Carlo SS' and 'Monte Carlo ROP' per Product_Code,
+            NaN for products without lead times
+    """
+    products = daily_demand.columns
+    demand = daily_demand.to_numpy(dtype=float).T
+    lead_times = (
+        lead_time_data.dropna(subset=["Lead_Time_Days"])
+        .groupby("Product_Code")["Lead_Time_Days"]
+        .apply(np.asarray)
+        .reindex(products)
+    )
+    lead_times = [np.array([]) if np.ndim(x) == 0 else x for x in lead_times]
+    seeds = np.random.SeedSequence(seed).spawn(len(products))
+
+    chunks = [
+        (
+            demand[i : i + chunk_size],
+            lead_times[i : i + chunk_size],
+            service_level,
+            n_samples,
+            seeds[i : i + chunk_size],
+        )
+        for i in range(0, len(products), chunk_size)
+    ]
+    n_workers = n_workers or os.cpu_count()
+    if n_workers == 1 or len(chunks) <= 1:
+        results = [_mc_chunk(*chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(_mc_chunk, *zip(*chunks)))
+
+    result = np.concatenate(results) if results else np.empty((0, 2))
+    return pd.DataFrame(
+        result, index=products, columns=["Monte Carlo SS", "Monte Carlo ROP"]
+    ).round()
@@ -0,0 +1,319 @@
+"""Multi-echelon warehouse network simulation engine"""
+
+import numpy as np
+import pandas as pd
+from numba import njit
+from core.safety_stock import eoq, safety_factor, ss_uncertain_demand, reorder_point
+from core.simulation import policy_arrays
+
+ECHELONS = ["Warehouses", "DC"]
+
+
+@njit(cache=True)
+def network_kernel(
+    demand, node_product, product_start, ss, rop, q, L, dc_ss, dc_rop, dc_q, dc_L
+):
+    """
+    Compiled simulation of a two-echelon network: a central DC replenished by
+    a supplier and warehouses replenished by the DC, every product following
+    its own continuous review (ROP, Q) policy at every stocking point.
+
+    The state of all warehouse x product nodes and of all products at the DC
+    is held in arrays, and shipments in transit in ring buffers of arrivals
+    by day. Every day:
+        1. Supplier orders arrive at the DC, which ships its backorders to
+           the warehouses, in warehouse order
+        2. DC shipments arrive at the warehouses, which serve their demand;
+           unmet demand is lost
+        3. Warehouses whose inventory position (on hand + on order) is at or
+           below the ROP order Q from the DC, shipped from DC stock and
+           backordered at the DC for the rest
+        4. The DC orders Q from the supplier while its inventory position
+           (on hand + on order - backorders) is at or below its ROP
+    Warehouses start with Q + SS units on hand and the DC with its Q + SS.
+
+    Args:
+        demand (numpy.ndarray): Daily demand, float64 of shape (days, nodes)
+        node_product (numpy.ndarray): Product of each node, int64
+        product_start (numpy.ndarray): First node of each product, nodes being
+            sorted by product, and the number of nodes last, int64
+        ss, rop, q (numpy.ndarray): Warehouse policy of each node, float64
+        L (numpy.ndarray): DC to warehouse lead time of each node in days,
+            at least 1, int64
+        dc_ss, dc_rop, dc_q (numpy.ndarray): DC policy of each product, float64
+        dc_L (numpy.ndarray): Supplier lead time of each product in days, at
+            least 1, int64
+
+    Returns:
+        tuple: Per node, the sum of the inventory levels at the start of the
+            days, the units of demand lost, the days with lost demand and the
+            orders placed; per product at the DC, the sum of the inventory
+            levels, the units ordered by the warehouses, the units shipped
+            from stock, the orders placed and the sum of the backorders
+    """
+    n_days, n_nodes = demand.shape
+    n_products = len(dc_q)
+    horizon = 2
+    if n_nodes > 0:
+        horizon = max(horizon, L.max() + 1)
+    if n_products > 0:
+        horizon = max(horizon, dc_L.max() + 1)
+
+    arrivals = np.zeros((horizon, n_nodes))
+    on_hand = q + ss
+    on_order = np.zeros(n_nodes)
+    owed = np.zeros(n_nodes)
+    dc_arrivals = np.zeros((horizon, n_products))
+    dc_on_hand = dc_q + dc_ss
+    dc_on_order = np.zeros(n_products)
+    dc_owed = np.zeros(n_products)
+
+    inventory_sum = np.zeros(n_nodes)
+    lost = np.zeros(n_nodes)
+    stockout_days = np.zeros(n_nodes, dtype=np.int64)
+    orders = np.zeros(n_nodes, dtype=np.int64)
+    dc_inventory_sum = np.zeros(n_products)
+    dc_ordered = np.zeros(n_products)
+    dc_shipped = np.zeros(n_products)
+    dc_orders = np.zeros(n_products, dtype=np.int64)
+    dc_backorder_sum = np.zeros(n_products)
+
+    for day in range(n_days):
+        slot = day % horizon
+
+        # DC receipts, then backorders shipped to the warehouses
+        for p in range(n_products):
+            dc_on_hand[p] += dc_arrivals[slot, p]
+            dc_on_order[p] -= dc_arrivals[slot, p]
+            dc_arrivals[slot, p] = 0.0
+            dc_inventory_sum[p] += dc_on_hand[p]
+            if dc_owed[p] > 0:
+                for n in range(product_start[p], product_start[p + 1]):
+                    ship = min(owed[n], dc_on_hand[p])
+                    if ship > 0:
+                        owed[n] -= ship
+                        dc_owed[p] -= ship
+                        dc_on_hand[p] -= ship
+                        arrivals[(day + L[n]) % horizon, n] += ship
+
+        # Warehouse receipts, demand and orders to the DC
+        for n in range(n_nodes):
+            on_hand[n] += arrivals[slot, n]
+            on_order[n] -= arrivals[slot, n]
+            arrivals[slot, n] = 0.0
+
+            inventory_sum[n] += on_hand[n]
+            d = demand[day, n]
+            if d > on_hand[n]:
+                lost[n] += d - on_hand[n]
+                stockout_days[n] += 1
+                on_hand[n] = 0.0
+            else:
+                on_hand[n] -= d
+
+            p = node_product[n]
+            while q[n] > 0 and on_hand[n] + on_order[n] <= rop[n]:
+                on_order[n] += q[n]
+                orders[n] += 1
+                dc_ordered[p] += q[n]
+                ship = min(q[n], dc_on_hand[p])
+                dc_on_hand[p] -= ship
+                dc_shipped[p] += ship
+                if ship > 0:
+                    arrivals[(day + L[n]) % horizon, n] += ship
+                owed[n] += q[n] - ship
+                dc_owed[p] += q[n] - ship
+
+        # DC orders to the supplier
+        for p in range(n_products):
+            while dc_q[p] > 0 and dc_on_hand[p] + dc_on_order[p] - dc_owed[p] <= dc_rop[p]:
+                dc_on_order[p] += dc_q[p]
+                dc_orders[p] += 1
+                dc_arrivals[(day + dc_L[p]) % horizon, p] += dc_q[p]
+            dc_backorder_sum[p] += dc_owed[p]
+
+    return (
+        inventory_sum,
+        lost,
+        stockout_days,
+        orders,
+        dc_inventory_sum,
+        dc_ordered,
+        dc_shipped,
+        dc_orders,
+        dc_backorder_sum,
+    )
+
+
+def simulate_network(daily_demand, ss, rop, q, L, dc_ss, dc_rop, dc_q, dc_L):
+    """
+    Simulates the warehouses of a network replenished by a central DC, see
+    network_kernel. Lead times shorter than a day are rounded up to a day.
+    Nodes with a missing parameter, or whose product has a missing DC
+    parameter, are not simulated.
+
+    Args:
+        daily_demand (pd.DataFrame): Daily demand matrix with one column per
+            (Warehouse, Product_Code), see core.cleaning.warehouse_demand_matrix
+        ss, rop, q (float or array-like): Warehouse policy of each column
+        L (int or array-like): DC to warehouse lead time in days of each column
+        dc_ss, dc_rop, dc_q (float or pd.Series): DC policy of each product,
+            Series indexed by Product_Code
+        dc_L (int or pd.Series): Supplier lead time in days of each product
+
+    Returns:
+        tuple: Results per (Warehouse, Product_Code) with 'Fill_Rate',
+            'Avg_Inventory', 'Lost_Sales', 'Stockout_Days' and 'Orders',
+            results per Product_Code at the DC with 'Fill_Rate' (share of
+            the warehouse orders shipped from stock), 'Avg_Inventory',
+            'Avg_Backorders' and 'Orders', and the fill rate, average
+            inventory and orders of every echelon
+    """
+    columns = daily_demand.columns
+    node_products = columns.get_level_values("Product_Code")
+    products = pd.Index(node_products.unique()).sort_values()
+
+    node_params = np.stack(
+        np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in (ss, rop, q, L)])
+    )
+    node_params = np.broadcast_to(node_params.reshape(4, -1), (4, len(columns)))
+    dc_params = np.stack(
+        [
+            (
+                x.reindex(products).to_numpy(dtype=float)
+                if isinstance(x, pd.Series)
+                else np.broadcast_to(np.asarray(x, dtype=float), products.shape)
+            )
+            for x in (dc_ss, dc_rop, dc_q, dc_L)
+        ]
+    )
+    dc_valid = np.isfinite(dc_params).all(axis=0)
+
+    # Nodes sorted by product, so that the nodes of a product are contiguous
+    product_of_node = products.get_indexer(node_products)
+    valid = np.isfinite(node_params).all(axis=0) & dc_valid[product_of_node]
+    valid_products = np.flatnonzero(dc_valid)
+    product_number = np.full(len(products), -1)
+    product_number[valid_products] = np.arange(len(valid_products))
+    nodes = np.flatnonzero(valid)
+    nodes = nodes[np.argsort(product_of_node[nodes], kind="stable")]
+    node_product = product_number[product_of_node[nodes]].astype(np.int64)
+    product_start = np.searchsorted(
+        node_product, np.arange(len(valid_products) + 1)
+    ).astype(np.int64)
+
+    ss_, rop_, q_, L_ = policy_arrays(*node_params[:, nodes], nodes.shape)
+    dc_ss_, dc_rop_, dc_q_, dc_L_ = policy_arrays(
+        *dc_params[:, valid_products], valid_products.shape
+    )
+    demand = np.ascontiguousarray(daily_demand.to_numpy(dtype=np.float64)[:, nodes])
+    sums = network_kernel(
+        demand,
+        node_product,
+        product_start,
+        ss_,
+        rop_,
+        q_,
+        np.maximum(L_, 1),
+        dc_ss_,
+        dc_rop_,
+        dc_q_,
+        np.maximum(dc_L_, 1),
+    )
+    inventory_sum, lost, stockout_days, orders = sums[:4]
+    dc_inventory_sum, dc_ordered, dc_shipped, dc_orders, dc_backorder_sum = sums[4:]
+    n_days = max(len(demand), 1)
+
+    total_demand = np.clip(demand, 0, None).sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fill = np.where(total_demand > 0, 1 - lost / total_demand, np.nan)
+        dc_fill = np.where(dc_ordered > 0, dc_shipped / dc_ordered, np.nan)
+    warehouses = pd.DataFrame(
+        {
+            "Fill_Rate": fill,
+            "Avg_Inventory": inventory_sum / n_days,
+            "Lost_Sales": lost,
+            "Stockout_Days": stockout_days,
+            "Orders": orders,
+        },
+        index=columns[nodes],
+    ).reindex(columns)
+    dc = pd.DataFrame(
+        {
+            "Fill_Rate": dc_fill,
+            "Avg_Inventory": dc_inventory_sum / n_days,
+            "Avg_Backorders": dc_backorder_sum / n_days,
+            "Orders": dc_orders,
+        },
+        index=products[valid_products],
+    ).reindex(products)
+
+    echelons = pd.DataFrame(
+        {
+            "Fill_Rate": [
+                1 - lost.sum() / total_demand.sum() if total_demand.sum() > 0 else np.nan,
+                dc_shipped.sum() / dc_ordered.sum() if dc_ordered.sum() > 0 else np.nan,
+            ],
+            "Avg_Inventory": [inventory_sum.sum() / n_days, dc_inventory_sum.sum() / n_days],
+            "Orders": [orders.sum(), dc_orders.sum()],
+        },
+        index=pd.Index(ECHELONS, name="Echelon"),
+    )
+    return warehouses, dc, echelons
+
+
+def network_policies(
+    daily_demand,
+    lead_time,
+    dc_lead_time,
+    cycle_service_rate,
+    order_cost,
+    holding_cost,
+):
+    """
+    (ROP, Q) policies of every warehouse x product and of every product at the
+    DC from daily demand, with demand uncertainty: SS = Z × σd × √L,
+    ROP = SS + D × L and Q from the EOQ. The DC sees the demand of all the
+    warehouses of a product and orders at least the largest warehouse Q.
+
+    Args:
+        daily_demand (pd.DataFrame): Daily demand matrix with one column per
+            (Warehouse, Product_Code)
+        lead_time (float or array-like): DC to warehouse lead time in days
+        dc_lead_time (pd.Series): Supplier lead time in days of each Product_Code
+        cycle_service_rate (float): Targeted cycle service rate
+        order_cost (float): Fixed cost per order (K)
+        holding_cost (float): Holding cost per unit per year (H)
+
+    Returns:
+        tuple: 'SS', 'ROP', 'Q' and 'L' of every (Warehouse, Product_Code)
+            and of every Product_Code at the DC, Q is NaN without demand
+    """
+    Z = safety_factor(cycle_service_rate)
+    products = daily_demand.columns.get_level_values("Product_Code")
+
+    D = daily_demand.mean().to_numpy()
+    L = np.broadcast_to(np.asarray(lead_time, dtype=float), D.shape)
+    ss = ss_uncertain_demand(Z, daily_demand.std().fillna(0).to_numpy(), L)
+    q = np.ceil(eoq(np.clip(D, 0, None) * 365, order_cost, holding_cost))
+    warehouses = pd.DataFrame(
+        {
+            "SS": ss,
+            "ROP": reorder_point(ss, L, D),
+            "Q": np.where(q > 0, q, np.nan),
+            "L": L,
+        },
+        index=daily_demand.columns,
+    )
+
+    dc_demand = daily_demand.T.groupby(products).sum().T
+    D = dc_demand.mean()
+    L = dc_lead_time.reindex(D.index).round()
+    ss = ss_uncertain_demand(Z, dc_demand.std().fillna(0), L)
+    q = np.ceil(eoq(D.clip(lower=0) * 365, order_cost, holding_cost))
+    q = np.maximum(q, warehouses["Q"].groupby(products).max().reindex(D.index))
+    dc = pd.DataFrame(
+        {"SS": ss, "ROP": reorder_point(ss, L, D), "Q": q.where(q > 0), "L": L}
+    )
+    dc.index.name = "Product_Code"
+    return warehouses, dc
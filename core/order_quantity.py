@@ -0,0 +1,159 @@
+"""Order quantity engine with lot sizes, minimum order quantities and quantity discounts"""
+
+import numpy as np
+import pandas as pd
+from core.safety_stock import eoq
+
+DISCOUNT_TYPES = ["None", "All-units", "Incremental"]
+
+
+def price_schedule(unit_prices, price_breaks):
+    """
+    Validates a quantity discount schedule and broadcasts it to 2-D arrays.
+
+    Args:
+        unit_prices (array-like): Unit price of each tier, shape (tiers,) for all
+            products or (products, tiers)
+        price_breaks (array-like): Minimum quantity of each tier, same shape as
+            unit_prices, starting at 0 and increasing
+
+    Returns:
+        tuple: Unit prices and price breaks as float arrays of shape (products or 1, tiers)
+
+    Raises:
+        ValueError: If the breaks do not start at 0 or are not increasing
+    """
+    prices = np.atleast_2d(np.asarray(unit_prices, dtype=float))
+    breaks = np.atleast_2d(np.asarray(price_breaks, dtype=float))
+    if prices.shape != breaks.shape:
+        raise ValueError("unit_prices and price_breaks must have the same shape")
+    if (breaks[:, 0] != 0).any() or (np.diff(breaks, axis=1) <= 0).any():
+        raise ValueError("price_breaks must start at 0 and be increasing")
+    return prices, breaks
+
+
+def purchase_cost(Q, prices, breaks, discount_type):
+    """
+    Cost of buying Q units with a quantity discount schedule.
+
+    All-units discounts price every unit at the price of the tier Q falls in.
+    Incremental discounts price the units within each tier at the tier price.
+
+    Args:
+        Q (numpy.ndarray): Order quantities, shape (products, candidates)
+        prices (numpy.ndarray): Unit prices, shape (products or 1, tiers)
+        breaks (numpy.ndarray): Price breaks, shape (products or 1, tiers)
+        discount_type (str): 'None', 'All-units' or 'Incremental'
+
+    Returns:
+        tuple: Purchase cost of Q units and unit price of the tier of Q,
+            both shaped like Q
+    """
+    # Tier of every candidate, the last break that is <= Q
+    in_tier = Q[..., None] >= breaks[:, None, :]
+    tier = in_tier.sum(axis=-1) - 1
+    tier_prices = np.take_along_axis(
+        np.broadcast_to(prices[:, None, :], in_tier.shape), tier[..., None], axis=-1
+    )[..., 0]
+
+    if discount_type != "Incremental":
+        return tier_prices * Q, tier_prices
+
+    # Units bought within each tier below Q
+    upper = np.append(breaks[:, 1:], np.full((len(breaks), 1), np.inf), axis=1)
+    units = np.clip(Q[..., None], breaks[:, None, :], upper[:, None, :]) - breaks[:, None, :]
+    return (units * prices[:, None, :]).sum(axis=-1), tier_prices
+
+
+def batch_eoq(
+    demand_per_year,
+    order_cost,
+    holding_cost,
+    holding_rate=0.0,
+    unit_prices=0.0,
+    price_breaks=0.0,
+    discount_type="None",
+    moq=0,
+    lot_size=1,
+    index=None,
+):
+    """
+    Order quantity minimizing the total annual cost of every product.
+
+    The annual holding cost of a unit priced c is H + i × c. For every price
+    tier, the tier's optimal quantity (Wilson formula with the tier cost) is
+    clipped to the tier and raised to the minimum order quantity, then both
+    lot multiples around it are candidates. Total annual costs of all
+    candidates (products x tiers x 2) are evaluated in one array pass:
+        TC(Q) = D / Q × (K + C(Q)) + (H × Q + i × C(Q)) / 2
+    where C(Q) is the purchase cost of Q units.
+
+    Args:
+        demand_per_year (array-like): Annual demand of each product (D)
+        order_cost (float or array-like): Fixed cost per order (K)
+        holding_cost (float or array-like): Holding cost per unit per year (H)
+        holding_rate (float or array-like): Holding cost per year as a fraction
+            of the unit price (i)
+        unit_prices (array-like): Unit price of each tier, see price_schedule
+        price_breaks (array-like): Minimum quantity of each tier, see price_schedule
+        discount_type (str): 'None', 'All-units' or 'Incremental'
+        moq (float or array-like): Minimum order quantity
+        lot_size (float or array-like): Orders are integer multiples of the lot size
+        index (array-like): Product of each row
+
+    Returns:
+        pd.DataFrame: One row per product with 'EOQ' (Wilson formula without
+            constraints), 'Order_Quantity', 'Unit_Price', 'Orders_per_Year',
+            'Ordering_Cost', 'Holding_Cost', 'Purchase_Cost' and 'Total_Cost'
+    """
+    D = np.atleast_1d(np.asarray(demand_per_year, dtype=float))[:, None]
+    K = np.broadcast_to(np.asarray(order_cost, dtype=float), D.shape[:1])[:, None]
+    H = np.broadcast_to(np.asarray(holding_cost, dtype=float), D.shape[:1])[:, None]
+    i = np.broadcast_to(np.asarray(holding_rate, dtype=float), D.shape[:1])[:, None]
+    moq = np.broadcast_to(np.asarray(moq, dtype=float), D.shape[:1])[:, None]
+    lot = np.broadcast_to(np.asarray(lot_size, dtype=float), D.shape[:1])[:, None]
+
+    if discount_type == "None":
+        # Base price of every product
+        unit_prices = np.atleast_2d(np.asarray(unit_prices, dtype=float))[:, :1]
+        price_breaks = np.zeros_like(unit_prices)
+    prices, breaks = price_schedule(unit_prices, price_breaks)
+
+    # Tier-wise optimum, with the fixed part of the incremental purchase cost
+    # C(Q) = F + c × Q added to the order cost
+    fixed = np.zeros_like(prices)
+    if discount_type == "Incremental":
+        tier_costs = np.diff(breaks, axis=1) * prices[:, :-1]
+        fixed[:, 1:] = np.cumsum(tier_costs, axis=1) - prices[:, 1:] * breaks[:, 1:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Q = eoq(D, K + fixed, H + i * prices)
+    upper = np.append(breaks[:, 1:], np.full((len(breaks), 1), np.inf), axis=1)
+    Q = np.clip(np.nan_to_num(Q, posinf=0.0), breaks, upper)
+
+    # Minimum order quantity and lot multiples
+    min_lots = np.maximum(np.ceil(moq / lot), 1)
+    lots = np.maximum(Q / lot, min_lots)
+    candidates = np.concatenate([np.floor(lots), np.ceil(lots)], axis=1)
+    candidates = np.maximum(candidates, min_lots) * lot
+
+    cost, _ = purchase_cost(candidates, prices, breaks, discount_type)
+    total_cost = D / candidates * (K + cost) + (H * candidates + i * cost) / 2
+    best = np.argmin(total_cost, axis=1)[:, None]
+
+    Q = np.take_along_axis(candidates, best, axis=1)
+    cost = np.take_along_axis(cost, best, axis=1)
+    orders = D / Q
+    result = {
+        "EOQ": eoq(D, K, H + i * prices[:, :1]),
+        "Order_Quantity": Q,
+        "Unit_Price": cost / Q,
+        "Orders_per_Year": orders,
+        "Ordering_Cost": orders * K,
+        "Holding_Cost": (H * Q + i * cost) / 2,
+        "Purchase_Cost": orders * cost,
+        "Total_Cost": np.take_along_axis(total_cost, best, axis=1),
+    }
+    return pd.DataFrame(
+        {name: np.round(values[:, 0], 2) for name, values in result.items()},
+        index=index,
+    )
@@ -0,0 +1,277 @@
+"""Simulation-based reorder point and order quantity optimization engine"""
+
+import numpy as np
+import pandas as pd
+from numba import njit
+from core.safety_stock import eoq
+from core.simulation import policy_arrays
+
+# Golden ratio conjugate of the golden-section search
+INVERSE_PHI = (np.sqrt(5) - 1) / 2
+
+
+@njit(cache=True)
+def target_kernel(demand, series, ss, rop, q, L, max_lost):
+    """
+    Compiled (ROP, Q) recurrence of many policies at once, with the semantics
+    of core.simulation.advance_policies, that stops simulating a policy as
+    soon as its lost demand exceeds the demand it may lose: the policy
+    clearly misses its fill rate target.
+
+    Args:
+        demand (numpy.ndarray): Daily demand matrix, float64 of shape (days, series)
+        series (numpy.ndarray): Demand column of each policy, int64
+        ss (numpy.ndarray): Safety stock of each policy, float64
+        rop (numpy.ndarray): Reorder point of each policy, float64
+        q (numpy.ndarray): Order quantity of each policy, float64
+        L (numpy.ndarray): Lead time in days of each policy, int64
+        max_lost (numpy.ndarray): Demand each policy may lose, float64
+
+    Returns:
+        tuple: Per policy, whether it met its target, the sum of the
+            inventory levels at the start of the days, the units of demand
+            lost and the number of orders received, complete only for the
+            policies meeting their target
+    """
+    n_days = demand.shape[0]
+    n_policies = len(series)
+    inventory = q + ss
+    day_since_trigger_rop = np.zeros(n_policies, dtype=np.int64)
+    met = np.ones(n_policies, dtype=np.bool_)
+    inventory_sum = np.zeros(n_policies)
+    lost = np.zeros(n_policies)
+    orders = np.zeros(n_policies, dtype=np.int64)
+
+    for day in range(n_days):
+        for i in range(n_policies):
+            if not met[i]:
+                continue
+
+            # Check reorder point and handle lead time
+            if inventory[i] <= rop[i]:
+                if day_since_trigger_rop[i] == L[i]:
+                    inventory[i] += q[i]
+                    orders[i] += 1
+                    day_since_trigger_rop[i] = 0
+                else:
+                    day_since_trigger_rop[i] += 1
+
+            # Update inventory levels based on demand
+            inventory_sum[i] += inventory[i]
+            d = demand[day, series[i]]
+            if d > inventory[i]:
+                lost[i] += d - inventory[i]
+                inventory[i] = 0.0
+                if lost[i] > max_lost[i]:
+                    met[i] = False
+            else:
+                inventory[i] -= d
+
+    return met, inventory_sum, lost, orders
+
+
+def optimize_rop(demand, q, L, target, series=None, tol=1.0, max_doublings=20):
+    """
+    Minimum reorder point of every policy achieving a target fill rate (share
+    of demand served from stock) for a given order quantity, by bisection
+    over simulations of all policies at once.
+
+    The safety stock follows the reorder point, SS = max(ROP - D × L, 0) with
+    D the average daily demand, so the fill rate grows with the ROP. The
+    upper bound starts at the demand over L + 1 days plus Q and is doubled
+    until the target is met. Every bisection step simulates the midpoints of
+    all policies in one kernel call, which stops a policy as soon as it
+    misses the target.
+
+    Args:
+        demand (array-like): Daily demand, shape (days,) or (days, series)
+        q (float or array-like): Order quantity of each policy
+        L (int or array-like): Lead time in days of each policy
+        target (float or array-like): Target fill rate of each policy
+        series (array-like): Demand column of each policy, defaults to one
+            policy per column
+        tol (float): Precision of the reorder points
+        max_doublings (int): Maximum number of doublings of the upper bound
+
+    Returns:
+        pd.DataFrame: One row per policy with 'ROP', 'SS', 'Fill_Rate',
+            'Avg_Inventory', 'Orders' and 'Feasible' (target met by a ROP,
+            otherwise ROP and results are NaN)
+    """
+    demand = np.asarray(demand, dtype=np.float64)
+    if demand.ndim == 1:
+        demand = demand[:, None]
+    demand = np.ascontiguousarray(demand)
+    if series is None:
+        series = np.arange(demand.shape[1])
+    shape = np.broadcast(series, q, L, target).shape
+    series = np.ascontiguousarray(np.broadcast_to(np.asarray(series, dtype=np.int64), shape))
+    _, _, q, L = policy_arrays(0.0, 0.0, q, L, shape)
+    target = np.broadcast_to(np.asarray(target, dtype=float), shape)
+
+    positive = np.clip(demand, 0, None)
+    total_demand = positive.sum(axis=0)[series]
+    avg_demand = positive.mean(axis=0)[series] if len(demand) else np.zeros(shape)
+    max_lost = np.ascontiguousarray((1 - target) * total_demand)
+
+    n_days = len(demand)
+    inventory_sum = np.full(shape, np.nan)
+    lost = np.full(shape, np.nan)
+    orders = np.zeros(shape, dtype=np.int64)
+
+    def evaluate(rop):
+        rop = np.ascontiguousarray(rop)
+        ss = np.maximum(rop - avg_demand * L, 0)
+        met, *sums = target_kernel(demand, series, ss, rop, q, L, max_lost)
+        # Keep the results of the policies meeting the target
+        for result, values in zip((inventory_sum, lost, orders), sums):
+            result[met] = values[met]
+        return met
+
+    # The largest demand over L + 1 days
+    cumulative = np.vstack([np.zeros(demand.shape[1]), np.cumsum(positive, axis=0)])
+    window = np.minimum(L + 1, n_days)
+    max_window = np.array(
+        [
+            (cumulative[w:, s] - cumulative[: n_days + 1 - w, s]).max()
+            for s, w in zip(series, window)
+        ]
+    )
+    low = np.full(shape, -tol)
+    high = np.maximum(max_window + q, tol)
+    feasible = evaluate(high)
+    for _ in range(max_doublings):
+        if feasible.all():
+            break
+        low = np.where(feasible, low, high)
+        high = np.where(feasible, high, 2 * high)
+        feasible = evaluate(high)
+
+    while ((high - low)[feasible] > tol).any():
+        mid = (low + high) / 2
+        met = evaluate(mid)
+        high = np.where(feasible & met, mid, high)
+        low = np.where(feasible & ~met, mid, low)
+
+    rop = np.where(feasible, np.maximum(high, 0), np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fill = np.where(total_demand > 0, 1 - lost / total_demand, np.nan)
+    return pd.DataFrame(
+        {
+            "ROP": rop,
+            "SS": np.maximum(rop - avg_demand * L, 0),
+            "Fill_Rate": np.where(feasible, fill, np.nan),
+            "Avg_Inventory": np.where(feasible, inventory_sum / max(n_days, 1), np.nan),
+            "Orders": np.where(feasible, orders, 0),
+            "Feasible": feasible,
+        }
+    )
+
+
+def optimize_policy(
+    demand,
+    L,
+    target,
+    order_cost,
+    holding_cost,
+    q_bounds=None,
+    n_grid=16,
+    n_iterations=8,
+    tol=1.0,
+):
+    """
+    Cost-optimal order quantity of every demand series and its minimum
+    reorder point achieving a target fill rate, for all series at once.
+    Every candidate Q is evaluated with the minimum ROP of optimize_rop and
+    costs
+        K × orders per year + H × average inventory.
+    The cost of a simulated policy is not unimodal in Q, so a coarse grid
+    over the bounds first brackets the cheapest Q, then a golden-section
+    search refines it within the bracket.
+
+    Args:
+        demand (array-like): Daily demand, shape (days,) or (days, series),
+            or a daily demand matrix (Date x Product_Code)
+        L (int or array-like): Lead time in days of each series
+        target (float or array-like): Target fill rate of each series
+        order_cost (float): Fixed cost per order (K)
+        holding_cost (float): Holding cost per unit per year (H)
+        q_bounds (tuple): Lower and upper bounds of Q of each series, by
+            default a quarter and four times the EOQ
+        n_grid (int): Number of Q of the coarse grid, at least 2
+        n_iterations (int): Number of golden-section iterations
+        tol (float): Precision of the reorder points
+
+    Returns:
+        pd.DataFrame: One row per series with 'Q', 'Cost' and the results of
+            optimize_rop, indexed by Product_Code for a matrix, Q and ROP
+            are NaN when no Q meets the target
+    """
+    index = demand.columns if isinstance(demand, pd.DataFrame) else None
+    demand = np.asarray(demand, dtype=np.float64)
+    if demand.ndim == 1:
+        demand = demand[:, None]
+    n_days, n_series = demand.shape
+    years = max(n_days, 1) / 365
+
+    if q_bounds is None:
+        demand_per_year = np.clip(demand, 0, None).sum(axis=0) / years
+        q_eoq = np.maximum(eoq(demand_per_year, order_cost, holding_cost), 1)
+        q_bounds = (q_eoq / 4, q_eoq * 4)
+    a, b = (np.broadcast_to(np.asarray(x, dtype=float), (n_series,)) for x in q_bounds)
+    L = np.broadcast_to(np.asarray(L), (n_series,))
+    target = np.broadcast_to(np.asarray(target, dtype=float), (n_series,))
+    rows = np.arange(n_series)
+
+    def evaluate(q, series=rows):
+        result = optimize_rop(demand, q, L[series], target[series], series=series, tol=tol)
+        cost = order_cost * result["Orders"] / years + holding_cost * result["Avg_Inventory"]
+        result["Cost"] = np.where(result["Feasible"], cost, np.inf)
+        result.insert(0, "Q", q)
+        return result
+
+    # Coarse grid, all Q of all series simulated at once, and the bracket
+    # around the cheapest Q of every series
+    grid = a[:, None] + (b - a)[:, None] * np.linspace(0, 1, n_grid)
+    result_grid = evaluate(grid.ravel(), np.repeat(rows, n_grid))
+    k = np.argmin(result_grid["Cost"].to_numpy().reshape(n_series, n_grid), axis=1)
+    best_grid = result_grid.iloc[rows * n_grid + k].reset_index(drop=True)
+    a = grid[rows, np.maximum(k - 1, 0)]
+    b = grid[rows, np.minimum(k + 1, n_grid - 1)]
+
+    # Golden-section search, every iteration evaluates one Q per series
+    c = b - INVERSE_PHI * (b - a)
+    d = a + INVERSE_PHI * (b - a)
+    result_c, result_d = evaluate(c), evaluate(d)
+    for _ in range(n_iterations):
+        # Keep [a, d] where c costs less, otherwise [c, b]
+        left = (result_c["Cost"] <= result_d["Cost"]).to_numpy()
+        a, b = np.where(left, a, c), np.where(left, d, b)
+        new_c = b - INVERSE_PHI * (b - a)
+        new_d = a + INVERSE_PHI * (b - a)
+        result = evaluate(np.where(left, new_c, new_d))
+        c, d = np.where(left, new_c, d), np.where(left, c, new_d)
+        result_c, result_d = (
+            _select(left, result, result_d),
+            _select(left, result_c, result),
+        )
+
+    best = _select((result_c["Cost"] <= result_d["Cost"]).to_numpy(), result_c, result_d)
+    best = _select((best["Cost"] <= best_grid["Cost"]).to_numpy(), best, best_grid)
+    best.loc[~best["Feasible"], ["Q", "ROP", "SS"]] = np.nan
+    best["Cost"] = best["Cost"].replace(np.inf, np.nan)
+    if index is not None:
+        best.index = index
+    return best
+
+
+def _select(mask, first, second):
+    """
+    Rows of a first result where mask is True, of a second one elsewhere.
+
+    Returns:
+        pd.DataFrame: Result with the columns of the first one
+    """
+    return pd.DataFrame(
+        {column: np.where(mask, first[column], second[column]) for column in first}
+    )
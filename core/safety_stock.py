@@ -0,0 +1,537 @@
+"""Safety stock, reorder point and order quantity formulas"""
+
+import numpy as np
+import pandas as pd
+import scipy.stats as stats
+from core.lead_time_fit import fit_lead_time_distributions, lead_time_moments
+
+METHODS = [
+    "Basic",
+    "Average - Max",
+    "Uncertain demand",
+    "Uncertain lead time",
+    "Uncertain demand and lead time (independent)",
+    "Uncertain demand and lead time (dependent)",
+    "Fill Rate",
+    "Holding / Stockout cost",
+]
+
+# Lookup table of the standard normal loss function used as the first guess
+# of its inverse, see inverse_standard_normal_loss
+LOSS_TABLE_K = np.linspace(-10, 10, 20001)
+
+# Service levels of the service level vs. inventory cost trade-off curves
+SERVICE_LEVELS = np.round(
+    np.concatenate([np.arange(0.50, 0.99, 0.01), np.arange(0.99, 0.9995, 0.001)]), 3
+)
+
+
+def safety_factor(cycle_service_rate):
+    """
+    Safety factor Z of a cycle service rate, rounded to 2 decimals.
+
+    Args:
+        cycle_service_rate (float or array-like): Targeted cycle service rate
+
+    Returns:
+        float or numpy.ndarray: Z = Φ⁻¹(cycle service rate)
+    """
+    return np.round(stats.norm.ppf(cycle_service_rate), 2)
+
+
+def ss_uncertain_demand(Z, demand_sd, avg_lead_time):
+    """
+    Safety stock when only demand is uncertain: SS = Z × σd × √L
+
+    Args:
+        Z (float or array-like): Safety factor
+        demand_sd (float or array-like): Standard deviation of demand (σd)
+        avg_lead_time (float or array-like): Average lead time (L)
+
+    Returns:
+        float or numpy.ndarray: Safety stock
+    """
+    return Z * demand_sd * np.sqrt(avg_lead_time)
+
+
+def ss_uncertain_lead_time(Z, sd_lead_time, avg_sales):
+    """
+    Safety stock when only lead time is uncertain: SS = Z × σL × D
+
+    Args:
+        Z (float or array-like): Safety factor
+        sd_lead_time (float or array-like): Standard deviation of lead time (σL)
+        avg_sales (float or array-like): Average demand (D)
+
+    Returns:
+        float or numpy.ndarray: Safety stock
+    """
+    return Z * sd_lead_time * avg_sales
+
+
+def ss_uncertain_demand_lead_time_ind(Z, avg_lead_time, demand_sd, avg_sales, sd_lead_time):
+    """
+    Safety stock when demand and lead time are uncertain and independent:
+    SS = Z × √(L × σd² + (D × σL)²)
+
+    Args:
+        Z (float or array-like): Safety factor
+        avg_lead_time (float or array-like): Average lead time (L)
+        demand_sd (float or array-like): Standard deviation of demand (σd)
+        avg_sales (float or array-like): Average demand (D)
+        sd_lead_time (float or array-like): Standard deviation of lead time (σL)
+
+    Returns:
+        float or numpy.ndarray: Safety stock
+    """
+    return Z * np.sqrt(avg_lead_time * demand_sd**2 + (avg_sales * sd_lead_time) ** 2)
+
+
+def ss_uncertain_demand_lead_time_dep(Z, avg_lead_time, demand_sd, avg_sales, sd_lead_time):
+    """
+    Safety stock when demand and lead time are uncertain and dependent:
+    SS = Z × σd × √L + Z × D × σL
+
+    Args:
+        Z (float or array-like): Safety factor
+        avg_lead_time (float or array-like): Average lead time (L)
+        demand_sd (float or array-like): Standard deviation of demand (σd)
+        avg_sales (float or array-like): Average demand (D)
+        sd_lead_time (float or array-like): Standard deviation of lead time (σL)
+
+    Returns:
+        float or numpy.ndarray: Safety stock
+    """
+    return Z * demand_sd * np.sqrt(avg_lead_time) + Z * avg_sales * sd_lead_time
+
+
+def standard_normal_loss(k):
+    """
+    Standard normal loss function G(k) = φ(k) - k × (1 - Φ(k)), the expected
+    shortage per unit of standard deviation at safety factor k.
+
+    Args:
+        k (float or array-like): Safety factor
+
+    Returns:
+        float or numpy.ndarray: Standard normal loss
+    """
+    return stats.norm.pdf(k) - k * stats.norm.sf(k)
+
+
+LOSS_TABLE_G = standard_normal_loss(LOSS_TABLE_K)
+
+
+def inverse_standard_normal_loss(loss, tol=1e-10, max_iter=50):
+    """
+    Safety factor k such that G(k) equals the given standard normal loss.
+
+    The first guess is interpolated from a lookup table of G in log space and
+    refined with vectorized Newton iterations k ← k + (G(k) - loss) / (1 - Φ(k)).
+    G is convex and decreasing, so the iterations converge monotonically.
+
+    Args:
+        loss (float or array-like): Targeted standard normal loss, >= 0
+        tol (float): Tolerance on the Newton step
+        max_iter (int): Maximum number of Newton iterations
+
+    Returns:
+        float or numpy.ndarray: Safety factor k, inf for a loss of 0 and NaN
+            for negative or missing losses
+    """
+    loss = np.asarray(loss, dtype=float)
+    k = np.full(loss.shape, np.nan)
+    k[loss == 0] = np.inf
+
+    valid = loss > 0
+    target = loss[valid]
+    # G is decreasing, so the table is reversed for interpolation
+    with np.errstate(divide="ignore"):
+        guess = np.interp(
+            np.log(target), np.log(LOSS_TABLE_G[::-1]), LOSS_TABLE_K[::-1]
+        )
+
+    # Below k = -10, G(k) = -k up to double precision
+    guess = np.where(target > LOSS_TABLE_G[0], -target, guess)
+    active = np.ones(guess.shape, dtype=bool)
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        k_active = guess[active]
+        step = (standard_normal_loss(k_active) - target[active]) / stats.norm.sf(k_active)
+        step = np.nan_to_num(step, nan=0.0, posinf=0.0, neginf=0.0)
+        guess[active] = k_active + step
+        active[active] = np.abs(step) > tol
+
+    k[valid] = guess
+    return k if k.ndim else float(k)
+
+
+def fill_rate_safety_factor(avg_sales, demand_sd, fill_rate):
+    """
+    Safety factor k of a fill rate, the exact inverse of the standard normal
+    loss function evaluated at G = D × (1 - β) / σd.
+
+    Args:
+        avg_sales (float or array-like): Average demand (D)
+        demand_sd (float or array-like): Standard deviation of demand (σd)
+        fill_rate (float or array-like): Targeted fill rate (β)
+
+    Returns:
+        float or numpy.ndarray: Safety factor k
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        loss = np.asarray(avg_sales * (1 - np.asarray(fill_rate)) / demand_sd, dtype=float)
+    return inverse_standard_normal_loss(loss)
+
+
+def ss_fill_rate(avg_sales, demand_sd, avg_lead_time, fill_rate):
+    """
+    Safety stock for a targeted fill rate: SS = k × σd × √L
+
+    Args:
+        avg_sales (float or array-like): Average demand (D)
+        demand_sd (float or array-like): Standard deviation of demand (σd)
+        avg_lead_time (float or array-like): Average lead time (L)
+        fill_rate (float or array-like): Targeted fill rate (β)
+
+    Returns:
+        float or numpy.ndarray: Safety stock
+    """
+    k = fill_rate_safety_factor(avg_sales, demand_sd, fill_rate)
+    return k * demand_sd * np.sqrt(avg_lead_time)
+
+
+def ss_holding_stockout(avg_sales, demand_sd, avg_lead_time, holding_cost, stockout_cost):
+    """
+    Safety stock balancing holding and stockout costs:
+    SS = (D + σd × Φ(p / (p + h))) × √L
+
+    Args:
+        avg_sales (float or array-like): Average demand (D)
+        demand_sd (float or array-like): Standard deviation of demand (σd)
+        avg_lead_time (float or array-like): Average lead time (L)
+        holding_cost (float or array-like): Holding cost per unit per year (h)
+        stockout_cost (float or array-like): Stockout cost per unit (p)
+
+    Returns:
+        float or numpy.ndarray: Safety stock
+    """
+    ratio = stockout_cost / (stockout_cost + holding_cost)
+    return (avg_sales + demand_sd * stats.norm.cdf(ratio)) * np.sqrt(avg_lead_time)
+
+
+def ss_average_max(max_lead_time, max_sales, avg_lead_time, avg_sales):
+    """
+    Safety stock of the Average-Max method: SS = Max L × Max D - L × D
+
+    Args:
+        max_lead_time (float or array-like): Maximum lead time
+        max_sales (float or array-like): Maximum demand per time unit
+        avg_lead_time (float or array-like): Average lead time (L)
+        avg_sales (float or array-like): Average demand per time unit (D)
+
+    Returns:
+        float or numpy.ndarray: Safety stock
+    """
+    return max_lead_time * max_sales - avg_lead_time * avg_sales
+
+
+def ss_basic(avg_sales, nb_safety_days):
+    """
+    Basic safety stock: SS = D × Number of safety days
+
+    Args:
+        avg_sales (float or array-like): Average daily demand (D)
+        nb_safety_days (float or array-like): Number of safety days
+
+    Returns:
+        float or numpy.ndarray: Safety stock
+    """
+    return avg_sales * nb_safety_days
+
+
+def reorder_point(ss, avg_lead_time, avg_sales):
+    """
+    Reorder point: ROP = SS + L × D
+
+    Args:
+        ss (float or array-like): Safety stock
+        avg_lead_time (float or array-like): Average lead time (L)
+        avg_sales (float or array-like): Average demand (D)
+
+    Returns:
+        float or numpy.ndarray: Reorder point
+    """
+    return ss + avg_lead_time * avg_sales
+
+
+def eoq(demand_per_year, order_cost, holding_cost):
+    """
+    Economic Order Quantity (Wilson formula): EOQ = √(2DK/H)
+
+    Args:
+        demand_per_year (float or array-like): Annual demand quantity (D)
+        order_cost (float or array-like): Fixed cost per order (K)
+        holding_cost (float or array-like): Annual holding cost per unit (H)
+
+    Returns:
+        float or numpy.ndarray: Economic order quantity
+    """
+    return (2 * (demand_per_year * order_cost) / holding_cost) ** (1 / 2)
+
+
+def service_level_curve(
+    safety_factors,
+    lead_time_demand,
+    lead_time_demand_sd,
+    holding_cost,
+    service_levels=SERVICE_LEVELS,
+    index=None,
+):
+    """
+    SS, ROP, holding cost and expected shortage at each service level.
+
+    Product inputs are broadcast against the service levels, so the whole
+    curve of every product is computed in one operation:
+        SS = k × σLT, ROP = SS + L × D
+        Holding cost = H × max(SS, 0)
+        Expected shortage per replenishment cycle = σLT × G(k)
+
+    Args:
+        safety_factors (array-like): Safety factor k per product and service level,
+            shape (products, levels) or (levels,) for a single product
+        lead_time_demand (float or array-like): Average demand during lead time (L × D)
+        lead_time_demand_sd (float or array-like): Standard deviation of demand
+            during lead time (σLT)
+        holding_cost (float): Holding cost per unit per year (H)
+        service_levels (array-like): Service levels of the curve
+        index (array-like): Product of each row of the inputs, a single product
+            is assumed when None
+
+    Returns:
+        pd.DataFrame: One row per product and service level with 'Service_Level',
+            'SS', 'ROP', 'Holding_Cost' and 'Expected_Shortage' columns, plus
+            'Product_Code' when index is given
+    """
+    levels = np.asarray(service_levels, dtype=float)
+    k = np.asarray(safety_factors, dtype=float)
+    lead_time_demand = np.asarray(lead_time_demand, dtype=float)[..., None]
+    sd = np.asarray(lead_time_demand_sd, dtype=float)[..., None]
+
+    ss = k * sd
+    curve = {
+        "Service_Level": np.broadcast_to(levels, ss.shape),
+        "SS": ss,
+        "ROP": ss + lead_time_demand,
+        "Holding_Cost": holding_cost * np.maximum(ss, 0),
+        "Expected_Shortage": sd * standard_normal_loss(k),
+    }
+    curve = pd.DataFrame(
+        {name: np.round(values.ravel(), 2) for name, values in curve.items()}
+    )
+    curve["Service_Level"] = np.broadcast_to(levels, ss.shape).ravel()
+    if index is not None:
+        curve.insert(0, "Product_Code", np.repeat(np.asarray(index), len(levels)))
+    return curve
+
+
+def cycle_service_curve(
+    avg_sales,
+    avg_lead_time,
+    lead_time_demand_sd,
+    holding_cost,
+    service_levels=SERVICE_LEVELS,
+    index=None,
+):
+    """
+    Service level vs. inventory cost trade-off for cycle service rate targets,
+    where k = Φ⁻¹(cycle service rate).
+
+    Args:
+        avg_sales (float or array-like): Average demand (D)
+        avg_lead_time (float or array-like): Average lead time (L)
+        lead_time_demand_sd (float or array-like): Standard deviation of demand
+            during lead time (σLT), i.e. the safety stock at Z = 1 of the
+            uncertainty type
+        holding_cost (float): Holding cost per unit per year (H)
+        service_levels (array-like): Cycle service rates of the curve
+        index (array-like): Product of each input row, see service_level_curve
+
+    Returns:
+        pd.DataFrame: See service_level_curve
+    """
+    avg_sales = np.asarray(avg_sales, dtype=float)
+    k = np.broadcast_to(stats.norm.ppf(service_levels), avg_sales.shape + (len(service_levels),))
+    return service_level_curve(
+        k,
+        np.asarray(avg_lead_time) * avg_sales,
+        lead_time_demand_sd,
+        holding_cost,
+        service_levels,
+        index,
+    )
+
+
+def fill_rate_curve(
+    avg_sales,
+    demand_sd,
+    avg_lead_time,
+    holding_cost,
+    service_levels=SERVICE_LEVELS,
+    index=None,
+):
+    """
+    Service level vs. inventory cost trade-off for fill rate targets, where k
+    is the inverse of the standard normal loss at D × (1 - β) / σd.
+
+    Args:
+        avg_sales (float or array-like): Average demand (D)
+        demand_sd (float or array-like): Standard deviation of demand (σd)
+        avg_lead_time (float or array-like): Average lead time (L)
+        holding_cost (float): Holding cost per unit per year (H)
+        service_levels (array-like): Fill rates of the curve
+        index (array-like): Product of each input row, see service_level_curve
+
+    Returns:
+        pd.DataFrame: See service_level_curve
+    """
+    avg_sales = np.asarray(avg_sales, dtype=float)[..., None]
+    demand_sd = np.asarray(demand_sd, dtype=float)[..., None]
+    k = fill_rate_safety_factor(avg_sales, demand_sd, np.asarray(service_levels))
+    L = np.asarray(avg_lead_time, dtype=float)
+    return service_level_curve(
+        k,
+        L * avg_sales[..., 0],
+        demand_sd[..., 0] * np.sqrt(L),
+        holding_cost,
+        service_levels,
+        index,
+    )
+
+
+def portfolio_inputs(
+    daily_demand, daily_demand_clean, lead_time_data, year, lead_time_distribution="sample"
+):
+    """
+    Computes the safety stock inputs of every product for one year, in days.
+
+    Average and maximum demand come from the raw daily demand, the demand
+    standard deviation from the outlier-cleaned daily demand, days without
+    demand included. This differs from the single product tabs, whose
+    standard deviation is that of the days with transactions after an IQR
+    filter (see core.stats.sd_demand). Lead time moments are either the
+    sample moments or those of a fitted distribution.
+
+    Args:
+        daily_demand (pd.DataFrame): Daily demand matrix (Date x Product_Code)
+        daily_demand_clean (pd.DataFrame): Hampel-cleaned daily demand matrix
+        lead_time_data (pd.DataFrame): Lead time data of all products
+        year (int): Year of demand and received orders to use
+        lead_time_distribution (str): 'sample', 'gamma' or 'lognormal'
+
+    Returns:
+        pd.DataFrame: One row per Product_Code with avg_sales, demand_sd,
+        max_sales, avg_lead_time, sd_lead_time and max_lead_time columns
+    """
+    raw = daily_demand.loc[daily_demand.index.year == year]
+    clean = daily_demand_clean.loc[daily_demand_clean.index.year == year]
+
+    inputs = pd.DataFrame(
+        {
+            "avg_sales": raw.sum() / 365,
+            "demand_sd": clean.std(),
+            "max_sales": raw.max(),
+        }
+    )
+
+    lead_time_data = lead_time_data.loc[lead_time_data["Received_Date"].dt.year == year]
+    grouped = lead_time_data.groupby("Product_Code")["Lead_Time_Days"]
+    inputs["avg_lead_time"] = grouped.mean()
+    inputs["sd_lead_time"] = grouped.std()
+    inputs["max_lead_time"] = grouped.max()
+
+    if lead_time_distribution != "sample" and not lead_time_data.empty:
+        fits = fit_lead_time_distributions(lead_time_data)
+        mean, sd = lead_time_moments(fits, lead_time_distribution)
+        inputs["avg_lead_time"] = mean
+        inputs["sd_lead_time"] = sd
+
+    inputs.index.name = "Product_Code"
+    return inputs
+
+
+def portfolio_safety_stock(
+    avg_sales,
+    demand_sd,
+    max_sales,
+    avg_lead_time,
+    sd_lead_time,
+    max_lead_time,
+    cycle_service_rate=0.90,
+    fill_rate=0.90,
+    holding_cost=0.20,
+    stockout_cost=0.20,
+    safety_days=5,
+    index=None,
+):
+    """
+    Computes safety stock and reorder point of every product with every method.
+
+    Uses the same formulas as the single product tabs, broadcast over arrays
+    of per-product inputs (see portfolio_inputs for how they differ from the
+    inputs of the tabs):
+        Basic: SS = D x Number of safety days
+        Average - Max: SS = Max L x Max D - L x D
+        Uncertain demand: SS = Z x σd x √L
+        Uncertain lead time: SS = Z x σL x D
+        Independent: SS = Z x √(L x σd² + (D x σL)²)
+        Dependent: SS = Z x σd x √L + Z x D x σL
+        Fill Rate: SS = k x σd x √L, k = G⁻¹(D x (1 - β) / σd) by exact
+            inversion of the standard normal loss function
+        Holding / Stockout cost: SS = (D + σd x Φ(p / (p + h))) x √L
+    and ROP = SS + L x D for every method.
+
+    Args:
+        avg_sales (array-like): Average demand per day (D)
+        demand_sd (array-like): Standard deviation of daily demand (σd)
+        max_sales (array-like): Maximum daily demand
+        avg_lead_time (array-like): Average lead time in days (L)
+        sd_lead_time (array-like): Standard deviation of lead time (σL)
+        max_lead_time (array-like): Maximum lead time in days
+        cycle_service_rate (float): Targeted cycle service rate
+        fill_rate (float): Targeted fill rate
+        holding_cost (float): Holding cost per unit per year (h)
+        stockout_cost (float): Stockout cost per unit (p)
+        safety_days (float): Number of safety days of the basic method
+        index (pd.Index): Product codes, defaults to a range index
+
+    Returns:
+        pd.DataFrame: One row per product with an SS and an ROP column per method
+    """
+    D = np.asarray(avg_sales, dtype=float)
+    sd = np.asarray(demand_sd, dtype=float)
+    L = np.asarray(avg_lead_time, dtype=float)
+    sd_L = np.asarray(sd_lead_time, dtype=float)
+    Z = safety_factor(cycle_service_rate)
+
+    ss = np.stack(
+        [
+            ss_basic(D, safety_days),
+            ss_average_max(np.asarray(max_lead_time, dtype=float), max_sales, L, D),
+            ss_uncertain_demand(Z, sd, L),
+            ss_uncertain_lead_time(Z, sd_L, D),
+            ss_uncertain_demand_lead_time_ind(Z, L, sd, D, sd_L),
+            ss_uncertain_demand_lead_time_dep(Z, L, sd, D, sd_L),
+            ss_fill_rate(D, sd, L, fill_rate),
+            ss_holding_stockout(D, sd, L, holding_cost, stockout_cost),
+        ],
+        axis=-1,
+    ).round()
+    rop = reorder_point(ss, L[..., None], D[..., None]).round()
+
+    columns = pd.MultiIndex.from_product([METHODS, ["SS", "ROP"]])
+    values = np.stack([ss, rop], axis=-1).reshape(len(D), -1)
+    table = pd.DataFrame(values, index=index, columns=columns)
+    table.columns = [f"{method} {value}" for method, value in columns]
+    return table
@@ -0,0 +1,123 @@
+"""Seasonal indices and time-varying SS/ROP"""
+
+import numpy as np
+import pandas as pd
+
+DAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+MONTH_NAMES = [
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+]
+
+
+def grouped_means(values, groups, n_groups):
+    """
+    Averages the rows of a matrix per group with one matrix product.
+
+    Args:
+        values (numpy.ndarray): Matrix of shape (days, products)
+        groups (numpy.ndarray): Group number of every row, from 0 to n_groups - 1
+        n_groups (int): Number of groups
+
+    Returns:
+        numpy.ndarray: Matrix of shape (n_groups, products), NaN for empty groups
+    """
+    one_hot = np.eye(n_groups)[groups]
+    sums = one_hot.T @ values
+    counts = one_hot.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return sums / counts[:, None]
+
+
+def seasonal_indices(matrix):
+    """
+    Computes day-of-week and month-of-year seasonal indices for every product.
+
+    An index is the average demand of the day of week (or month) divided by
+    the product's overall average daily demand, so 1.0 means no seasonality.
+    Products without demand and periods missing from the data get 1.0.
+
+    Args:
+        matrix (pandas.DataFrame): Daily demand matrix (Date x Product_Code)
+
+    Returns:
+        tuple: (day_of_week_index, month_index) DataFrames indexed by
+        Product_Code with 7 and 12 columns respectively
+    """
+    values = matrix.to_numpy(dtype=float)
+    overall = values.mean(axis=0) if len(values) else np.zeros(values.shape[1])
+
+    indices = []
+    for groups, names in [
+        (matrix.index.dayofweek, DAY_NAMES),
+        (matrix.index.month - 1, MONTH_NAMES),
+    ]:
+        means = grouped_means(values, np.asarray(groups), len(names))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            index = means / overall
+        index = np.where(np.isfinite(index), index, 1.0)
+        indices.append(pd.DataFrame(index.T, index=matrix.columns, columns=names))
+
+    return tuple(indices)
+
+
+def monthly_ss_rop_schedule(avg_sales, demand_sd, lead_time, z, month_index):
+    """
+    Derives monthly safety stock and reorder point schedules.
+
+    Demand level and variability are scaled by the month index, so
+    SS_m = Z x σd x index_m x √L and ROP_m = SS_m + L x D x index_m.
+    Scalars and per-product arrays are broadcast against the month index.
+
+    Args:
+        avg_sales (float or numpy.ndarray): Average demand per time unit
+        demand_sd (float or numpy.ndarray): Standard deviation of demand
+        lead_time (float or numpy.ndarray): Average lead time
+        z (float or numpy.ndarray): Safety factor
+        month_index (pandas.DataFrame or numpy.ndarray): Month index of shape (products, 12)
+
+    Returns:
+        tuple: (ss, rop) arrays of shape (products, 12)
+    """
+    month_index = np.asarray(month_index, dtype=float)
+    avg_sales = np.asarray(avg_sales, dtype=float)[..., None]
+    demand_sd = np.asarray(demand_sd, dtype=float)[..., None]
+    lead_time = np.asarray(lead_time, dtype=float)[..., None]
+    z = np.asarray(z, dtype=float)[..., None]
+
+    ss = np.round(z * demand_sd * month_index * np.sqrt(lead_time))
+    rop = np.round(ss + lead_time * avg_sales * month_index)
+    return ss, rop
+
+
+def seasonal_rop(ss, rop, month_index):
+    """
+    Scales the lead time demand part of a reorder point by a month index.
+
+    Keeps the safety stock and scales the expected lead time demand
+    (ROP - SS) month by month: ROP_m = SS + (ROP - SS) x index_m.
+
+    Args:
+        ss (float): Safety stock
+        rop (float): Reorder point
+        month_index (array-like): Month index of one product (12 values)
+
+    Returns:
+        numpy.ndarray: Reorder point of every month (12 values)
+    """
+    return ss + (rop - ss) * np.asarray(month_index, dtype=float)
+
+
+def daily_schedule(monthly_values, dates):
+    """
+    Expands a monthly schedule to one value per date.
+
+    Args:
+        monthly_values (array-like): 12 values, January first
+        dates (pandas.Series or pandas.DatetimeIndex): Dates to map
+
+    Returns:
+        numpy.ndarray: Value of the month of every date
+    """
+    months = pd.DatetimeIndex(dates).month.to_numpy() - 1
+    return np.asarray(monthly_values)[months]
@@ -0,0 +1,266 @@
+"""Safety stock sensitivity analysis engine"""
+
+import numpy as np
+import pandas as pd
+import scipy.stats as stats
+from core.safety_stock import (
+    ss_uncertain_demand,
+    ss_uncertain_lead_time,
+    ss_uncertain_demand_lead_time_ind,
+    ss_uncertain_demand_lead_time_dep,
+)
+
+# Inputs of the cycle service rate formulas and their labels
+INPUTS = {
+    "cycle_service_rate": "Cycle Service Rate",
+    "avg_sales": "Average Sales (D)",
+    "demand_sd": "Demand Std Dev (σd)",
+    "avg_lead_time": "Average Lead Time (L)",
+    "sd_lead_time": "Lead Time Std Dev (σL)",
+}
+
+# Inputs each uncertainty type depends on
+UNCERTAINTY_INPUTS = {
+    "Uncertain demand": ["cycle_service_rate", "avg_sales", "demand_sd", "avg_lead_time"],
+    "Uncertain lead time": [
+        "cycle_service_rate",
+        "avg_sales",
+        "avg_lead_time",
+        "sd_lead_time",
+    ],
+    "Uncertain demand and lead time (independent)": list(INPUTS),
+    "Uncertain demand and lead time (dependent)": list(INPUTS),
+}
+
+
+def cycle_service_ss_rop(
+    uncertainty_type,
+    cycle_service_rate,
+    avg_sales,
+    demand_sd=0.0,
+    avg_lead_time=0.0,
+    sd_lead_time=0.0,
+):
+    """
+    Safety stock and reorder point of an uncertainty type of the cycle service
+    rate method, broadcast over arrays of inputs. Z is not rounded so that
+    the results are smooth in the service level.
+
+    Args:
+        uncertainty_type (str): Uncertainty type, see UNCERTAINTY_INPUTS
+        cycle_service_rate (float or array-like): Targeted cycle service rate
+        avg_sales (float or array-like): Average demand (D)
+        demand_sd (float or array-like): Standard deviation of demand (σd)
+        avg_lead_time (float or array-like): Average lead time (L)
+        sd_lead_time (float or array-like): Standard deviation of lead time (σL)
+
+    Returns:
+        tuple: Safety stock and reorder point
+    """
+    Z = stats.norm.ppf(cycle_service_rate)
+    if uncertainty_type == "Uncertain demand":
+        ss = ss_uncertain_demand(Z, demand_sd, avg_lead_time)
+    elif uncertainty_type == "Uncertain lead time":
+        ss = ss_uncertain_lead_time(Z, sd_lead_time, avg_sales)
+    elif uncertainty_type == "Uncertain demand and lead time (independent)":
+        ss = ss_uncertain_demand_lead_time_ind(
+            Z, avg_lead_time, demand_sd, avg_sales, sd_lead_time
+        )
+    else:
+        ss = ss_uncertain_demand_lead_time_dep(
+            Z, avg_lead_time, demand_sd, avg_sales, sd_lead_time
+        )
+    return ss, ss + np.multiply(avg_lead_time, avg_sales)
+
+
+def sensitivities(uncertainty_type, inputs, relative_step=1e-4):
+    """
+    Partial derivatives and elasticities of SS and ROP with respect to every
+    input, by central finite differences.
+
+    The inputs of all products are stacked with a column per perturbed
+    input (base, then every input minus and plus its step) and SS and ROP
+    of the whole stack come from one formula evaluation.
+
+    Args:
+        uncertainty_type (str): Uncertainty type, see UNCERTAINTY_INPUTS
+        inputs (dict): Value of every input of the uncertainty type, floats or
+            arrays of one value per product
+        relative_step (float): Step of every input relative to its value
+
+    Returns:
+        pd.DataFrame: One row per input (and product) with 'Input', 'Value',
+            'dSS', 'dROP' (partial derivatives), 'SS_Elasticity' and
+            'ROP_Elasticity' (% change per 1% change of the input)
+    """
+    names = UNCERTAINTY_INPUTS[uncertainty_type]
+    values = np.broadcast_arrays(*[np.asarray(inputs[name], dtype=float) for name in names])
+    values = np.stack([np.atleast_1d(value) for value in values])  # (inputs, products)
+    n_inputs, n_products = values.shape
+
+    # Absolute steps, the service level step stays inside (0, 1)
+    steps = relative_step * np.where(values != 0, np.abs(values), 1)
+    csr = names.index("cycle_service_rate")
+    steps[csr] = np.minimum(steps[csr], np.minimum(values[csr], 1 - values[csr]) / 2)
+
+    stacked = np.repeat(values[:, None, :], 2 * n_inputs + 1, axis=1)
+    for i in range(n_inputs):
+        stacked[i, 1 + 2 * i] -= steps[i]
+        stacked[i, 2 + 2 * i] += steps[i]
+    ss, rop = cycle_service_ss_rop(uncertainty_type, **dict(zip(names, stacked)))
+    ss, rop = np.broadcast_to(ss, stacked.shape[1:]), np.broadcast_to(rop, stacked.shape[1:])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d_ss = (ss[2::2] - ss[1::2]) / (2 * steps)
+        d_rop = (rop[2::2] - rop[1::2]) / (2 * steps)
+        ss_elasticity = d_ss * values / ss[0]
+        rop_elasticity = d_rop * values / rop[0]
+
+    return pd.DataFrame(
+        {
+            "Input": np.repeat(names, n_products),
+            "Value": values.ravel(),
+            "dSS": d_ss.ravel(),
+            "dROP": d_rop.ravel(),
+            "SS_Elasticity": ss_elasticity.ravel(),
+            "ROP_Elasticity": rop_elasticity.ravel(),
+        }
+    )
+
+
+def tornado(uncertainty_type, inputs, swing=0.2, service_level_swing=0.05):
+    """
+    SS and ROP when every input in turn is lowered and raised while the
+    others stay at their value, all evaluated at once.
+
+    Args:
+        uncertainty_type (str): Uncertainty type, see UNCERTAINTY_INPUTS
+        inputs (dict): Value of every input of the uncertainty type
+        swing (float): Relative change of the inputs, e.g. 0.2 for ±20%
+        service_level_swing (float): Absolute change of the cycle service rate
+
+    Returns:
+        pd.DataFrame: One row per input with 'Low', 'High' (input values),
+            'SS_Low', 'SS_High', 'ROP_Low' and 'ROP_High', sorted by the SS
+            range, largest first
+    """
+    names = UNCERTAINTY_INPUTS[uncertainty_type]
+    values = np.array([float(inputs[name]) for name in names])
+    low = values * (1 - swing)
+    high = values * (1 + swing)
+    csr = names.index("cycle_service_rate")
+    low[csr] = max(values[csr] - service_level_swing, 0.001)
+    high[csr] = min(values[csr] + service_level_swing, 0.999)
+
+    # Column 2i is input i low, column 2i + 1 input i high
+    stacked = np.repeat(values[:, None], 2 * len(names), axis=1)
+    stacked[np.arange(len(names)), 2 * np.arange(len(names))] = low
+    stacked[np.arange(len(names)), 2 * np.arange(len(names)) + 1] = high
+    ss, rop = cycle_service_ss_rop(uncertainty_type, **dict(zip(names, stacked)))
+    ss = np.broadcast_to(ss, stacked.shape[1:])
+    rop = np.broadcast_to(rop, stacked.shape[1:])
+
+    result = pd.DataFrame(
+        {
+            "Low": low,
+            "High": high,
+            "SS_Low": ss[0::2],
+            "SS_High": ss[1::2],
+            "ROP_Low": rop[0::2],
+            "ROP_High": rop[1::2],
+        },
+        index=pd.Index([INPUTS[name] for name in names], name="Input"),
+    )
+    order = (result["SS_High"] - result["SS_Low"]).abs().sort_values(ascending=False)
+    return result.loc[order.index]
+
+
+def grid_values(name, value, n_values=11):
+    """
+    Values of an input on a sensitivity grid: from 50% to 150% of its value,
+    or cycle service rates from 0.50 to 0.99.
+
+    Args:
+        name (str): Name of the input, see INPUTS
+        value (float): Value of the input
+        n_values (int): Number of values
+
+    Returns:
+        numpy.ndarray: Grid values rounded to 2 decimals
+    """
+    if name == "cycle_service_rate":
+        return np.round(np.linspace(0.50, 0.99, n_values), 2)
+    return np.round(value * np.linspace(0.5, 1.5, n_values), 2)
+
+
+def sensitivity_grid(uncertainty_type, inputs, x, x_values, y, y_values):
+    """
+    SS and ROP over a two-way grid of two inputs, the others staying at their
+    value, in one broadcast evaluation.
+
+    Args:
+        uncertainty_type (str): Uncertainty type, see UNCERTAINTY_INPUTS
+        inputs (dict): Value of every input of the uncertainty type
+        x (str): Name of the input of the rows
+        x_values (array-like): Values of the x input
+        y (str): Name of the input of the columns
+        y_values (array-like): Values of the y input
+
+    Returns:
+        tuple: SS and ROP as DataFrames indexed by x values with a column per
+            y value
+    """
+    names = UNCERTAINTY_INPUTS[uncertainty_type]
+    grid = {name: float(inputs[name]) for name in names}
+    grid[x] = np.asarray(x_values, dtype=float)[:, None]
+    grid[y] = np.asarray(y_values, dtype=float)[None, :]
+    ss, rop = cycle_service_ss_rop(uncertainty_type, **grid)
+
+    shape = (len(x_values), len(y_values))
+    index = pd.Index(np.asarray(x_values), name=INPUTS[x])
+    columns = pd.Index(np.asarray(y_values), name=INPUTS[y])
+    return (
+        pd.DataFrame(np.broadcast_to(ss, shape), index=index, columns=columns),
+        pd.DataFrame(np.broadcast_to(rop, shape), index=index, columns=columns),
+    )
+
+
+def portfolio_lead_time_sensitivity(inputs, cycle_service_rate):
+    """
+    Sensitivity of the safety stock of every product to its lead time
+    variance, with demand and lead time uncertainty (independent):
+        dSS / dσL² = Z × D² / (2 × √(L × σd² + (D × σL)²))
+    and the share of the lead time demand variance due to lead times
+    (D × σL)² / (L × σd² + (D × σL)²), which is also the elasticity of SS
+    to σL (% change of SS per 1% change of σL).
+
+    Args:
+        inputs (pd.DataFrame): Per-product inputs, see core.safety_stock.portfolio_inputs
+        cycle_service_rate (float): Targeted cycle service rate
+
+    Returns:
+        pd.DataFrame: One row per product with 'SS', 'dSS_dVar_LT' and
+            'Lead_Time_Variance_Share', sorted by dSS_dVar_LT, largest first
+    """
+    D = inputs["avg_sales"].to_numpy(dtype=float)
+    L = inputs["avg_lead_time"].to_numpy(dtype=float)
+    sd = inputs["demand_sd"].to_numpy(dtype=float)
+    sd_L = np.nan_to_num(inputs["sd_lead_time"].to_numpy(dtype=float))
+    Z = stats.norm.ppf(cycle_service_rate)
+
+    demand_variance = L * sd**2
+    lead_time_variance = (D * sd_L) ** 2
+    sigma = np.sqrt(demand_variance + lead_time_variance)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d_ss = Z * D**2 / (2 * sigma)
+        share = lead_time_variance / sigma**2
+
+    result = pd.DataFrame(
+        {
+            "SS": Z * sigma,
+            "dSS_dVar_LT": d_ss,
+            "Lead_Time_Variance_Share": share,
+        },
+        index=inputs.index,
+    )
+    return result.sort_values("dSS_dVar_LT", ascending=False)
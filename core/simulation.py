@@ -0,0 +1,671 @@
+"""Inventory simulation engine"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+import scipy.stats as stats
+from numba import njit
+
+
+def year_daily_demand(df_demand, year_sim):
+    """
+    Builds the daily demand of a year with one row per calendar day.
+
+    Args:
+        df_demand (pd.DataFrame): DataFrame with 'Date' and 'Order_Demand' columns
+        year_sim (int): Year to simulate
+
+    Returns:
+        pd.DataFrame: 'Date' and 'Order_Demand' columns, days without demand are 0
+    """
+    df_demand = df_demand.loc[df_demand["Date"].dt.year == year_sim]
+    df_demand = df_demand.sort_values(by="Date")
+    df_demand = df_demand[["Date", "Order_Demand"]]
+    df_demand = df_demand.groupby("Date").sum().reset_index()
+    df_demand.columns = ["Date", "Order_Demand"]
+
+    # Merge demand data with complete date range of the year
+    dates = pd.date_range(
+        start=pd.to_datetime(f"{year_sim}-01-01"),
+        end=pd.to_datetime(f"{year_sim}-12-31"),
+        freq="D",
+    )
+    df = pd.DataFrame({"Date": dates})
+    df = pd.merge(df, df_demand, on="Date", how="left")
+    return df.fillna(0)
+
+
+@njit(cache=True)
+def advance_inventory(demand, rop, q, L, current_inventory, day_since_trigger_rop):
+    """
+    Compiled daily recurrence of a (ROP, Q) replenishment policy from a given
+    state, so that a long demand series can be simulated chunk by chunk.
+
+    Once the inventory is at or below the reorder point, the days are counted
+    and Q units are received on the L-th day after. Unmet demand is lost.
+
+    Args:
+        demand (numpy.ndarray): Daily demand, float64
+        rop (numpy.ndarray): Reorder point of each day, float64
+        q (float): Order quantity
+        L (int): Lead time in days
+        current_inventory (float): Inventory before the first day
+        day_since_trigger_rop (int): Days counted since the reorder point was reached
+
+    Returns:
+        tuple: Inventory level at the start of each day, units received and
+            units of demand lost each day, and the inventory and day count
+            after the last day
+    """
+    n_days = len(demand)
+    inventory = np.empty(n_days)
+    receipts = np.zeros(n_days)
+    stockouts = np.zeros(n_days)
+
+    for day in range(n_days):
+        # Check reorder point and handle lead time
+        if current_inventory <= rop[day]:
+            if day_since_trigger_rop == L:
+                current_inventory += q
+                receipts[day] = q
+                day_since_trigger_rop = 0
+            else:
+                day_since_trigger_rop += 1
+
+        # Update inventory levels based on demand
+        inventory[day] = current_inventory
+        if demand[day] > current_inventory:
+            stockouts[day] = demand[day] - current_inventory
+            current_inventory = 0.0
+        else:
+            current_inventory -= demand[day]
+
+    return inventory, receipts, stockouts, current_inventory, day_since_trigger_rop
+
+
+@njit(cache=True)
+def inventory_kernel(demand, ss, rop, q, L):
+    """
+    Compiled daily recurrence of a (ROP, Q) replenishment policy starting
+    with Q + SS units on hand, see advance_inventory.
+
+    Args:
+        demand (numpy.ndarray): Daily demand, float64
+        ss (float): Safety stock level
+        rop (numpy.ndarray): Reorder point of each day, float64
+        q (float): Order quantity
+        L (int): Lead time in days
+
+    Returns:
+        tuple: Inventory level at the start of each day, units received and
+            units of demand lost each day
+    """
+    inventory, receipts, stockouts, _, _ = advance_inventory(demand, rop, q, L, q + ss, 0)
+    return inventory, receipts, stockouts
+
+
+def simulate_inventory(demand, ss, rop, q, L, flows=False):
+    """
+    Simulates the daily inventory level of a (ROP, Q) replenishment policy,
+    see inventory_kernel.
+
+    Args:
+        demand (array-like): Daily demand
+        ss (float): Safety stock level
+        rop (float or array-like): Reorder point, either a scalar or one value per day
+        q (float): Order quantity
+        L (int): Lead time in days
+        flows (bool): Also return the daily receipts and stockouts
+
+    Returns:
+        numpy.ndarray: Inventory level at the start of each day, or a tuple
+            with the receipts and stockouts when flows is True
+    """
+    demand = np.ascontiguousarray(demand, dtype=np.float64)
+    rop = np.ascontiguousarray(
+        np.broadcast_to(np.asarray(rop, dtype=np.float64), demand.shape)
+    )
+    result = inventory_kernel(demand, float(ss), rop, float(q), int(L))
+    return result if flows else result[0]
+
+
+@njit(cache=True)
+def advance_policies(demand, series, rop, q, L, inventory, day_since_trigger_rop):
+    """
+    Compiled (ROP, Q) recurrence of many policies at once from a given state,
+    with the same semantics as advance_inventory. A vector of inventory
+    positions, one per policy, is advanced day by day over the demand
+    matrix; the state vectors are updated in place.
+
+    Args:
+        demand (numpy.ndarray): Daily demand matrix, float64 of shape (days, series)
+        series (numpy.ndarray): Demand column of each policy, int64
+        rop (numpy.ndarray): Reorder point of each policy, float64
+        q (numpy.ndarray): Order quantity of each policy, float64
+        L (numpy.ndarray): Lead time in days of each policy, int64
+        inventory (numpy.ndarray): Inventory of each policy, float64
+        day_since_trigger_rop (numpy.ndarray): Days counted since the reorder
+            point was reached of each policy, int64
+
+    Returns:
+        tuple: Per policy, the sum of the inventory levels at the start of
+            the days, the units of demand lost, the days with lost demand and
+            the number of orders received
+    """
+    n_days = demand.shape[0]
+    n_policies = len(series)
+    inventory_sum = np.zeros(n_policies)
+    lost = np.zeros(n_policies)
+    stockout_days = np.zeros(n_policies, dtype=np.int64)
+    orders = np.zeros(n_policies, dtype=np.int64)
+
+    for day in range(n_days):
+        for i in range(n_policies):
+            # Check reorder point and handle lead time
+            if inventory[i] <= rop[i]:
+                if day_since_trigger_rop[i] == L[i]:
+                    inventory[i] += q[i]
+                    orders[i] += 1
+                    day_since_trigger_rop[i] = 0
+                else:
+                    day_since_trigger_rop[i] += 1
+
+            # Update inventory levels based on demand
+            inventory_sum[i] += inventory[i]
+            d = demand[day, series[i]]
+            if d > inventory[i]:
+                lost[i] += d - inventory[i]
+                stockout_days[i] += 1
+                inventory[i] = 0.0
+            else:
+                inventory[i] -= d
+
+    return inventory_sum, lost, stockout_days, orders
+
+
+@njit(cache=True)
+def batch_inventory_kernel(demand, series, ss, rop, q, L):
+    """
+    Compiled (ROP, Q) recurrence of many policies at once, each starting with
+    Q + SS units on hand, see advance_policies.
+
+    Args:
+        demand (numpy.ndarray): Daily demand matrix, float64 of shape (days, series)
+        series (numpy.ndarray): Demand column of each policy, int64
+        ss (numpy.ndarray): Safety stock of each policy, float64
+        rop (numpy.ndarray): Reorder point of each policy, float64
+        q (numpy.ndarray): Order quantity of each policy, float64
+        L (numpy.ndarray): Lead time in days of each policy, int64
+
+    Returns:
+        tuple: Per policy, the sum of the inventory levels at the start of
+            the days, the units of demand lost, the days with lost demand and
+            the number of orders received
+    """
+    inventory = q + ss
+    day_since_trigger_rop = np.zeros(len(series), dtype=np.int64)
+    return advance_policies(demand, series, rop, q, L, inventory, day_since_trigger_rop)
+
+
+def policy_arrays(ss, rop, q, L, shape):
+    """
+    Broadcasts policy parameters to contiguous arrays of the kernel dtypes.
+
+    Args:
+        ss, rop, q (float or array-like): Safety stock, reorder point and
+            order quantity of each policy
+        L (int or array-like): Lead time in days of each policy
+        shape (tuple): Number of policies
+
+    Returns:
+        tuple: SS, ROP and Q as float64 arrays and L as an int64 array
+    """
+    ss, rop, q = (
+        np.ascontiguousarray(np.broadcast_to(np.asarray(x, dtype=np.float64), shape))
+        for x in (ss, rop, q)
+    )
+    L = np.ascontiguousarray(
+        np.broadcast_to(np.rint(np.asarray(L, dtype=float)).astype(np.int64), shape)
+    )
+    return ss, rop, q, L
+
+
+def policy_results(inventory_sum, lost, stockout_days, orders, total_demand, n_days):
+    """
+    Results of simulated policies from the sums of the kernel.
+
+    The fill rate is the share of demand served from stock, 1 - lost / demand.
+
+    Returns:
+        pd.DataFrame: One row per policy with 'Fill_Rate', 'Avg_Inventory',
+            'Lost_Sales', 'Stockout_Days' and 'Orders'
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fill = np.where(total_demand > 0, 1 - lost / total_demand, np.nan)
+    return pd.DataFrame(
+        {
+            "Fill_Rate": fill,
+            "Avg_Inventory": inventory_sum / max(n_days, 1),
+            "Lost_Sales": lost,
+            "Stockout_Days": stockout_days,
+            "Orders": orders,
+        }
+    )
+
+
+def simulate_policies(demand, ss, rop, q, L, series=None):
+    """
+    Simulates many (ROP, Q) policies over one or many daily demand series,
+    see batch_inventory_kernel.
+
+    Args:
+        demand (array-like): Daily demand, shape (days,) or (days, series)
+        ss (float or array-like): Safety stock of each policy
+        rop (float or array-like): Reorder point of each policy
+        q (float or array-like): Order quantity of each policy
+        L (int or array-like): Lead time in days of each policy
+        series (array-like): Demand column of each policy, defaults to one
+            policy per column
+
+    Returns:
+        pd.DataFrame: See policy_results
+    """
+    demand = np.asarray(demand, dtype=np.float64)
+    if demand.ndim == 1:
+        demand = demand[:, None]
+    demand = np.ascontiguousarray(demand)
+    if series is None:
+        series = np.arange(demand.shape[1])
+    shape = np.broadcast(series, ss, rop, q, L).shape
+    series = np.ascontiguousarray(np.broadcast_to(np.asarray(series, dtype=np.int64), shape))
+    ss, rop, q, L = policy_arrays(ss, rop, q, L, shape)
+
+    sums = batch_inventory_kernel(demand, series, ss, rop, q, L)
+    total_demand = np.clip(demand, 0, None).sum(axis=0)[series]
+    return policy_results(*sums, total_demand, len(demand))
+
+
+def _sweep_chunk(demand, ss, rop, q, L):
+    """
+    Simulates a chunk of the parameter grid, run by a worker process.
+
+    Returns:
+        pd.DataFrame: See simulate_policies
+    """
+    return simulate_policies(demand, ss, rop, q, L)
+
+
+def parameter_sweep(
+    demand, ss_values, rop_values, q_values, L_values, n_workers=None, chunk_size=4096
+):
+    """
+    Simulates every combination of safety stock, reorder point, order
+    quantity and lead time over the same daily demand.
+
+    The grid is split in chunks of combinations simulated by the batched
+    kernel, and chunks are split across a process pool.
+
+    Args:
+        demand (array-like): Daily demand
+        ss_values (array-like): Safety stocks of the grid
+        rop_values (array-like): Reorder points of the grid
+        q_values (array-like): Order quantities of the grid
+        L_values (array-like): Lead times in days of the grid
+        n_workers (int): Number of worker processes, all CPUs when None and
+            no pool when 1
+        chunk_size (int): Number of combinations per task
+
+    Returns:
+        pd.DataFrame: One row per combination with 'SS', 'ROP', 'Q', 'L' and
+            the results of simulate_policies
+    """
+    demand = np.asarray(demand, dtype=np.float64)
+    grid = np.meshgrid(ss_values, rop_values, q_values, L_values, indexing="ij")
+    ss, rop, q, L = (np.asarray(values, dtype=float).ravel() for values in grid)
+
+    chunks = [
+        (
+            demand,
+            ss[i : i + chunk_size],
+            rop[i : i + chunk_size],
+            q[i : i + chunk_size],
+            L[i : i + chunk_size],
+        )
+        for i in range(0, max(len(ss), 1), chunk_size)
+    ]
+    n_workers = n_workers or os.cpu_count()
+    if n_workers == 1 or len(chunks) <= 1:
+        results = [_sweep_chunk(*chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(_sweep_chunk, *zip(*chunks)))
+
+    result = pd.concat(results, ignore_index=True)
+    result.insert(0, "SS", ss)
+    result.insert(1, "ROP", rop)
+    result.insert(2, "Q", q)
+    result.insert(3, "L", L.astype(int))
+    return result
+
+
+def portfolio_simulation(daily_demand, ss, rop, q, L):
+    """
+    Simulates the (ROP, Q) policy of every product over its daily demand at
+    once, see portfolio_simulation_stream.
+
+    Args:
+        daily_demand (pd.DataFrame): Daily demand matrix (Date x Product_Code)
+        ss (array-like): Safety stock of each product
+        rop (array-like): Reorder point of each product
+        q (array-like): Order quantity of each product
+        L (array-like): Lead time in days of each product
+
+    Returns:
+        tuple: Results per Product_Code and the portfolio fill rate
+    """
+    _, result, portfolio_fill_rate = next(
+        portfolio_simulation_stream([daily_demand], ss, rop, q, L)
+    )
+    return result, portfolio_fill_rate
+
+
+def portfolio_simulation_stream(chunks, ss, rop, q, L):
+    """
+    Simulates the (ROP, Q) policy of every product over a daily demand matrix
+    read chunk by chunk, see advance_policies. The inventory and lead time
+    count of every product are carried from one chunk to the next, so the
+    simulation is continuous over the whole date range while only one chunk
+    is in memory. Products with a missing parameter are not simulated.
+
+    Args:
+        chunks (iterable): Daily demand matrices (Date x Product_Code) of
+            consecutive date ranges with the same columns, see matrix_chunks
+        ss (array-like): Safety stock of each product
+        rop (array-like): Reorder point of each product
+        q (array-like): Order quantity of each product
+        L (array-like): Lead time in days of each product
+
+    Yields:
+        tuple: After every chunk, the number of days simulated, the results
+            per Product_Code so far (see policy_results, NaN for products not
+            simulated) and the portfolio fill rate so far, the share of the
+            demand of the simulated products served from stock
+    """
+    n_days = 0
+    for chunk in chunks:
+        if n_days == 0:
+            products = chunk.columns
+            params = np.stack(
+                np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in (ss, rop, q, L)])
+            )
+            params = np.broadcast_to(params, (4, len(products)))
+            valid = np.isfinite(params).all(axis=0)
+            series = np.arange(valid.sum())
+            ss_, rop_, q_, L_ = policy_arrays(*params[:, valid], series.shape)
+            inventory = q_ + ss_
+            day_since_trigger_rop = np.zeros(len(series), dtype=np.int64)
+            sums = [np.zeros(len(series)) for _ in range(4)]
+            total_demand = np.zeros(len(series))
+
+        demand = np.ascontiguousarray(chunk.to_numpy(dtype=np.float64)[:, valid])
+        chunk_sums = advance_policies(
+            demand, series, rop_, q_, L_, inventory, day_since_trigger_rop
+        )
+        sums = [total + part for total, part in zip(sums, chunk_sums)]
+        total_demand += np.clip(demand, 0, None).sum(axis=0)
+        n_days += len(demand)
+
+        result = policy_results(*sums, total_demand, n_days)
+        result.index = products[valid]
+        result = result.reindex(products)
+        portfolio_fill_rate = (
+            1 - sums[1].sum() / total_demand.sum() if total_demand.sum() > 0 else np.nan
+        )
+        yield n_days, result, portfolio_fill_rate
+
+
+def matrix_chunks(daily_demand, start=None, end=None, chunk_days=365):
+    """
+    Splits a daily demand matrix in consecutive date ranges.
+
+    Args:
+        daily_demand (pd.DataFrame): Daily demand matrix (Date x Product_Code)
+        start (str or pd.Timestamp): First day, defaults to the first date
+        end (str or pd.Timestamp): Last day, defaults to the last date
+        chunk_days (int): Number of days per chunk
+
+    Yields:
+        pd.DataFrame: Daily demand matrix of chunk_days days at most
+    """
+    daily_demand = daily_demand.loc[start:end]
+    for i in range(0, len(daily_demand), chunk_days):
+        yield daily_demand.iloc[i : i + chunk_days]
+
+
+def demand_chunks(df_demand, start, end, chunk_days=365):
+    """
+    Dense daily demand of a date range, built chunk by chunk.
+
+    Args:
+        df_demand (pd.DataFrame): DataFrame with 'Date' and 'Order_Demand' columns
+        start (str or pd.Timestamp): First day
+        end (str or pd.Timestamp): Last day
+        chunk_days (int): Number of days per chunk
+
+    Yields:
+        pd.DataFrame: 'Date' and 'Order_Demand' columns of chunk_days days at
+            most, days without demand are 0
+    """
+    daily = df_demand.groupby("Date")["Order_Demand"].sum().sort_index()
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    while start <= end:
+        stop = min(start + pd.Timedelta(days=chunk_days - 1), end)
+        dates = pd.date_range(start, stop, freq="D")
+        demand = daily.loc[start:stop].reindex(dates, fill_value=0)
+        yield pd.DataFrame({"Date": dates, "Order_Demand": demand.to_numpy()})
+        start = stop + pd.Timedelta(days=1)
+
+
+def simulate_stream(chunks, ss, rop, q, L):
+    """
+    Simulates a (ROP, Q) policy over daily demand read chunk by chunk, see
+    advance_inventory. The inventory and lead time count are carried from one
+    chunk to the next, starting with Q + SS units on hand.
+
+    Args:
+        chunks (iterable): DataFrames of consecutive days with an
+            'Order_Demand' column, see demand_chunks
+        ss (float): Safety stock level
+        rop (float): Reorder point
+        q (float): Order quantity
+        L (int): Lead time in days
+
+    Yields:
+        pd.DataFrame: Every chunk with 'Inventory_Quantity',
+            'Received_Quantity' and 'Lost_Sales' columns
+    """
+    current_inventory = float(q + ss)
+    day_since_trigger_rop = 0
+    for chunk in chunks:
+        demand = chunk["Order_Demand"].to_numpy(dtype=np.float64)
+        rop_values = np.full(len(demand), float(rop))
+        (
+            inventory,
+            receipts,
+            stockouts,
+            current_inventory,
+            day_since_trigger_rop,
+        ) = advance_inventory(
+            demand, rop_values, float(q), int(L), current_inventory, day_since_trigger_rop
+        )
+        yield chunk.assign(
+            Inventory_Quantity=inventory,
+            Received_Quantity=receipts,
+            Lost_Sales=stockouts,
+        )
+
+
+@njit(cache=True)
+def replication_kernel(demand, lead_times, ss, rop, q):
+    """
+    Compiled (ROP, Q) recurrence of many demand paths at once, with the same
+    semantics as inventory_kernel except that every order has its own lead
+    time.
+
+    Args:
+        demand (numpy.ndarray): Demand paths, float64 of shape (days, replications)
+        lead_times (numpy.ndarray): Lead time in days of the successive orders
+            of every replication, int64 of shape (replications, orders)
+        ss (float): Safety stock level
+        rop (float): Reorder point
+        q (float): Order quantity
+
+    Returns:
+        tuple: Inventory level at the start of each day of every replication
+            (days, replications), and the units of demand lost and the days
+            with lost demand of every replication
+    """
+    n_days, n_replications = demand.shape
+    max_orders = lead_times.shape[1]
+    inventory = np.empty((n_days, n_replications))
+    lost = np.zeros(n_replications)
+    stockout_days = np.zeros(n_replications, dtype=np.int64)
+    current_inventory = np.full(n_replications, q + ss)
+    day_since_trigger_rop = np.zeros(n_replications, dtype=np.int64)
+    orders = np.zeros(n_replications, dtype=np.int64)
+
+    for day in range(n_days):
+        for r in range(n_replications):
+            # Check reorder point and handle the lead time of the pending order
+            if current_inventory[r] <= rop:
+                if day_since_trigger_rop[r] == lead_times[r, min(orders[r], max_orders - 1)]:
+                    current_inventory[r] += q
+                    orders[r] += 1
+                    day_since_trigger_rop[r] = 0
+                else:
+                    day_since_trigger_rop[r] += 1
+
+            # Update inventory levels based on demand
+            inventory[day, r] = current_inventory[r]
+            d = demand[day, r]
+            if d > current_inventory[r]:
+                lost[r] += d - current_inventory[r]
+                stockout_days[r] += 1
+                current_inventory[r] = 0.0
+            else:
+                current_inventory[r] -= d
+
+    return inventory, lost, stockout_days
+
+
+def simulate_replications(demand, lead_times, ss, rop, q, n_replications=1000, seed=0):
+    """
+    Simulates a (ROP, Q) policy over synthetic demand paths, see
+    replication_kernel.
+
+    Every path bootstraps the days of the demand history and every order
+    draws its lead time from the observed lead times. Demand and lead times
+    use separate streams spawned from one SeedSequence, so the results are
+    reproducible for a seed.
+
+    Args:
+        demand (array-like): Daily demand history, one path has as many days
+        lead_times (array-like): Observed lead times in days
+        ss (float): Safety stock level
+        rop (float): Reorder point
+        q (float): Order quantity
+        n_replications (int): Number of demand paths
+        seed (int): Seed of the SeedSequence
+
+    Returns:
+        tuple: One row per replication with 'Fill_Rate' (share of demand
+            served from stock), 'Stockout_Days', 'Lost_Sales' and
+            'Avg_Inventory', and the inventory level of every day of every
+            replication (days, replications)
+    """
+    demand = np.asarray(demand, dtype=np.float64)
+    lead_times = np.asarray(lead_times, dtype=float)
+    lead_times = np.rint(lead_times[~np.isnan(lead_times)]).clip(min=0).astype(np.int64)
+    demand_stream, lead_time_stream = (
+        np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(2)
+    )
+
+    paths = demand_stream.choice(demand, size=(len(demand), n_replications))
+    # At most one order is received per day
+    lead_time_draws = lead_time_stream.choice(
+        lead_times, size=(n_replications, max(len(demand), 1))
+    )
+    inventory, lost, stockout_days = replication_kernel(
+        paths, lead_time_draws, float(ss), float(rop), float(q)
+    )
+
+    total_demand = np.clip(paths, 0, None).sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fill = np.where(total_demand > 0, 1 - lost / total_demand, np.nan)
+    result = pd.DataFrame(
+        {
+            "Fill_Rate": fill,
+            "Stockout_Days": stockout_days,
+            "Lost_Sales": lost,
+            "Avg_Inventory": inventory.mean(axis=0),
+        }
+    )
+    return result, inventory
+
+
+def confidence_bands(values, level=0.90, axis=0):
+    """
+    Median and central interval of simulated outcomes.
+
+    Args:
+        values (array-like): Outcomes, e.g. of every replication
+        level (float): Share of the outcomes within the band
+        axis (int): Axis of the replications
+
+    Returns:
+        tuple: Lower bound, median and upper bound
+    """
+    lower, median, upper = np.nanquantile(
+        values, [(1 - level) / 2, 0.5, (1 + level) / 2], axis=axis
+    )
+    return lower, median, upper
+
+
+def mean_confidence_interval(values, level=0.95):
+    """
+    Confidence interval of the mean of replications (normal approximation).
+
+    Args:
+        values (array-like): Outcome of every replication
+        level (float): Confidence level
+
+    Returns:
+        tuple: Mean and half width of the interval
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    if len(values) < 2:
+        return (values.mean() if len(values) else np.nan), np.nan
+    z = stats.norm.ppf((1 + level) / 2)
+    return values.mean(), z * values.std(ddof=1) / np.sqrt(len(values))
+
+
+def fill_rate(demand, inventory):
+    """
+    Ratio of the inventory available to the demand over the days with demand, capped at 1.
+
+    Args:
+        demand (array-like): Daily demand
+        inventory (array-like): Daily inventory level
+
+    Returns:
+        float: Fill rate, 0.0 when there is no positive demand
+    """
+    demand = np.asarray(demand, dtype=float)
+    inventory = np.asarray(inventory, dtype=float)
+    has_demand = demand > 0
+    total_demand = demand[has_demand].sum()
+    if total_demand <= 0:
+        return 0.0
+    return min(inventory[has_demand].sum() / total_demand, 1.0)
@@ -0,0 +1,164 @@
+"""Bounded LRU cache of simulation results"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+# Default size of the cache, in bytes of the cached results
+MAX_BYTES = 64 * 1024**2
+
+
+def result_size(value):
+    """
+    Memory used by a cached result.
+
+    Args:
+        value: Cached result, a DataFrame, an array or any object
+
+    Returns:
+        int: Size in bytes
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, tuple):
+        return sum(result_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+def simulation_key(product, year, ss, rop, q, L, fingerprint):
+    """
+    Cache key of a simulation. A time-varying reorder point is replaced by
+    the digest of its values so that the key stays small and hashable.
+
+    Args:
+        product (str): Product code
+        year (int): Simulated year
+        ss (float): Safety stock level
+        rop (float or array-like): Reorder point, a scalar or one value per day
+        q (float): Order quantity
+        L (int): Lead time in days
+        fingerprint (str): Fingerprint of the demand data, see
+            core.utils.data_fingerprint
+
+    Returns:
+        tuple: Hashable key
+    """
+    if np.ndim(rop) > 0:
+        values = np.ascontiguousarray(rop, dtype=float)
+        rop = hashlib.sha1(values.tobytes()).hexdigest()
+    else:
+        rop = float(rop)
+    return (product, int(year), float(ss), rop, float(q), int(L), fingerprint)
+
+
+class SimulationCache:
+    """
+    Least recently used cache of simulation results bounded by the memory of
+    the results. Once the size goes over max_bytes, the least recently used
+    results are evicted. Safe to share between threads (sessions).
+    """
+
+    def __init__(self, max_bytes=MAX_BYTES):
+        """
+        Args:
+            max_bytes (int): Maximum total size of the cached results in bytes
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """
+        Cached result of a key, which becomes the most recently used.
+
+        Args:
+            key (tuple): Cache key, see simulation_key
+            default: Returned when the key is not cached
+
+        Returns:
+            Cached result or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        """
+        Caches a result and evicts the least recently used results over the
+        size limit. A result larger than the whole cache is not kept.
+
+        Args:
+            key (tuple): Cache key, see simulation_key
+            value: Result to cache
+        """
+        size = result_size(value)
+        with self._lock:
+            if key in self._entries:
+                self.size -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self.size += size
+            while self.size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.size -= evicted
+
+    def get_or_compute(self, key, compute):
+        """
+        Cached result of a key, computed and cached on a miss.
+
+        Args:
+            key (tuple): Cache key, see simulation_key
+            compute (callable): Function without arguments returning the result
+
+        Returns:
+            Cached or computed result
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """Removes all cached results and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Usage of the cache.
+
+        Returns:
+            dict: 'Entries', 'Bytes', 'Hits', 'Misses' and 'Hit_Rate'
+        """
+        lookups = self.hits + self.misses
+        return {
+            "Entries": len(self._entries),
+            "Bytes": self.size,
+            "Hits": self.hits,
+            "Misses": self.misses,
+            "Hit_Rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,120 @@
+"""Demand and lead time statistics"""
+
+import pandas as pd
+
+# Number of days in one time unit
+TIME_UNIT_DAYS = {"Days": 1, "Weeks": 7, "Months": 30}
+
+# Number of time units in one year
+TIME_UNITS_PER_YEAR = {"Days": 365, "Weeks": 52, "Months": 12}
+
+
+def group_data_by_time_unit(df, time_unit):
+    """
+    Groups the data by time unit (Days, Weeks, or Months) and calculates sum of Order_Demand.
+
+    Args:
+        df (pandas.DataFrame): Input DataFrame containing 'Date' and 'Order_Demand' columns
+        time_unit (str): 'Days', 'Weeks' or 'Months'
+
+    Returns:
+        pandas.DataFrame: Grouped DataFrame with date/time unit and aggregated Order_Demand
+    """
+    df = df[["Date", "Order_Demand"]]
+
+    if time_unit == "Days":
+        df = df.groupby("Date").sum().reset_index()
+
+    elif time_unit == "Weeks":
+        df = df.assign(Week=df["Date"].dt.isocalendar().week)
+        df = df[["Week", "Order_Demand"]]
+        df = df.groupby("Week").sum().reset_index()
+
+    elif time_unit == "Months":
+        df = df.assign(Month=df["Date"].dt.month)
+        df = df[["Month", "Order_Demand"]]
+        df = df.groupby("Month").sum().reset_index()
+
+    df.columns = ["Date", "Order_Demand"]
+    return df
+
+
+def sd_demand(df, time_unit):
+    """
+    Calculates standard deviation of demand per time unit after removing outliers.
+
+    Args:
+        df (pandas.DataFrame): Input DataFrame with 'Date' and 'Order_Demand' columns
+        time_unit (str): 'Days', 'Weeks' or 'Months'
+
+    Returns:
+        float: Standard deviation of demand rounded to 1 decimal place
+    """
+    df = remove_outliers_iqr(df, "Order_Demand")
+    df_grouped = group_data_by_time_unit(df, time_unit)
+    return round(df_grouped["Order_Demand"].std(), 1)
+
+
+def avg_demand(df, time_unit):
+    """
+    Calculates average demand per time unit over one year.
+
+    Args:
+        df (pandas.DataFrame): Input DataFrame with 'Order_Demand' column
+        time_unit (str): 'Days', 'Weeks' or 'Months'
+
+    Returns:
+        int: Rounded average demand for the time unit
+    """
+    return round(df["Order_Demand"].sum() / TIME_UNITS_PER_YEAR[time_unit])
+
+
+def sd_lead_time(df, time_unit):
+    """
+    Calculates standard deviation of lead time, converting days to the time unit.
+
+    Args:
+        df (pandas.DataFrame): Input DataFrame with 'Lead_Time_Days' column
+        time_unit (str): 'Days', 'Weeks' or 'Months'
+
+    Returns:
+        float: Standard deviation of lead time rounded to 2 decimal places
+    """
+    lead_time = df["Lead_Time_Days"] / TIME_UNIT_DAYS[time_unit]
+    return round(lead_time.std(), 2)
+
+
+def avg_lead_time(df, time_unit):
+    """
+    Calculates average lead time, converting days to the time unit.
+
+    Args:
+        df (pandas.DataFrame): Input DataFrame with 'Lead_Time_Days' column
+        time_unit (str): 'Days', 'Weeks' or 'Months'
+
+    Returns:
+        float: Average lead time rounded to 2 decimal places
+    """
+    lead_time = df["Lead_Time_Days"] / TIME_UNIT_DAYS[time_unit]
+    return round(lead_time.mean(), 2)
+
+
+def remove_outliers_iqr(df, column):
+    """
+    Removes outliers from specified column using the Interquartile Range (IQR) method.
+    Values outside 1.5 * IQR below Q1 or above Q3 are considered outliers.
+
+    Args:
+        df (pandas.DataFrame): Input DataFrame
+        column (str): Name of the column to remove outliers from
+
+    Returns:
+        pandas.DataFrame: DataFrame with outliers removed
+    """
+    Q1 = df[column].quantile(0.25)
+    Q3 = df[column].quantile(0.75)
+    IQR = Q3 - Q1
+    lower_bound = Q1 - 1.5 * IQR
+    upper_bound = Q3 + 1.5 * IQR
+
+    return df[(df[column] >= lower_bound) & (df[column] <= upper_bound)]
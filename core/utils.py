@@ -0,0 +1,21 @@
+"""Utilities shared by the computation core"""
+
+import hashlib
+import pandas as pd
+
+
+def data_fingerprint(df):
+    """
+    Computes a fingerprint of a DataFrame's content, index and column names.
+    Used as a cache key so results are recomputed only when the data changes.
+
+    Args:
+        df (pandas.DataFrame): Input DataFrame
+
+    Returns:
+        str: Hexadecimal SHA-1 digest of the data
+    """
+    digest = hashlib.sha1()
+    digest.update(str(list(df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
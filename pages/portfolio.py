@@ -0,0 +1,45 @@
+"""Portfolio page"""
+
+import streamlit as st
+from components import dataset, portfolio
+
+
+def main():
+    """
+    Portfolio page that analyses all products of the dataset at once.
+    """
+    st.title("Portfolio")
+    st.markdown("Analysis of all products of the data chosen on the Home page.")
+
+    # The data option is chosen in the Home page sidebar
+    if "data_option" not in st.session_state:
+        st.session_state["data_option"] = None
+    data = dataset.Dataset()
+    lead_time_data = dataset.DatasetLeadTime().data
+
+    with st.expander("ABC / XYZ Classification", expanded=True):
+        portfolio.abc_xyz(data.daily_demand)
+
+    with st.expander("Demand Patterns"):
+        portfolio.demand_patterns(data.daily_demand)
+
+    with st.expander("Safety Stock and Reorder Point"):
+        portfolio.safety_stock(data, lead_time_data)
+
+    with st.expander("Economic Order Quantity"):
+        portfolio.order_quantity(data.daily_demand)
+
+    with st.expander("Joint Replenishment"):
+        portfolio.joint_replenishment(data.data)
+
+    with st.expander("Inventory Simulation"):
+        portfolio.inventory_simulation(data, lead_time_data)
+
+    with st.expander("ROP / Q Optimization"):
+        portfolio.policy_optimization(data, lead_time_data)
+
+    with st.expander("Warehouse Network Simulation"):
+        portfolio.network_simulation(data.data, lead_time_data)
+
+
+main()
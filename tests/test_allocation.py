@@ -0,0 +1,75 @@
+import itertools
+import pytest
+import numpy as np
+import pandas as pd
+from core.allocation import *
+from core.safety_stock import standard_normal_loss
+
+
+def test_allocate_safety_stock_respects_budget():
+    sd = np.array([100.0, 50.0, 10.0])
+    result = allocate_safety_stock(sd, 2.0, 300.0)
+    assert result["Holding_Cost"].sum() <= 300.0
+    assert (result["SS"] == result["Safety_Factor"] * sd).all()
+
+
+def test_allocate_safety_stock_zero_budget():
+    result = allocate_safety_stock([100.0, 50.0], 1.0, 0.0)
+    assert (result["SS"] == 0).all()
+    assert result["Expected_Shortage"].to_numpy() == pytest.approx(
+        np.array([100.0, 50.0]) * standard_normal_loss(0.0)
+    )
+
+
+def test_allocate_safety_stock_prefers_weighted_products():
+    result = allocate_safety_stock([10.0, 10.0], 1.0, 20.0, shortage_weights=[1, 10])
+    assert result["SS"].iloc[1] > result["SS"].iloc[0]
+
+
+def test_allocate_safety_stock_large_budget_caps_safety_factor():
+    result = allocate_safety_stock([10.0, 20.0], 1.0, 1e9, max_safety_factor=2.0)
+    assert result["Safety_Factor"].to_numpy() == pytest.approx([2.0, 2.0])
+
+
+def test_allocate_safety_stock_matches_brute_force():
+    sd = np.array([30.0, 10.0, 20.0])
+    H = np.array([1.0, 3.0, 0.5])
+    weights = np.array([2.0, 5.0, 1.0])
+    step, max_k, budget = 0.5, 2.0, 40.0
+    result = allocate_safety_stock(sd, H, budget, weights, step, max_k)
+
+    # Equal step costs per product make the greedy optimal
+    ks = np.arange(0, max_k + step / 2, step)
+    best = np.inf
+    for k in itertools.product(ks, repeat=3):
+        k = np.array(k)
+        if (H * sd * k).sum() <= budget + 1e-9:
+            best = min(best, (weights * sd * standard_normal_loss(k)).sum())
+    assert result["Expected_Shortage"].sum() == pytest.approx(best, rel=0.02)
+
+
+def test_allocate_safety_stock_zero_sd():
+    result = allocate_safety_stock([0.0, np.nan, 10.0], 1.0, 10.0)
+    assert (result["SS"].iloc[:2] == 0).all()
+    assert result["SS"].iloc[2] > 0
+
+
+def test_portfolio_allocation():
+    inputs = pd.DataFrame(
+        {
+            "avg_sales": [100.0, 10.0],
+            "demand_sd": [20.0, 5.0],
+            "avg_lead_time": [10.0, 10.0],
+            "sd_lead_time": [2.0, np.nan],
+        },
+        index=pd.Index(["P1", "P2"], name="Product_Code"),
+    )
+    result, fill_rate = portfolio_allocation(inputs, 1.0, 500.0)
+    assert list(result.index) == ["P1", "P2"]
+    assert result["Holding_Cost"].sum() <= 500.0
+    assert 0 < fill_rate <= 1
+    assert (result["Fill_Rate"] <= 1).all()
+
+    result, fill_rate = portfolio_allocation(inputs, 1.0, 500.0, "Expected shortages")
+    assert fill_rate is None
+    assert "Fill_Rate" not in result
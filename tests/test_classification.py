@@ -0,0 +1,117 @@
+import pytest
+import numpy as np
+import pandas as pd
+from core.classification import *
+from components.classification import portfolio_abc_xyz, portfolio_demand_patterns
+
+
+@pytest.fixture
+def matrix():
+    """Create a daily demand matrix with products of decreasing volume"""
+    dates = pd.date_range(start='2023-01-01', end='2023-12-31', freq='D')
+    rng = np.random.default_rng(0)
+    lumpy = np.where(rng.random(len(dates)) < 0.03, 500.0, 0.0)
+    return pd.DataFrame(
+        {
+            'Big': np.full(len(dates), 1000.0),
+            'Medium': np.full(len(dates), 150.0),
+            'Small': rng.normal(50, 10, len(dates)).clip(0),
+            'Lumpy': lumpy,
+            'Tiny': np.full(len(dates), 1.0),
+        },
+        index=pd.DatetimeIndex(dates, name='Date'),
+    )
+
+
+def test_abc_xyz_classification(matrix):
+    result = abc_xyz_classification(matrix)
+
+    assert list(result.index) == list(matrix.columns)
+    assert result.loc['Big', 'ABC'] == 'A'
+    assert result.loc['Medium', 'ABC'] == 'B'
+    assert result.loc['Tiny', 'ABC'] == 'C'
+    assert result.loc['Big', 'XYZ'] == 'X'
+    assert result.loc['Lumpy', 'XYZ'] == 'Z'
+    assert result.loc['Big', 'Class'] == 'AX'
+    assert result['Volume_Share'].sum() == pytest.approx(1.0)
+    assert result['Cumulative_Share'].max() == pytest.approx(1.0)
+
+
+def test_abc_xyz_annual_volume(matrix):
+    result = abc_xyz_classification(matrix)
+    assert result.loc['Big', 'Annual_Volume'] == 365000
+
+
+def test_abc_xyz_ignores_returns():
+    dates = pd.date_range(start='2023-01-01', periods=14, freq='D')
+    matrix = pd.DataFrame({'A': [-5.0] * 14, 'B': [10.0] * 14}, index=dates)
+    result = abc_xyz_classification(matrix)
+    assert result.loc['A', 'Annual_Volume'] == 0
+    assert result.loc['A', 'XYZ'] == 'Z'
+    assert result.loc['B', 'ABC'] == 'A'
+
+
+def test_portfolio_abc_xyz(matrix):
+    first = portfolio_abc_xyz(matrix)
+    second = portfolio_abc_xyz(matrix.copy())
+    pd.testing.assert_frame_equal(first, second)
+
+
+@pytest.fixture
+def pattern_matrix():
+    """Create daily demand matrix with one product of each demand pattern"""
+    dates = pd.date_range(start='2023-01-01', periods=400, freq='D')
+    rng = np.random.default_rng(1)
+    every_day = np.ones(len(dates), dtype=bool)
+    sparse = rng.random(len(dates)) < 0.1
+    regular_sizes = rng.normal(100, 10, len(dates))
+    variable_sizes = rng.lognormal(3, 1.5, len(dates))
+    return pd.DataFrame(
+        {
+            'Smooth': np.where(every_day, regular_sizes, 0),
+            'Erratic': np.where(every_day, variable_sizes, 0),
+            'Intermittent': np.where(sparse, regular_sizes, 0),
+            'Lumpy': np.where(sparse, variable_sizes, 0),
+            'None': np.zeros(len(dates)),
+        },
+        index=pd.DatetimeIndex(dates, name='Date'),
+    )
+
+
+def test_demand_pattern_classification(pattern_matrix):
+    result = demand_pattern_classification(pattern_matrix)
+
+    assert result['Pattern'].tolist() == ['smooth', 'erratic', 'intermittent', 'lumpy', 'no demand']
+    assert result.loc['Smooth', 'ADI'] == pytest.approx(1.0)
+    assert result.loc['Intermittent', 'ADI'] > ADI_CUTOFF
+    assert result.loc['Smooth', 'CV2'] < CV2_CUTOFF
+    assert result.loc['None', 'Demand_Days'] == 0
+
+
+def test_demand_pattern_cv2():
+    dates = pd.date_range(start='2023-01-01', periods=4, freq='D')
+    matrix = pd.DataFrame({'A': [0.0, 2.0, 0.0, 4.0]}, index=dates)
+    result = demand_pattern_classification(matrix)
+    assert result.loc['A', 'ADI'] == 2
+    assert result.loc['A', 'CV2'] == pytest.approx(1 / 9)
+
+
+def test_portfolio_demand_patterns(pattern_matrix):
+    result = portfolio_demand_patterns(pattern_matrix)
+    assert len(result) == 5
+
+
+@pytest.mark.parametrize("pattern,expected", [
+    (None, ['Naive Drift', '3-Days Moving Average', 'ARIMA', 'Croston (SBA)', 'Random Forest']),
+    ('smooth', ['Naive Drift', '3-Days Moving Average', 'ARIMA', 'Croston (SBA)', 'Random Forest']),
+    ('lumpy', ['Naive Drift', '3-Days Moving Average', 'Croston (SBA)']),
+    ('intermittent', ['Naive Drift', '3-Days Moving Average', 'Croston (SBA)']),
+    ('no demand', ['Naive Drift', '3-Days Moving Average']),
+])
+def test_suitable_models(pattern, expected):
+    models = ['Naive Drift', '3-Days Moving Average', 'ARIMA', 'Croston (SBA)', 'Random Forest']
+    assert suitable_models(pattern, models) == expected
+
+
+def test_auto_fitted_models_excluded_from_intermittent_demand():
+    assert suitable_models('intermittent', ['Exponential Smoothing', 'Naive Drift']) == ['Naive Drift']
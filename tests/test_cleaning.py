@@ -0,0 +1,91 @@
+import pytest
+import pandas as pd
+import numpy as np
+from core.cleaning import *
+
+
+@pytest.fixture
+def sample_df():
+    """Create transactions for two products with one spike each"""
+    dates = pd.date_range(start='2023-01-01', periods=60, freq='D')
+    rng = np.random.default_rng(0)
+    demand_a = rng.integers(90, 110, size=len(dates))
+    demand_b = rng.integers(40, 60, size=len(dates))
+    demand_a[30] = 5000
+    demand_b[10] = 3000
+    df_a = pd.DataFrame({'Date': dates, 'Product_Code': 'A', 'Order_Demand': demand_a})
+    df_b = pd.DataFrame({'Date': dates, 'Product_Code': 'B', 'Order_Demand': demand_b})
+    # Drop a day of product B to check the matrix is dense
+    df_b = df_b.drop(index=20)
+    return pd.concat([df_a, df_b], ignore_index=True)
+
+
+def test_daily_demand_matrix(sample_df):
+    matrix = daily_demand_matrix(sample_df)
+    assert matrix.shape == (60, 2)
+    assert list(matrix.columns) == ['A', 'B']
+    assert matrix['B'].iloc[20] == 0
+    assert matrix.to_numpy().sum() == sample_df['Order_Demand'].sum()
+
+
+def test_daily_demand_matrix_sums_transactions():
+    df = pd.DataFrame({
+        'Date': pd.to_datetime(['2023-01-01', '2023-01-01', '2023-01-03']),
+        'Product_Code': ['A', 'A', 'A'],
+        'Order_Demand': [10, 5, 7],
+    })
+    matrix = daily_demand_matrix(df)
+    assert matrix['A'].tolist() == [15, 0, 7]
+
+
+def test_daily_demand_matrix_empty():
+    df = pd.DataFrame(columns=['Date', 'Product_Code', 'Order_Demand'])
+    matrix = daily_demand_matrix(df)
+    assert matrix.empty
+
+
+def test_warehouse_demand_matrix():
+    df = pd.DataFrame({
+        'Date': pd.to_datetime(['2023-01-01', '2023-01-01', '2023-01-01', '2023-01-03']),
+        'Warehouse': ['W1', 'W1', 'W2', 'W2'],
+        'Product_Code': ['A', 'A', 'A', 'B'],
+        'Order_Demand': [10, 5, 7, 3],
+    })
+    matrix = warehouse_demand_matrix(df)
+    assert list(matrix.columns) == [('W1', 'A'), ('W2', 'A'), ('W2', 'B')]
+    assert matrix[('W1', 'A')].tolist() == [15, 0, 0]
+    assert matrix[('W2', 'B')].tolist() == [0, 0, 3]
+    assert warehouse_demand_matrix(df.iloc[:0]).empty
+
+
+def test_hampel_filter_replaces_spikes(sample_df):
+    matrix = daily_demand_matrix(sample_df)
+    cleaned = hampel_filter(matrix)
+    assert cleaned.shape == matrix.shape
+    assert cleaned['A'].iloc[30] < 200
+    assert cleaned['B'].iloc[10] < 100
+    # Regular values are kept as they are
+    assert cleaned['A'].iloc[5] == matrix['A'].iloc[5]
+
+
+def test_hampel_filter_keeps_intermittent_demand():
+    matrix = pd.DataFrame({'A': [0, 0, 0, 50, 0, 0, 0, 0, 80, 0, 0, 0]}, dtype=float)
+    cleaned = hampel_filter(matrix, window=5)
+    pd.testing.assert_frame_equal(cleaned, matrix)
+
+
+def test_clean_daily_demand(sample_df):
+    raw, cleaned = clean_daily_demand(sample_df)
+    assert raw.shape == cleaned.shape
+    assert raw['A'].iloc[30] == 5000
+    assert cleaned['A'].iloc[30] < 200
+
+
+def test_product_daily_demand(sample_df):
+    raw, _ = clean_daily_demand(sample_df)
+    df = product_daily_demand(raw, 'B')
+    assert list(df.columns) == ['Date', 'Order_Demand']
+    assert len(df) == 60
+
+    missing = product_daily_demand(raw, 'Z')
+    assert missing.empty
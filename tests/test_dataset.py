@@ -143,6 +143,16 @@ class TestDatasetLeadTime:
         assert all(processed_df['Product_Code'] == 'A001')
         assert all(processed_df['Received_Date'].dt.year == 2023)
 
+    def test_prepare_data_without_filters(self, mock_lead_time_data, mock_st, monkeypatch):
+        """Test that no filters keeps the lead times of all products"""
+        monkeypatch.setattr(st, "session_state", mock_st.session_state)
+
+        dataset = DatasetLeadTime({"Product_Code": ["A001"], "Year": [2023]})
+        processed_df = dataset.prepare_data(mock_lead_time_data, None)
+
+        assert len(processed_df) == 3
+        assert set(processed_df['Product_Code']) == {'A001', 'B002'}
+
     def test_empty_data_handling(self, mock_st, monkeypatch):
         """Test handling of empty dataset"""
         monkeypatch.setattr(st, "session_state", mock_st.session_state)
@@ -0,0 +1,62 @@
+import pytest
+import numpy as np
+import pandas as pd
+from core.event_simulation import *
+
+
+def test_simulate_events_fixed_lead_time():
+    events = simulate_events([5] * 8, 0, 10, 20, [2])
+    orders = events.loc[events["Event"] == "Order"]
+    receipts = events.loc[events["Event"] == "Receipt"]
+    assert orders["Day"].tolist() == [1, 5]
+    assert receipts["Day"].tolist() == [3, 7]
+    # Receipts arrive before the demand of their day
+    day_3 = events.loc[events["Day"] == 3, "Event"].tolist()
+    assert day_3 == ["Receipt", "Demand"]
+    assert (events["Inventory_Position"] == events["On_Hand"] + events["On_Order"] - events["Backorders"]).all()
+
+
+def test_simulate_events_multiple_outstanding_orders():
+    # Q smaller than the lead time demand keeps several orders outstanding
+    events = simulate_events([10] * 30, 0, 50, 10, [6])
+    summary = event_summary(events, [10] * 30)
+    assert summary["Max_Outstanding_Orders"] > 1
+    assert (events["On_Order"] >= 0).all()
+
+
+def test_simulate_events_backorders_and_lost_sales():
+    demand = [30, 0, 0, 0, 0]
+    events = simulate_events(demand, 0, 0, 10, [2])
+    assert events["Backorders"].max() == 20
+    # The receipt of day 2 fills backorders first
+    receipt = events.loc[events["Event"] == "Receipt"].iloc[0]
+    assert receipt["Day"] == 2
+    assert receipt["On_Hand"] == 0
+    assert receipt["Backorders"] == 10
+
+    events = simulate_events(demand, 0, 0, 10, [2], backorders=False)
+    assert events["Backorders"].max() == 0
+    assert events.loc[events["Event"] == "Lost Sale", "Quantity"].sum() == 20
+    assert event_summary(events, demand)["Fill_Rate"] == pytest.approx(10 / 30)
+
+
+def test_simulate_events_sampled_lead_times():
+    events = simulate_events([10] * 200, 0, 40, 30, [1, 5, 9], seed=1)
+    orders = events.loc[events["Event"] == "Order"]
+    receipts = events.loc[events["Event"] == "Receipt"]
+    assert len(receipts) <= len(orders)
+    # Reproducible with the same seed
+    pd.testing.assert_frame_equal(events, simulate_events([10] * 200, 0, 40, 30, [1, 5, 9], seed=1))
+
+
+def test_simulate_events_invalid_inputs():
+    with pytest.raises(ValueError):
+        simulate_events([5, 5], 0, 10, 0, [2])
+    with pytest.raises(ValueError):
+        simulate_events([5, 5], 0, 10, 20, [np.nan])
+
+
+def test_daily_states():
+    events = simulate_events([0, 0, 5, 0], 10, 0, 20, [1])
+    states = daily_states(events, 4)
+    assert states["On_Hand"].tolist() == [30, 30, 25, 25]
@@ -45,6 +45,22 @@ def test_selectbox_forecast_model(mock_streamlit_col):
     assert 'forecast_model' in st.session_state
     assert st.session_state['forecast_model'] == 'Naive Drift'
 
+def test_selectbox_forecast_model_options_by_demand_pattern():
+    class MockCol:
+        def selectbox(self, label, options, key=None, index=None):
+            self.options = options
+            return options[-1]
+
+    col = MockCol()
+    st.session_state['forecast_horizon'] = 'Week'
+    st.session_state['demand_pattern'] = 'lumpy'
+
+    selectbox_forecast_model(col, key='test')
+    assert 'Random Forest' not in col.options
+    assert 'ARIMA' not in col.options
+    assert '3-Weeks Moving Average' in col.options
+    assert st.session_state['forecast_model'] == col.options[-1]
+
 def test_selectbox_forecast_horizon(mock_streamlit_col):
     selectbox_forecast_horizon(mock_streamlit_col, key='test')
     assert 'forecast_horizon' in st.session_state
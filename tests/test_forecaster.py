@@ -160,6 +160,28 @@ class TestHistoricalForecaster(TestForecasterBase):
       assert isinstance(results['MAPE'], str)
       assert results['MAPE'].endswith('%')
 
+    def test_scores_on_common_dates(self, mock_session_state, monkeypatch):
+      """Test that forecasts are scored on the dates they share with the actuals."""
+      # In a leap year the backtest starts one day before the actuals
+      dates = pd.date_range(start='2024-01-01', end='2025-12-31', freq='D')
+      df = pd.DataFrame({
+          'Date': dates,
+          'Order_Demand': np.random.randint(1, 100, size=len(dates)),
+      })
+      monkeypatch.setitem(st.session_state, 'year', 2024)
+      baseline = BaselineForecaster(df)
+
+      actual = baseline.actual_series.pd_dataframe()["Value"]
+      predicted = baseline.predicted_series.pd_dataframe()["Value"]
+      assert predicted.index[0] < actual.index[0]
+
+      common = actual.index.intersection(predicted.index)
+      errors = predicted[common] - actual[common]
+      assert st.session_state['mae_baseline'] == round(errors.abs().mean())
+      assert st.session_state['mape_baseline'] == round(
+          (errors / actual[common]).abs().mean() * 100
+      )
+
     @pytest.mark.parametrize("pattern", ['constant', 'linear_trend', 'random'])
     def test_different_patterns(self, sample_df, mock_session_state, pattern):
         """Test forecaster with different data patterns."""
@@ -249,6 +271,39 @@ class TestErrorHandling:
             f"Found negative values: {timeseries_values[timeseries_values < 0]}"
 
 
+# ============= Demand Pattern Routing Tests ============= #
+
+class TestDemandPatternRouting:
+    """Test class for restricting models to the demand pattern."""
+
+    @pytest.fixture(autouse=True)
+    def demand_pattern(self, mock_session_state):
+        st.session_state["demand_pattern"] = "lumpy"
+        yield
+        del st.session_state["demand_pattern"]
+        st.session_state["forecast_model"] = "Naive Drift"
+
+    def test_expensive_model_is_routed(self, sample_df):
+        """Test a grid searched model is replaced on lumpy demand."""
+        df, _ = sample_df
+        st.session_state["forecast_model"] = "Random Forest"
+
+        forecaster = Forecaster(df)
+
+        assert st.session_state["forecast_model"] == "Croston (SBA)"
+        assert forecaster.model.__class__.__name__ == "CrostonSBA"
+        assert len(forecaster.predicted_series) > 0
+
+    def test_suitable_model_is_kept(self, sample_df):
+        """Test a model suited to the pattern is used as selected."""
+        df, _ = sample_df
+        st.session_state["forecast_model"] = "Naive Drift"
+
+        forecaster = Forecaster(df)
+
+        assert st.session_state["forecast_model"] == "Naive Drift"
+        assert forecaster.model.__class__.__name__ == "NaiveDrift"
+
 # ============= Integration Tests ============= #
 
 @pytest.mark.integration
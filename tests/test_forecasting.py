@@ -0,0 +1,105 @@
+import pytest
+import numpy as np
+import pandas as pd
+from core.forecasting import *
+
+
+@pytest.fixture
+def sample_df():
+    """Create transactions with a gap and a negative adjustment"""
+    return pd.DataFrame({
+        'Date': pd.to_datetime(['2023-01-01', '2023-01-01', '2023-01-03', '2023-01-05', '2024-01-01']),
+        'Order_Demand': [10, 5, -3, 7, 100],
+    })
+
+
+def test_prepare_timeseries(sample_df):
+    series = prepare_timeseries(sample_df, '2023-01-01', '2023-01-05')
+    assert len(series) == 5
+    assert series.values().flatten().tolist() == [15, 0, 0, 0, 7]
+
+
+@pytest.mark.parametrize('horizon,expected', [('Day', 1), ('Week', 7), ('Month', 30)])
+def test_forecast_horizon_days(horizon, expected):
+    assert forecast_horizon_days(horizon) == expected
+
+
+def test_build_model():
+    assert build_model('Naive Drift').__class__.__name__ == 'NaiveDrift'
+    assert build_model('Croston (SBA)').__class__.__name__ == 'CrostonSBA'
+    assert build_model('Random Forest') is None
+
+
+def test_param_grid():
+    grid = param_grid('Linear Regression', 7)
+    assert grid['output_chunk_length'] == [7]
+    assert param_grid('Naive Drift', 7) is None
+
+
+def test_forecast_scores():
+    bias, mae, mape = forecast_scores([10, 0, 20], [12, 3, 15])
+    assert bias == 0
+    assert mae == round(10 / 3)
+    # MAPE ignores the day without actual demand
+    assert mape == round((0.2 + 0.25) / 2 * 100)
+
+
+def test_forecast_scores_without_demand():
+    bias, mae, mape = forecast_scores([0, 0], [1, 3])
+    assert (bias, mae) == (2, 2)
+    assert np.isnan(mape)
+
+
+@pytest.fixture
+def two_year_df():
+    dates = pd.date_range('2023-01-01', '2024-12-31', freq='D')
+    return pd.DataFrame({
+        'Date': dates,
+        'Order_Demand': np.random.default_rng(0).integers(1, 100, len(dates)),
+    })
+
+
+@pytest.mark.parametrize('horizon', ['Day', 'Week'])
+def test_historical_forecast(two_year_df, horizon):
+    series = prepare_timeseries(two_year_df, '2023-01-01', '2024-12-31')
+    predicted, actual = historical_forecast(series, 'Naive Drift', 2023, horizon)
+
+    # Every day of the next year is forecast
+    assert actual.start_time() == pd.Timestamp('2024-01-01')
+    assert predicted.start_time() == pd.Timestamp('2024-01-01')
+    assert predicted.end_time() == actual.end_time()
+
+
+def test_select_model_grid_search(two_year_df):
+    series = prepare_timeseries(two_year_df, '2023-01-01', '2024-12-31')
+    model, best_params = select_model('Linear Regression', series, 2023, 7)
+    assert best_params['lags'] in param_grid('Linear Regression', 7)['lags']
+    assert select_model('Naive Drift', series, 2023, 7)[1] is None
+
+
+def test_future_forecast(two_year_df):
+    series = prepare_timeseries(two_year_df, '2023-01-01', '2023-12-31')
+    predicted = future_forecast(series, 'Naive Drift', 2023, 'Week')
+    assert len(predicted) == 7
+    assert predicted.start_time() == pd.Timestamp('2024-01-01')
+
+
+def test_portfolio_forecast_scores(two_year_df):
+    df = pd.concat([
+        two_year_df.assign(Product_Code='A'),
+        two_year_df.assign(Product_Code='B', Order_Demand=two_year_df['Order_Demand'] * 2),
+    ])
+    scores = portfolio_forecast_scores(df, 'Naive Drift', 2023, 'Day', n_workers=1)
+    assert scores.index.tolist() == ['A', 'B']
+    assert scores.columns.tolist() == ['Bias', 'MAE', 'MAPE']
+
+    series = prepare_timeseries(two_year_df, '2023-01-01', '2024-12-31')
+    predicted, actual = historical_forecast(series, 'Naive Drift', 2023, 'Day')
+    actual_values, predicted_values = actual.pd_series().align(
+        predicted.pd_series(), join='inner'
+    )
+    assert tuple(scores.loc['A']) == forecast_scores(actual_values, predicted_values)
+
+    # Same scores from a process pool
+    parallel = portfolio_forecast_scores(df, 'Naive Drift', 2023, 'Day', n_workers=2)
+    pd.testing.assert_frame_equal(parallel, scores)
@@ -122,34 +122,49 @@ def test_input_stockout_cost(mock_streamlit):
     )
 
 def test_input_ss(mock_streamlit):
-    mock_col, _ = mock_streamlit
+    mock_col, mock_state = mock_streamlit
     result = input_ss(mock_col, key="test_key")
     
+    # The value of a keyed input starts at 0 in session state
     mock_col.number_input.assert_called_with(
         "Specify Safety Stock (SS)",
-        value=0,
+        step=1,
         key="test_key"
     )
+    assert mock_state["test_key"] == 0
     assert result == mock_col.number_input.return_value
 
+    input_ss(mock_col)
+    mock_col.number_input.assert_called_with("Specify Safety Stock (SS)", value=0)
+
 def test_input_rop(mock_streamlit):
-    mock_col, _ = mock_streamlit
+    mock_col, mock_state = mock_streamlit
     result = input_rop(mock_col, key="test_key")
     
+    # The value of a keyed input starts at 0 in session state
     mock_col.number_input.assert_called_with(
         "Specify Reorder Point (ROP)",
-        value=0,
+        step=1,
         key="test_key"
     )
+    assert mock_state["test_key"] == 0
     assert result == mock_col.number_input.return_value
 
+    input_rop(mock_col)
+    mock_col.number_input.assert_called_with("Specify Reorder Point (ROP)", value=0)
+
 def test_input_oq(mock_streamlit):
-    mock_col, _ = mock_streamlit
+    mock_col, mock_state = mock_streamlit
     result = input_oq(mock_col, key="test_key")
     
+    # The value of a keyed input starts at 0 in session state
     mock_col.number_input.assert_called_with(
         "Specify Order Quantity (Q)",
-        value=0,
+        step=1,
         key="test_key"
     )
+    assert mock_state["test_key"] == 0
     assert result == mock_col.number_input.return_value
+
+    input_oq(mock_col)
+    mock_col.number_input.assert_called_with("Specify Order Quantity (Q)", value=0)
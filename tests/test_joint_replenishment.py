@@ -0,0 +1,60 @@
+import itertools
+import pytest
+import numpy as np
+import pandas as pd
+from core.joint_replenishment import *
+
+
+def test_optimal_multipliers():
+    # 2s / (D H T²) = 2 × 40 / (1000 × 2 × 0.1²) = 4, 2 × 3 >= 4
+    assert optimal_multipliers(0.1, np.array([40.0]), np.array([2000.0]))[0] == 2
+    # Products without cost of their own are ordered every cycle
+    assert optimal_multipliers(0.1, np.array([0.0]), np.array([2000.0]))[0] == 1
+
+
+def test_joint_cost():
+    cost = joint_cost(np.array([0.5]), np.array([1.0, 2.0]), 100, np.array([10.0, 10.0]), np.array([100.0, 50.0]))
+    assert cost == pytest.approx((100 + 10 + 5) / 0.5 + 0.25 * (100 + 100))
+
+
+def test_joint_replenishment_matches_brute_force():
+    D = np.array([10000, 5000, 3000, 1000, 200.0])
+    s = np.full(5, 40.0)
+    T, k, cost = joint_replenishment(D, 200, s, 2.0)
+
+    best = np.inf
+    for ks in itertools.product(range(1, 6), repeat=5):
+        ks = np.array(ks)
+        T_k = np.sqrt(2 * (200 + (s / ks).sum()) / (ks * D * 2.0).sum())
+        best = min(best, joint_cost(np.array([T_k]), ks, 200, s, D * 2.0)[()])
+    assert cost == pytest.approx(best)
+    assert cost == pytest.approx(joint_cost(np.array([T]), k, 200, s, D * 2.0)[()])
+
+
+def test_joint_replenishment_single_product_is_eoq():
+    T, k, cost = joint_replenishment([1000.0], 80, 20, 2.0)
+    assert k[0] == 1
+    assert T * 1000 == pytest.approx(np.sqrt(2 * 1000 * 100 / 2.0))
+    assert cost == pytest.approx(np.sqrt(2 * 1000 * 100 * 2.0))
+
+
+def test_joint_replenishment_no_demand():
+    T, k, cost = joint_replenishment([0.0, 0.0], 80, 20, 2.0)
+    assert np.isnan(T)
+    assert cost == 0
+
+
+def test_portfolio_joint_replenishment():
+    index = pd.MultiIndex.from_tuples(
+        [("W1", "P1"), ("W1", "P2"), ("W1", "P3"), ("W2", "P1")],
+        names=["Warehouse", "Product_Code"],
+    )
+    demand = pd.Series([1000.0, 500.0, 0.0, 800.0], index=index)
+    products, groups = portfolio_joint_replenishment(
+        demand, index.get_level_values("Warehouse"), 100, 20, 1.0
+    )
+    assert list(groups.index) == ["W1", "W2"]
+    assert (groups["Joint_Cost"] <= groups["Independent_Cost"] + 0.01).all()
+    assert groups["Savings"].loc["W1"] > 0
+    assert np.isnan(products.loc[("W1", "P3"), "Multiplier"])
+    assert products.loc[("W2", "P1"), "Cycle_Days"] == groups.loc["W2", "Base_Cycle_Days"]
@@ -0,0 +1,123 @@
+import pytest
+import numpy as np
+import pandas as pd
+from core.lead_time_demand import *
+
+
+def test_demand_pmf():
+    pmf, bin_width = demand_pmf([0, 0, 1, 2, 2, 2])
+    assert bin_width == 1
+    assert pmf[:3].tolist() == pytest.approx([2 / 6, 1 / 6, 3 / 6])
+    assert pmf.sum() == pytest.approx(1)
+
+
+def test_demand_pmf_matrix():
+    demand = np.array([[0, 1000], [10, 5000], [20, 0]])
+    pmf, bin_width = demand_pmf(demand, max_bins=11)
+    assert pmf.shape == (2, 11)
+    assert bin_width.tolist() == [2, 500]
+    assert pmf[1, 10] == pytest.approx(1 / 3)
+    np.testing.assert_allclose(pmf.sum(axis=1), 1)
+
+
+def test_lead_time_pmf():
+    pmf = lead_time_pmf([2, 2, 3.2, np.nan])
+    assert pmf.tolist() == pytest.approx([0, 0, 2 / 3, 1 / 3])
+
+
+def test_portfolio_lead_time_pmf():
+    lead_time_data = pd.DataFrame({'Product_Code': ['A', 'A', 'B'], 'Lead_Time_Days': [1, 3, 2]})
+    pmf = portfolio_lead_time_pmf(lead_time_data, ['A', 'B', 'C'])
+    assert pmf.shape == (3, 4)
+    assert pmf[0].tolist() == [0, 0.5, 0, 0.5]
+    assert pmf[1].tolist() == [0, 0, 1, 0]
+    assert np.isnan(pmf[2]).all()
+
+
+def test_portfolio_lead_time_pmf_missing_lead_times():
+    lead_time_data = pd.DataFrame(
+        {'Product_Code': ['A', 'A', 'B', 'C'], 'Lead_Time_Days': [3, np.nan, 2, np.nan]}
+    )
+    pmf = portfolio_lead_time_pmf(lead_time_data, ['A', 'B', 'C'])
+    assert pmf.shape == (3, 4)
+    assert pmf[0].tolist() == [0, 0, 0, 1]
+    assert pmf[1].tolist() == [0, 0, 1, 0]
+    assert np.isnan(pmf[2]).all()
+
+
+def test_compound_pmf_fixed_lead_time():
+    # Two days of demand 0 or 1 with equal probability is binomial(2, 0.5)
+    pmf = compound_pmf(np.array([0.5, 0.5]), np.array([0, 0, 1.0]))
+    np.testing.assert_allclose(pmf, [0.25, 0.5, 0.25], atol=1e-12)
+
+
+def test_compound_pmf_matches_monte_carlo():
+    rng = np.random.default_rng(0)
+    demand = np.where(rng.random(365) < 0.2, rng.integers(1, 50, 365), 0)
+    lead_times = rng.integers(3, 15, 30)
+    pmf = compound_pmf(demand_pmf(demand, max_bins=50)[0], lead_time_pmf(lead_times))
+    assert pmf.sum() == pytest.approx(1)
+
+    samples = np.array([rng.choice(demand, size).sum() for size in rng.choice(lead_times, 20000)])
+    _, rop, mean = pmf_ss_rop(pmf, 1, 0.95)
+    assert mean == pytest.approx(demand.mean() * lead_times.mean(), rel=1e-6)
+    assert rop == pytest.approx(np.quantile(samples, 0.95), rel=0.05)
+
+
+def test_pmf_ss_rop():
+    ss, rop, mean = pmf_ss_rop(np.array([0.25, 0.5, 0.25]), 10, 0.9)
+    assert rop == 20
+    assert mean == 10
+    assert ss == 10
+
+
+def test_portfolio_fft_safety_stock():
+    dates = pd.date_range(start='2023-01-01', periods=100, freq='D')
+    daily_demand = pd.DataFrame({'A': 10.0, 'B': 0.0, 'C': 5.0}, index=dates)
+    lead_time_data = pd.DataFrame({'Product_Code': ['A', 'A', 'B'], 'Lead_Time_Days': [2, 4, 3]})
+
+    result = portfolio_fft_safety_stock(daily_demand, lead_time_data, 0.9, chunk_size=2)
+    assert result.loc['A', 'Lead Time Demand (FFT) ROP'] == 40
+    assert result.loc['A', 'Lead Time Demand (FFT) SS'] == 10
+    assert result.loc['B', 'Lead Time Demand (FFT) ROP'] == 0
+    assert result.loc['C'].isna().all()
+
+
+def test_rolling_lead_time_demand():
+    windows, weights = rolling_lead_time_demand(np.arange(1, 11.0), lead_time_pmf([2, 3]))
+    # 9 windows of 2 days then 8 windows of 3 days
+    assert windows[:9].tolist() == [3, 5, 7, 9, 11, 13, 15, 17, 19]
+    assert windows[9:].tolist() == [6, 9, 12, 15, 18, 21, 24, 27]
+    assert weights[:9].sum() == pytest.approx(0.5)
+    assert weights.sum() == pytest.approx(1)
+
+
+def test_rolling_lead_time_demand_matches_loop():
+    rng = np.random.default_rng(0)
+    demand = rng.poisson(10, (60, 3)).astype(float)
+    pmf = np.array([[0, 0, 0, 1.0], [0, 0.5, 0, 0.5], [0, 0, 0, 0]])
+    windows, weights = rolling_lead_time_demand(demand, pmf)
+    assert windows.shape == weights.shape == (60 + 58, 3)
+    expected = [demand[t:t + 3].sum(axis=0) for t in range(58)]
+    np.testing.assert_allclose(windows[60:], expected)
+    assert weights[:, 2].sum() == 0
+
+
+def test_weighted_ss_rop():
+    windows, weights = rolling_lead_time_demand(np.arange(1, 11.0), lead_time_pmf([2, 3]))
+    ss, rop, mean = weighted_ss_rop(windows, weights, 0.5)
+    assert rop == 13
+    assert mean == pytest.approx(0.5 * 11 + 0.5 * 16.5)
+    assert ss == pytest.approx(rop - mean)
+
+
+def test_portfolio_rolling_safety_stock():
+    dates = pd.date_range(start='2023-01-01', periods=100, freq='D')
+    daily_demand = pd.DataFrame({'A': 10.0, 'B': np.arange(100.0), 'C': 5.0}, index=dates)
+    lead_time_data = pd.DataFrame({'Product_Code': ['A', 'A', 'B'], 'Lead_Time_Days': [2, 4, 1]})
+
+    result = portfolio_rolling_safety_stock(daily_demand, lead_time_data, 0.9, chunk_size=2)
+    assert result.loc['A', 'Rolling Windows ROP'] == 40
+    assert result.loc['A', 'Rolling Windows SS'] == 10
+    assert result.loc['B', 'Rolling Windows ROP'] == 89
+    assert result.loc['C'].isna().all()
@@ -0,0 +1,91 @@
+import pytest
+import numpy as np
+import pandas as pd
+from scipy import stats
+from core.lead_time_fit import *
+
+
+@pytest.fixture
+def lead_time_df():
+    """Create lead times drawn from known gamma and lognormal distributions"""
+    rng = np.random.default_rng(42)
+    gamma_values = rng.gamma(shape=4.0, scale=5.0, size=2000)
+    lognorm_values = rng.lognormal(mean=2.5, sigma=0.4, size=2000)
+    return pd.DataFrame({
+        'Product_Code': ['G'] * 2000 + ['L'] * 2000,
+        'Lead_Time_Days': np.concatenate([gamma_values, lognorm_values]),
+    })
+
+
+def test_fit_gamma_matches_scipy():
+    rng = np.random.default_rng(1)
+    values = np.sort(rng.gamma(shape=2.5, scale=3.0, size=500))
+    codes = np.zeros(len(values), dtype=int)
+
+    shape, scale = fit_gamma(codes, values, 1)
+    expected_shape, _, expected_scale = stats.gamma.fit(values, floc=0)
+
+    assert shape[0] == pytest.approx(expected_shape, rel=1e-4)
+    assert scale[0] == pytest.approx(expected_scale, rel=1e-4)
+
+
+def test_fit_lognormal_matches_scipy():
+    rng = np.random.default_rng(2)
+    values = np.sort(rng.lognormal(mean=1.0, sigma=0.5, size=500))
+    codes = np.zeros(len(values), dtype=int)
+
+    mu, sigma = fit_lognormal(codes, values, 1)
+    expected_sigma, _, expected_scale = stats.lognorm.fit(values, floc=0)
+
+    assert mu[0] == pytest.approx(np.log(expected_scale), rel=1e-4)
+    assert sigma[0] == pytest.approx(expected_sigma, rel=1e-4)
+
+
+def test_ks_statistic_matches_scipy():
+    rng = np.random.default_rng(3)
+    values = np.sort(rng.normal(size=300))
+    codes = np.zeros(len(values), dtype=int)
+
+    result = ks_statistic(codes, stats.norm.cdf(values), 1)
+    expected = stats.kstest(values, 'norm').statistic
+
+    assert result[0] == pytest.approx(expected)
+
+
+def test_fit_lead_time_distributions(lead_time_df):
+    fits = fit_lead_time_distributions(lead_time_df)
+
+    assert list(fits.index) == ['G', 'L']
+    assert fits.loc['G', 'n'] == 2000
+    assert fits.loc['G', 'gamma_shape'] == pytest.approx(4.0, rel=0.1)
+    assert fits.loc['L', 'lognorm_mu'] == pytest.approx(2.5, rel=0.05)
+    assert fits.loc['G', 'best_fit'] == 'gamma'
+    assert fits.loc['L', 'best_fit'] == 'lognormal'
+    assert fits.loc['G', 'empirical_p50'] <= fits.loc['G', 'empirical_p95']
+
+
+def test_fit_constant_lead_time():
+    df = pd.DataFrame({'Product_Code': ['A'] * 5, 'Lead_Time_Days': [10] * 5})
+    fits = fit_lead_time_distributions(df)
+
+    mean, sd = lead_time_moments(fits.loc['A'], 'gamma')
+    assert mean == pytest.approx(10)
+    assert sd == pytest.approx(0, abs=1e-2)
+
+
+def test_fit_ignores_non_positive_lead_times():
+    df = pd.DataFrame({'Product_Code': ['A', 'A', 'A', 'B'], 'Lead_Time_Days': [0, 5, 7, -1]})
+    fits = fit_lead_time_distributions(df)
+    assert list(fits.index) == ['A']
+    assert fits.loc['A', 'n'] == 2
+
+
+@pytest.mark.parametrize("distribution", ['gamma', 'lognormal', 'empirical'])
+def test_lead_time_moments_and_quantile(lead_time_df, distribution):
+    fits = fit_lead_time_distributions(lead_time_df)
+    mean, sd = lead_time_moments(fits.loc['G'], distribution)
+    p95 = lead_time_quantile(fits.loc['G'], 0.95, distribution)
+
+    assert mean == pytest.approx(20, rel=0.1)
+    assert sd == pytest.approx(10, rel=0.25)
+    assert p95 > mean
@@ -122,3 +122,17 @@ def test_simulation_chart_data_consistency(sample_demand_df):
     
     # Verify inventory never exceeds maximum possible level
     assert (result_df['Inventory_Quantity'] <= (q + ss)).all()
+
+def test_simulation_chart_time_varying_rop(sample_demand_df):
+    """Test simulation_chart accepts one reorder point per day."""
+    year_sim = 2023
+    ss = 100
+    q = 300
+    L = 5
+
+    constant = simulation_chart(sample_demand_df, year_sim, ss, 150, q, L)
+    array = simulation_chart(sample_demand_df, year_sim, ss, np.full(365, 150), q, L)
+    pd.testing.assert_frame_equal(constant, array)
+
+    never_reorder = simulation_chart(sample_demand_df, year_sim, ss, np.full(365, -1), q, L)
+    assert never_reorder['Inventory_Quantity'].is_monotonic_decreasing
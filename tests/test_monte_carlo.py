@@ -0,0 +1,58 @@
+import pytest
+import numpy as np
+import pandas as pd
+from core.monte_carlo import *
+
+
+def test_sample_lead_time_demand_fixed_inputs():
+    rng = np.random.default_rng(0)
+    samples = sample_lead_time_demand([10, 10], [3], 1000, rng)
+    assert samples.shape == (1000,)
+    assert (samples == 30).all()
+
+
+def test_sample_lead_time_demand_zero_lead_time():
+    rng = np.random.default_rng(0)
+    samples = sample_lead_time_demand([5, 7], [0, 2], 1000, rng)
+    assert set(np.unique(samples)) <= {0, 10, 12, 14}
+    assert (samples == 0).any()
+
+
+def test_mc_ss_rop():
+    rng = np.random.default_rng(1)
+    demand = rng.poisson(20, 365)
+    ss, rop, mean = mc_ss_rop(demand, [5, 10], 0.9, n_samples=50000, seed=0)
+    assert mean == pytest.approx(demand.mean() * 7.5, rel=0.01)
+    assert rop == pytest.approx(ss + mean)
+    # Reproducible with the same seed
+    assert mc_ss_rop(demand, [5, 10], 0.9, n_samples=50000, seed=0)[1] == rop
+
+
+@pytest.fixture
+def portfolio():
+    rng = np.random.default_rng(2)
+    daily_demand = pd.DataFrame(rng.poisson(10, (100, 5)), columns=list('ABCDE'))
+    lead_time_data = pd.DataFrame({
+        'Product_Code': ['A', 'A', 'B', 'C', 'D'],
+        'Lead_Time_Days': [2, 4, 3, 5, np.nan],
+    })
+    return daily_demand, lead_time_data
+
+
+def test_portfolio_mc_safety_stock(portfolio):
+    daily_demand, lead_time_data = portfolio
+    result = portfolio_mc_safety_stock(daily_demand, lead_time_data, 0.9, n_samples=2000, n_workers=1)
+    assert list(result.columns) == ['Monte Carlo SS', 'Monte Carlo ROP']
+    assert result.loc[['A', 'B', 'C']].notna().all().all()
+    assert result.loc[['D', 'E']].isna().all().all()
+
+
+def test_portfolio_mc_safety_stock_independent_of_workers(portfolio):
+    daily_demand, lead_time_data = portfolio
+    serial = portfolio_mc_safety_stock(
+        daily_demand, lead_time_data, 0.9, n_samples=2000, n_workers=1, chunk_size=5
+    )
+    parallel = portfolio_mc_safety_stock(
+        daily_demand, lead_time_data, 0.9, n_samples=2000, n_workers=2, chunk_size=2
+    )
+    pd.testing.assert_frame_equal(serial, parallel)
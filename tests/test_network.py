@@ -0,0 +1,93 @@
+import pytest
+import numpy as np
+import pandas as pd
+from core.network import *
+
+
+def network_demand(demand, warehouses=("W1",), products=("A",)):
+    columns = pd.MultiIndex.from_product(
+        [list(warehouses), list(products)], names=["Warehouse", "Product_Code"]
+    )
+    demand = np.asarray(demand, dtype=float)
+    if demand.ndim == 1:
+        demand = np.repeat(demand[:, None], len(columns), axis=1)
+    return pd.DataFrame(demand, columns=columns)
+
+
+def test_simulate_network_ample_dc_stock():
+    daily_demand = network_demand([5] * 10)
+    warehouses, dc, echelons = simulate_network(
+        daily_demand, 0, 10, 20, 2, dc_ss=1000, dc_rop=0, dc_q=100, dc_L=5
+    )
+    assert warehouses["Lost_Sales"].sum() == 0
+    assert warehouses["Fill_Rate"].iloc[0] == 1
+    # Orders on days 1, 5 and 9
+    assert warehouses["Orders"].iloc[0] == 3
+    assert dc.loc["A", "Fill_Rate"] == 1
+    assert dc.loc["A", "Orders"] == 0
+    assert list(echelons.index) == ECHELONS
+
+
+def test_simulate_network_dc_out_of_stock():
+    daily_demand = network_demand([5] * 10)
+    warehouses, dc, echelons = simulate_network(
+        daily_demand, 0, 10, 20, 2, dc_ss=0, dc_rop=-1, dc_q=0, dc_L=5
+    )
+    # The warehouse only sells its initial stock of Q + SS
+    assert warehouses["Lost_Sales"].iloc[0] == 30
+    assert warehouses["Fill_Rate"].iloc[0] == pytest.approx(20 / 50)
+    assert dc.loc["A", "Fill_Rate"] == 0
+    assert echelons.loc["DC", "Fill_Rate"] == 0
+    assert dc.loc["A", "Avg_Backorders"] > 0
+
+
+def test_simulate_network_dc_backorders_shipped_after_receipt():
+    # Both warehouses order 20 on day 1, the DC ships 20 and backorders 20
+    daily_demand = network_demand([5] * 12, warehouses=("W1", "W2"))
+    warehouses, dc, _ = simulate_network(
+        daily_demand, 0, 10, 20, 1, dc_ss=0, dc_rop=0, dc_q=20, dc_L=2
+    )
+    assert dc.loc["A", "Orders"] >= 1
+    assert 0 < dc.loc["A", "Fill_Rate"] < 1
+    # The first warehouse is served first
+    assert warehouses["Lost_Sales"].iloc[0] <= warehouses["Lost_Sales"].iloc[1]
+    assert (warehouses["Avg_Inventory"] >= 0).all()
+
+
+def test_simulate_network_products_and_missing_parameters():
+    rng = np.random.default_rng(0)
+    daily_demand = network_demand(
+        rng.poisson(5, size=(60, 4)), warehouses=("W1", "W2"), products=("A", "B")
+    )
+    q = [20, 20, np.nan, 20]
+    dc_q = pd.Series({"A": 60.0, "B": 60.0})
+    warehouses, dc, echelons = simulate_network(
+        daily_demand, 5, 15, q, 2, dc_ss=10, dc_rop=30, dc_q=dc_q, dc_L=3
+    )
+    assert np.isnan(warehouses.loc[("W2", "A"), "Fill_Rate"])
+    assert warehouses["Fill_Rate"].notna().sum() == 3
+    assert list(dc.index) == ["A", "B"]
+    assert echelons.loc["Warehouses", "Orders"] == warehouses["Orders"].sum()
+
+    # A product without a DC policy is not simulated at any warehouse
+    warehouses, dc, _ = simulate_network(
+        daily_demand, 5, 15, 20, 2, dc_ss=10, dc_rop=30, dc_q=dc_q.drop("B"), dc_L=3
+    )
+    assert warehouses.xs("B", level="Product_Code")["Fill_Rate"].isna().all()
+    assert np.isnan(dc.loc["B", "Fill_Rate"])
+
+
+def test_network_policies():
+    rng = np.random.default_rng(0)
+    daily_demand = network_demand(
+        rng.poisson(5, size=(365, 4)), warehouses=("W1", "W2"), products=("A", "B")
+    )
+    daily_demand[("W2", "B")] = 0.0
+    warehouses, dc = network_policies(
+        daily_demand, 2, pd.Series({"A": 10.0, "B": 20.0}), 0.95, 20, 0.2
+    )
+    assert (warehouses["ROP"] >= warehouses["SS"]).all()
+    assert np.isnan(warehouses.loc[("W2", "B"), "Q"])
+    assert dc.loc["B", "L"] == 20
+    # The DC orders at least the largest warehouse order quantity
+    assert (dc["Q"] >= warehouses["Q"].groupby(level="Product_Code").max()).all()
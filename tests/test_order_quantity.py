@@ -0,0 +1,82 @@
+import time
+import pytest
+import numpy as np
+from core.order_quantity import *
+
+PRICES = [0.30, 0.29, 0.28]
+BREAKS = [0, 500, 1000]
+
+
+def brute_force(D, K, H, i, cost, quantities):
+    """Total annual cost of every quantity and the cheapest quantity"""
+    total_cost = D / quantities * (K + cost(quantities)) + (H * quantities + i * cost(quantities)) / 2
+    return quantities[np.argmin(total_cost)], total_cost.min()
+
+
+def test_batch_eoq_wilson():
+    result = batch_eoq([1000, 4000], 20, 0.4, lot_size=1, index=['A', 'B'])
+    assert result.loc['A', 'EOQ'] == pytest.approx(316.23)
+    assert result.loc['A', 'Order_Quantity'] in (316, 317)
+    assert result.loc['B', 'Order_Quantity'] == pytest.approx(632, abs=1)
+
+
+def test_batch_eoq_lot_size_and_moq():
+    result = batch_eoq([1000, 1000], 20, 0.4, moq=[0, 700], lot_size=[100, 300])
+    assert result['Order_Quantity'].tolist() == [300, 900]
+
+
+def test_batch_eoq_all_units_discount():
+    result = batch_eoq(600, 8, 0, 0.2, PRICES, BREAKS, 'All-units')
+    assert result.loc[0, 'Order_Quantity'] == 500
+    assert result.loc[0, 'Unit_Price'] == 0.29
+    assert result.loc[0, 'Total_Cost'] == pytest.approx(198.1)
+
+
+def test_batch_eoq_incremental_discount():
+    def cost(q):
+        return np.where(q < 500, 0.3 * q, np.where(q < 1000, 150 + 0.29 * (q - 500), 295 + 0.28 * (q - 1000)))
+
+    for D in [600, 6000, 60000]:
+        result = batch_eoq(D, 8, 0, 0.2, PRICES, BREAKS, 'Incremental')
+        Q, total_cost = brute_force(D, 8, 0, 0.2, cost, np.arange(1, 20000.0))
+        assert result.loc[0, 'Total_Cost'] == pytest.approx(total_cost, abs=0.01)
+
+
+def test_batch_eoq_per_product_schedule():
+    result = batch_eoq(
+        [600, 600], 8, 0, 0.2,
+        [PRICES, [0.30, 0.30, 0.30]], [BREAKS, BREAKS], 'All-units',
+    )
+    assert result['Order_Quantity'].tolist() == [500, 400]
+
+
+def test_batch_eoq_per_product_price_without_discount():
+    result = batch_eoq([1000, 1000], 20, 0.4, 0.2, [[5], [50]], [[0], [0]], 'None')
+    assert result['Unit_Price'].tolist() == [5, 50]
+    assert result.loc[0, 'EOQ'] == pytest.approx((2 * 1000 * 20 / (0.4 + 0.2 * 5)) ** 0.5, abs=0.01)
+    assert result.loc[1, 'EOQ'] == pytest.approx((2 * 1000 * 20 / (0.4 + 0.2 * 50)) ** 0.5, abs=0.01)
+    assert result.loc[1, 'Order_Quantity'] < result.loc[0, 'Order_Quantity']
+
+    # Only the base price of a tiered schedule is used
+    result = batch_eoq(600, 8, 0, 0.2, PRICES, BREAKS, 'None')
+    assert result.loc[0, 'Unit_Price'] == 0.30
+
+
+def test_price_schedule_validation():
+    with pytest.raises(ValueError):
+        price_schedule([1, 2], [10, 20])
+    with pytest.raises(ValueError):
+        price_schedule([1, 2], [0, 0])
+
+
+def test_batch_eoq_is_fast():
+    n = 5000
+    rng = np.random.default_rng(0)
+    start = time.perf_counter()
+    result = batch_eoq(
+        rng.uniform(100, 1e5, n), 20, 0.2, 0.1,
+        [10, 9.5, 9, 8.5], [0, 100, 1000, 5000], 'Incremental',
+        moq=50, lot_size=rng.integers(1, 100, n),
+    )
+    assert time.perf_counter() - start < 1
+    assert len(result) == n
@@ -0,0 +1,73 @@
+import pytest
+import numpy as np
+import pandas as pd
+from core.policy_optimization import *
+from core.simulation import simulate_policies
+from core.safety_stock import eoq
+
+
+def test_target_kernel_matches_simulate_policies():
+    rng = np.random.default_rng(0)
+    demand = rng.poisson(10, (90, 2)).astype(float)
+    series = np.array([0, 1], dtype=np.int64)
+    ss, rop, q = np.array([5.0, 0.0]), np.array([40.0, 5.0]), np.array([80.0, 20.0])
+    L = np.array([3, 3], dtype=np.int64)
+    met, inventory_sum, lost, orders = target_kernel(
+        demand, series, ss, rop, q, L, np.full(2, np.inf)
+    )
+    expected = simulate_policies(demand, ss, rop, q, L)
+    assert met.all()
+    assert inventory_sum / 90 == pytest.approx(expected["Avg_Inventory"].to_numpy())
+    assert lost == pytest.approx(expected["Lost_Sales"].to_numpy())
+    assert orders.tolist() == expected["Orders"].tolist()
+
+    # The simulation of a policy stops once it loses more than allowed
+    met, _, lost, _ = target_kernel(demand, series, ss, rop, q, L, np.array([1e6, 5.0]))
+    assert met.tolist() == [True, False]
+    assert lost[1] < expected["Lost_Sales"].iloc[1]
+
+
+def test_optimize_rop_is_minimal():
+    rng = np.random.default_rng(1)
+    demand = rng.poisson(10, (365, 3)).astype(float)
+    result = optimize_rop(demand, 100, 5, 0.95, tol=0.5)
+    assert result["Feasible"].all()
+    assert (result["Fill_Rate"] >= 0.95).all()
+
+    avg = demand.mean(axis=0)
+    for i, rop in enumerate(result["ROP"]):
+        below = rop - 1
+        fill = simulate_policies(demand[:, i], max(below - avg[i] * 5, 0), below, 100, 5)
+        assert fill["Fill_Rate"].iloc[0] < 0.95
+
+
+def test_optimize_rop_infeasible_target():
+    # Q smaller than the lead time demand cannot serve every unit
+    demand = np.full(100, 10.0)
+    result = optimize_rop(demand, 5, 3, 1.0, max_doublings=3)
+    assert not result["Feasible"].iloc[0]
+    assert np.isnan(result["ROP"].iloc[0])
+
+
+def test_optimize_policy():
+    rng = np.random.default_rng(2)
+    columns = pd.Index(["A", "B"], name="Product_Code")
+    demand = pd.DataFrame(rng.poisson([5, 20], (365, 2)).astype(float), columns=columns)
+    result = optimize_policy(demand, 4, 0.9, 20, 0.2)
+    assert list(result.index) == ["A", "B"]
+    assert result["Feasible"].all()
+    assert (result["Fill_Rate"] >= 0.9).all()
+
+    # Q stays within the search interval around the EOQ of the inputs
+    q_eoq = eoq(demand.sum().to_numpy(), 20, 0.2)
+    assert (q_eoq / 4 <= result["Q"].to_numpy()).all()
+    assert (result["Q"].to_numpy() <= q_eoq * 4).all()
+
+    # No Q of a brute-force grid over the interval costs noticeably less
+    grid = q_eoq[:, None] * np.linspace(0.25, 4, 100)
+    brute = optimize_rop(
+        demand.to_numpy(), grid.ravel(), 4, 0.9, series=np.repeat([0, 1], 100)
+    )
+    cost = 20 * brute["Orders"] + 0.2 * brute["Avg_Inventory"]
+    cheapest = cost.to_numpy().reshape(2, 100).min(axis=1)
+    assert (result["Cost"].to_numpy() <= cheapest * 1.02).all()
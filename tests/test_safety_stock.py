@@ -0,0 +1,188 @@
+import time
+import pytest
+import numpy as np
+import pandas as pd
+from scipy import stats
+from core.safety_stock import *
+
+
+@pytest.fixture
+def inputs():
+    """Per-product safety stock inputs of two products"""
+    return {
+        'avg_sales': np.array([100.0, 50.0]),
+        'demand_sd': np.array([20.0, 30.0]),
+        'max_sales': np.array([160.0, 120.0]),
+        'avg_lead_time': np.array([4.0, 9.0]),
+        'sd_lead_time': np.array([1.0, 2.0]),
+        'max_lead_time': np.array([7.0, 15.0]),
+    }
+
+
+def test_portfolio_safety_stock_columns(inputs):
+    result = portfolio_safety_stock(**inputs, index=pd.Index(['A', 'B']))
+    assert list(result.index) == ['A', 'B']
+    assert result.shape == (2, 2 * len(METHODS))
+    assert 'Uncertain demand SS' in result.columns
+    assert 'Holding / Stockout cost ROP' in result.columns
+
+
+def test_portfolio_safety_stock_matches_single_product_formulas(inputs):
+    result = portfolio_safety_stock(
+        **inputs, cycle_service_rate=0.95, fill_rate=0.98,
+        holding_cost=10, stockout_cost=50, safety_days=5,
+    )
+    Z = round(stats.norm.ppf(0.95), 2)
+    D, sd, L, sd_L = 100, 20, 4, 1
+
+    assert result.loc[0, 'Basic SS'] == round(D * 5)
+    assert result.loc[0, 'Average - Max SS'] == round(7 * 160 - L * D)
+    assert result.loc[0, 'Uncertain demand SS'] == round(Z * sd * L ** 0.5)
+    assert result.loc[0, 'Uncertain lead time SS'] == round(Z * sd_L * D)
+    assert result.loc[0, 'Uncertain demand and lead time (independent) SS'] == round(
+        Z * ((L * sd ** 2 + (D * sd_L) ** 2) ** 0.5)
+    )
+    assert result.loc[0, 'Uncertain demand and lead time (dependent) SS'] == round(
+        Z * sd * L ** 0.5 + Z * D * sd_L
+    )
+    loss = D * (1 - 0.98) / sd
+    k = inverse_standard_normal_loss(loss)
+    assert standard_normal_loss(k) == pytest.approx(loss)
+    assert result.loc[0, 'Fill Rate SS'] == round(k * sd * L ** 0.5)
+    assert result.loc[0, 'Holding / Stockout cost SS'] == round(
+        (D + sd * stats.norm.cdf(50 / 60)) * L ** 0.5
+    )
+    for method in METHODS:
+        assert result.loc[0, f'{method} ROP'] == round(result.loc[0, f'{method} SS'] + L * D)
+
+
+def test_portfolio_safety_stock_is_fast():
+    rng = np.random.default_rng(0)
+    n = 10000
+    start = time.perf_counter()
+    result = portfolio_safety_stock(
+        avg_sales=rng.uniform(1, 100, n),
+        demand_sd=rng.uniform(1, 50, n),
+        max_sales=rng.uniform(100, 300, n),
+        avg_lead_time=rng.uniform(1, 30, n),
+        sd_lead_time=rng.uniform(0, 5, n),
+        max_lead_time=rng.uniform(30, 60, n),
+    )
+    assert len(result) == n
+    assert time.perf_counter() - start < 1
+
+
+def test_portfolio_inputs():
+    dates = pd.date_range(start='2022-12-30', end='2023-12-31', freq='D')
+    daily_demand = pd.DataFrame({'A': 10.0, 'B': 0.0}, index=dates)
+    daily_demand.loc['2023-06-01', 'B'] = 365.0
+    lead_time_data = pd.DataFrame({
+        'Product_Code': ['A', 'A', 'A', 'B'],
+        'Received_Date': pd.to_datetime(['2023-02-01', '2023-05-01', '2022-12-01', '2023-03-01']),
+        'Lead_Time_Days': [4, 6, 100, 10],
+    })
+
+    inputs = portfolio_inputs(daily_demand, daily_demand, lead_time_data, 2023)
+
+    assert inputs.loc['A', 'avg_sales'] == pytest.approx(10)
+    assert inputs.loc['A', 'demand_sd'] == 0
+    assert inputs.loc['B', 'max_sales'] == 365
+    assert inputs.loc['A', 'avg_lead_time'] == 5
+    assert inputs.loc['A', 'max_lead_time'] == 6
+    assert np.isnan(inputs.loc['B', 'sd_lead_time'])
+
+
+def test_portfolio_inputs_fitted_lead_time():
+    dates = pd.date_range(start='2023-01-01', end='2023-12-31', freq='D')
+    daily_demand = pd.DataFrame({'A': 10.0}, index=dates)
+    rng = np.random.default_rng(0)
+    lead_times = rng.gamma(4, 5, 500)
+    lead_time_data = pd.DataFrame({
+        'Product_Code': 'A',
+        'Received_Date': pd.Timestamp('2023-06-01'),
+        'Lead_Time_Days': lead_times,
+    })
+
+    inputs = portfolio_inputs(daily_demand, daily_demand, lead_time_data, 2023, 'gamma')
+    assert inputs.loc['A', 'avg_lead_time'] == pytest.approx(lead_times.mean(), rel=1e-3)
+    assert inputs.loc['A', 'sd_lead_time'] == pytest.approx(10, rel=0.1)
+
+
+def test_safety_factor():
+    assert safety_factor(0.95) == 1.64
+    np.testing.assert_array_equal(safety_factor([0.5, 0.99]), [0.0, 2.33])
+
+
+def test_single_product_formulas():
+    assert ss_uncertain_demand(2, 10, 4) == 40
+    assert ss_uncertain_lead_time(2, 3, 100) == 600
+    assert ss_uncertain_demand_lead_time_ind(2, 4, 10, 100, 3) == pytest.approx(
+        2 * (4 * 100 + 300 ** 2) ** 0.5
+    )
+    assert ss_uncertain_demand_lead_time_dep(2, 4, 10, 100, 3) == 640
+    assert ss_average_max(20, 150, 10, 100) == 2000
+    assert ss_basic(100, 5) == 500
+    assert reorder_point(500, 20, 100) == 2500
+    assert eoq(1000, 20, 0.4) == pytest.approx(100000 ** 0.5)
+
+
+def test_single_product_formulas_broadcast():
+    ss = ss_uncertain_demand(np.array([1.0, 2.0]), 10, np.array([[1.0], [4.0]]))
+    np.testing.assert_array_equal(ss, [[10, 20], [20, 40]])
+
+
+def test_standard_normal_loss():
+    assert standard_normal_loss(0) == pytest.approx(stats.norm.pdf(0))
+    assert standard_normal_loss(1) == pytest.approx(0.0833, abs=1e-4)
+
+
+@pytest.mark.parametrize('k', [-12, -3, 0, 1.5, 4, 7])
+def test_inverse_standard_normal_loss(k):
+    assert inverse_standard_normal_loss(standard_normal_loss(k)) == pytest.approx(k)
+
+
+def test_inverse_standard_normal_loss_edge_cases():
+    k = inverse_standard_normal_loss([0, -1, np.nan])
+    assert np.isinf(k[0])
+    assert np.isnan(k[1:]).all()
+
+
+def test_inverse_standard_normal_loss_high_fill_rate():
+    # The approximation drifts for small losses, the exact solver does not
+    loss = 1e-6
+    k = inverse_standard_normal_loss(loss)
+    assert standard_normal_loss(k) == pytest.approx(loss, rel=1e-8)
+
+
+def test_inverse_standard_normal_loss_is_fast():
+    loss = np.random.default_rng(0).uniform(1e-6, 3, 100_000)
+    start = time.perf_counter()
+    k = inverse_standard_normal_loss(loss)
+    assert time.perf_counter() - start < 1
+    np.testing.assert_allclose(standard_normal_loss(k), loss, rtol=1e-8)
+
+
+def test_cycle_service_curve():
+    curve = cycle_service_curve(100, 4, 40, 0.2)
+    assert list(curve.columns) == ['Service_Level', 'SS', 'ROP', 'Holding_Cost', 'Expected_Shortage']
+    assert curve['Service_Level'].min() == 0.5
+    assert curve['Service_Level'].max() == 0.999
+    row = curve.loc[curve['Service_Level'] == 0.95].iloc[0]
+    assert row['SS'] == pytest.approx(stats.norm.ppf(0.95) * 40, abs=0.01)
+    assert row['ROP'] == pytest.approx(row['SS'] + 400, abs=0.01)
+    assert row['Holding_Cost'] == pytest.approx(0.2 * row['SS'], abs=0.01)
+    # Higher service levels cost more and short less
+    assert curve['Holding_Cost'].is_monotonic_increasing
+    assert curve['Expected_Shortage'].is_monotonic_decreasing
+
+
+def test_fill_rate_curve_portfolio():
+    curve = fill_rate_curve([100, 50], [20, 30], [4, 9], 0.2, index=['A', 'B'])
+    assert len(curve) == 2 * len(SERVICE_LEVELS)
+    row = curve.loc[(curve['Product_Code'] == 'B') & (curve['Service_Level'] == 0.98)].iloc[0]
+    k = inverse_standard_normal_loss(50 * 0.02 / 30)
+    assert row['SS'] == pytest.approx(k * 30 * 3, abs=0.01)
+    single = fill_rate_curve(50, 30, 9, 0.2)
+    np.testing.assert_allclose(
+        curve.loc[curve['Product_Code'] == 'B', 'SS'], single['SS']
+    )
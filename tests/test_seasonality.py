@@ -0,0 +1,68 @@
+import pytest
+import numpy as np
+import pandas as pd
+from core.seasonality import *
+
+
+@pytest.fixture
+def seasonal_matrix():
+    """Create a daily demand matrix with weekly and yearly seasonality"""
+    dates = pd.date_range(start='2023-01-01', end='2023-12-31', freq='D')
+    weekday = np.where(dates.dayofweek < 5, 100.0, 0.0)
+    summer = np.where(dates.month.isin([6, 7, 8]), 200.0, 100.0)
+    return pd.DataFrame(
+        {'Weekly': weekday, 'Yearly': summer, 'Flat': 10.0, 'Empty': 0.0},
+        index=pd.DatetimeIndex(dates, name='Date'),
+    )
+
+
+def test_seasonal_indices_shape(seasonal_matrix):
+    dow_index, month_index = seasonal_indices(seasonal_matrix)
+    assert dow_index.shape == (4, 7)
+    assert month_index.shape == (4, 12)
+    assert list(dow_index.columns) == DAY_NAMES
+    assert list(month_index.columns) == MONTH_NAMES
+
+
+def test_seasonal_indices_values(seasonal_matrix):
+    dow_index, month_index = seasonal_indices(seasonal_matrix)
+
+    assert dow_index.loc['Weekly', 'Sat'] == 0
+    assert dow_index.loc['Weekly', 'Mon'] > 1
+    assert month_index.loc['Yearly', 'Jul'] > month_index.loc['Yearly', 'Jan']
+    assert np.allclose(dow_index.loc['Flat'], 1.0)
+    assert np.allclose(month_index.loc['Empty'], 1.0)
+
+
+def test_grouped_means():
+    values = np.array([[1.0, 10.0], [3.0, 30.0], [5.0, 50.0]])
+    groups = np.array([0, 0, 1])
+    means = grouped_means(values, groups, 3)
+    assert np.allclose(means[:2], [[2.0, 20.0], [5.0, 50.0]])
+    assert np.isnan(means[2]).all()
+
+
+def test_monthly_ss_rop_schedule():
+    month_index = np.array([[1.0] * 6 + [2.0] * 6, [1.0] * 12])
+    ss, rop = monthly_ss_rop_schedule(
+        avg_sales=np.array([100, 50]),
+        demand_sd=np.array([20, 10]),
+        lead_time=4,
+        z=1.65,
+        month_index=month_index,
+    )
+    assert ss.shape == (2, 12)
+    assert ss[0, 0] == round(1.65 * 20 * 2)
+    assert ss[0, 11] == round(1.65 * 40 * 2)
+    assert rop[1, 0] == ss[1, 0] + 4 * 50
+
+
+def test_seasonal_rop():
+    rop = seasonal_rop(ss=10, rop=110, month_index=[0.5, 1.0, 2.0])
+    assert rop.tolist() == [60, 110, 210]
+
+
+def test_daily_schedule():
+    dates = pd.date_range(start='2023-01-30', periods=4, freq='D')
+    values = daily_schedule(np.arange(12) * 10, dates)
+    assert values.tolist() == [0, 0, 10, 10]
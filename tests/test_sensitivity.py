@@ -0,0 +1,91 @@
+import pytest
+import numpy as np
+import pandas as pd
+import scipy.stats as stats
+from core.sensitivity import *
+
+IND = "Uncertain demand and lead time (independent)"
+INPUTS_IND = {
+    "cycle_service_rate": 0.9,
+    "avg_sales": 100.0,
+    "demand_sd": 20.0,
+    "avg_lead_time": 10.0,
+    "sd_lead_time": 2.0,
+}
+
+
+def test_cycle_service_ss_rop():
+    ss, rop = cycle_service_ss_rop("Uncertain demand", 0.9, 100.0, 20.0, 4.0)
+    assert ss == pytest.approx(stats.norm.ppf(0.9) * 20 * 2)
+    assert rop == pytest.approx(ss + 400)
+
+
+def test_sensitivities_match_closed_form():
+    result = sensitivities(IND, INPUTS_IND).set_index("Input")
+    Z = stats.norm.ppf(0.9)
+    sigma = np.sqrt(10 * 20**2 + (100 * 2) ** 2)
+    assert result.loc["sd_lead_time", "dSS"] == pytest.approx(Z * 100**2 * 2 / sigma, rel=1e-5)
+    assert result.loc["avg_lead_time", "dROP"] == pytest.approx(
+        Z * 20**2 / (2 * sigma) + 100, rel=1e-5
+    )
+    assert result.loc["cycle_service_rate", "dSS"] == pytest.approx(
+        sigma / stats.norm.pdf(Z), rel=1e-4
+    )
+    # SS is proportional to demand_sd x sqrt(L) with demand uncertainty only
+    result = sensitivities("Uncertain demand", INPUTS_IND).set_index("Input")
+    assert result.loc["demand_sd", "SS_Elasticity"] == pytest.approx(1)
+    assert result.loc["avg_lead_time", "SS_Elasticity"] == pytest.approx(0.5)
+    assert result.loc["avg_sales", "dSS"] == pytest.approx(0)
+
+
+def test_sensitivities_portfolio():
+    inputs = dict(INPUTS_IND, avg_sales=[100.0, 50.0], sd_lead_time=[2.0, 0.0])
+    result = sensitivities(IND, inputs)
+    assert len(result) == 10
+    single = sensitivities(IND, INPUTS_IND)
+    assert result.iloc[::2]["dSS"].to_numpy() == pytest.approx(single["dSS"].to_numpy())
+
+
+def test_tornado():
+    result = tornado(IND, INPUTS_IND)
+    assert len(result) == 5
+    assert result.loc["Cycle Service Rate", ["Low", "High"]].tolist() == pytest.approx([0.85, 0.95])
+    assert result.loc["Lead Time Std Dev (σL)", "High"] == pytest.approx(2.4)
+    ranges = (result["SS_High"] - result["SS_Low"]).abs()
+    assert ranges.is_monotonic_decreasing
+    # Average lead time moves ROP more than SS
+    row = result.loc["Average Lead Time (L)"]
+    assert row["ROP_High"] - row["ROP_Low"] > row["SS_High"] - row["SS_Low"]
+
+
+def test_sensitivity_grid():
+    ss, rop = sensitivity_grid(
+        IND, INPUTS_IND, "avg_lead_time", [5, 10], "sd_lead_time", [0, 1, 2]
+    )
+    assert ss.shape == (2, 3)
+    expected, _ = cycle_service_ss_rop(IND, 0.9, 100.0, 20.0, 10.0, 2.0)
+    assert ss.loc[10, 2] == pytest.approx(expected)
+    assert (rop - ss).loc[5].tolist() == pytest.approx([500] * 3)
+
+
+def test_grid_values():
+    assert grid_values("avg_lead_time", 10)[[0, -1]].tolist() == [5, 15]
+    assert grid_values("cycle_service_rate", 0.9)[-1] == 0.99
+
+
+def test_portfolio_lead_time_sensitivity():
+    inputs = pd.DataFrame(
+        {
+            "avg_sales": [100.0, 10.0, 50.0],
+            "demand_sd": [20.0, 20.0, 5.0],
+            "avg_lead_time": [10.0, 10.0, 10.0],
+            "sd_lead_time": [2.0, 2.0, np.nan],
+        },
+        index=pd.Index(["P1", "P2", "P3"], name="Product_Code"),
+    )
+    result = portfolio_lead_time_sensitivity(inputs, 0.9)
+    # Marginal effect of variance is largest where it is still small
+    assert result.index.tolist() == ["P3", "P1", "P2"]
+    assert result.loc["P3", "Lead_Time_Variance_Share"] == 0
+    share = (100 * 2) ** 2 / (10 * 20**2 + (100 * 2) ** 2)
+    assert result.loc["P1", "Lead_Time_Variance_Share"] == pytest.approx(share)
@@ -1,7 +1,9 @@
 import pytest
+import numpy as np
 import pandas as pd
 import streamlit as st
 from components.simulation import *
+from core import simulation as core_simulation
 
 class MockTab:
     def __init__(self):
@@ -188,3 +190,208 @@ def test_lead_time_calculations(mock_streamlit, sample_df, lead_time_data):
         simulation_actual_data(sample_df, lead_time_data, 3000)
     
     assert st.session_state["avg_lead_time"] > 0
+
+
+def test_year_daily_demand():
+    df = pd.DataFrame({
+        'Date': pd.to_datetime(['2023-01-02', '2023-01-02', '2023-03-01', '2022-05-01']),
+        'Order_Demand': [5, 10, 7, 100],
+    })
+    result = core_simulation.year_daily_demand(df, 2023)
+    assert len(result) == 365
+    assert result['Order_Demand'].iloc[1] == 15
+    assert result['Order_Demand'].sum() == 22
+
+
+def test_simulate_inventory():
+    # Reorder when inventory reaches 10, receive 20 units 2 days later
+    demand = [5, 5, 5, 5, 5, 5]
+    inventory = core_simulation.simulate_inventory(demand, 0, 10, 20, 2)
+    assert inventory.tolist() == [20, 15, 10, 5, 20, 15]
+
+
+def test_simulate_inventory_no_stock_below_zero():
+    inventory = core_simulation.simulate_inventory([50, 50], 0, -1, 10, 1)
+    assert inventory.tolist() == [10, 0]
+
+
+def test_fill_rate():
+    assert core_simulation.fill_rate([100, 0, 50], [80, 10, 40]) == pytest.approx(0.8)
+    assert core_simulation.fill_rate([0, 0], [10, 10]) == 0.0
+    assert core_simulation.fill_rate([10], [50]) == 1.0
+
+
+def test_simulate_inventory_flows():
+    demand = [5, 5, 5, 5, 5, 15]
+    inventory, receipts, stockouts = core_simulation.simulate_inventory(
+        demand, 0, 10, 20, 2, flows=True
+    )
+    assert inventory.tolist() == [20, 15, 10, 5, 20, 15]
+    assert receipts.tolist() == [0, 0, 0, 0, 20, 0]
+    assert stockouts.tolist() == [0, 0, 0, 0, 0, 0]
+
+    inventory, receipts, stockouts = core_simulation.simulate_inventory(
+        [50, 50], 0, -1, 10, 1, flows=True
+    )
+    assert stockouts.tolist() == [40, 50]
+
+
+def test_inventory_kernel_seasonal_rop():
+    demand = np.full(10, 5.0)
+    rop = np.array([0, 0, 0, 12, 12, 12, 12, 12, 12, 12], dtype=float)
+    inventory, receipts, _ = core_simulation.inventory_kernel(demand, 0.0, rop, 20.0, 1)
+    assert inventory.tolist() == [20, 15, 10, 5, 20, 15, 10, 25, 20, 15]
+    assert receipts.sum() == 40
+
+
+def test_simulate_policies_matches_single_kernel():
+    rng = np.random.default_rng(0)
+    demand = rng.poisson(10, (60, 3)).astype(float)
+    ss, rop, q, L = [5.0, 0.0, 20.0], [30.0, 50.0, 10.0], [100.0, 60.0, 40.0], [3, 0, 7]
+    result = core_simulation.simulate_policies(demand, ss, rop, q, L)
+    for i in range(3):
+        inventory, receipts, stockouts = core_simulation.simulate_inventory(
+            demand[:, i], ss[i], rop[i], q[i], L[i], flows=True
+        )
+        assert result["Avg_Inventory"].iloc[i] == pytest.approx(inventory.mean())
+        assert result["Lost_Sales"].iloc[i] == pytest.approx(stockouts.sum())
+        assert result["Stockout_Days"].iloc[i] == (stockouts > 0).sum()
+        assert result["Orders"].iloc[i] == (receipts > 0).sum()
+        assert result["Fill_Rate"].iloc[i] == pytest.approx(
+            1 - stockouts.sum() / demand[:, i].sum()
+        )
+
+
+def test_parameter_sweep():
+    demand = np.tile([5.0, 0.0, 10.0], 30)
+    result = core_simulation.parameter_sweep(
+        demand, [0, 10], [0, 20, 40], [50, 100], [1, 5], n_workers=1
+    )
+    assert len(result) == 24
+    assert list(result.columns[:4]) == ["SS", "ROP", "Q", "L"]
+    row = result.loc[
+        (result["SS"] == 10) & (result["ROP"] == 20) & (result["Q"] == 50) & (result["L"] == 5)
+    ].iloc[0]
+    inventory = core_simulation.simulate_inventory(demand, 10, 20, 50, 5)
+    assert row["Avg_Inventory"] == pytest.approx(inventory.mean())
+
+    # Chunks split across processes give the same grid
+    pooled = core_simulation.parameter_sweep(
+        demand, [0, 10], [0, 20, 40], [50, 100], [1, 5], n_workers=2, chunk_size=5
+    )
+    pd.testing.assert_frame_equal(result, pooled)
+
+
+def test_portfolio_simulation():
+    daily_demand = pd.DataFrame(
+        {"P1": [5.0, 5.0, 5.0, 5.0, 5.0, 5.0], "P2": [50.0, 50.0, 0, 0, 0, 0], "P3": 1.0}
+    )
+    result, fill_rate = core_simulation.portfolio_simulation(
+        daily_demand, [0, 0, 0], [10, -1, 0], [20, 10, 5], [2, 1, np.nan]
+    )
+    assert list(result.index) == ["P1", "P2", "P3"]
+    assert result.loc["P1", "Avg_Inventory"] == pytest.approx(85 / 6)
+    assert result.loc["P1", "Fill_Rate"] == 1
+    assert result.loc["P2", "Lost_Sales"] == 90
+    assert result.loc["P2", "Stockout_Days"] == 2
+    assert result.loc["P3"].isna().all()
+    assert fill_rate == pytest.approx(1 - 90 / 130)
+
+
+def test_replication_kernel_matches_single_kernel():
+    rng = np.random.default_rng(0)
+    paths = rng.poisson(10, (100, 3)).astype(float)
+    inventory, lost, stockout_days = core_simulation.replication_kernel(
+        paths, np.full((3, 100), 4), 5.0, 40.0, 80.0
+    )
+    for r in range(3):
+        expected, _, stockouts = core_simulation.simulate_inventory(
+            paths[:, r], 5, 40, 80, 4, flows=True
+        )
+        assert inventory[:, r].tolist() == expected.tolist()
+        assert lost[r] == pytest.approx(stockouts.sum())
+        assert stockout_days[r] == (stockouts > 0).sum()
+
+
+def test_simulate_replications():
+    rng = np.random.default_rng(0)
+    demand = rng.poisson(20, 365)
+    result, inventory = core_simulation.simulate_replications(
+        demand, [3, 5, 8], 50, 200, 400, n_replications=200, seed=1
+    )
+    assert len(result) == 200
+    assert inventory.shape == (365, 200)
+    assert result["Fill_Rate"].between(0, 1).all()
+    assert result["Avg_Inventory"].to_numpy() == pytest.approx(inventory.mean(axis=0))
+    # Reproducible with the same seed, different with another
+    again, _ = core_simulation.simulate_replications(
+        demand, [3, 5, 8], 50, 200, 400, n_replications=200, seed=1
+    )
+    pd.testing.assert_frame_equal(result, again)
+    other, _ = core_simulation.simulate_replications(
+        demand, [3, 5, 8], 50, 200, 400, n_replications=200, seed=2
+    )
+    assert not result.equals(other)
+
+
+def test_confidence_bands_and_interval():
+    values = np.arange(101, dtype=float)
+    assert core_simulation.confidence_bands(values) == pytest.approx((5, 50, 95))
+    mean, half_width = core_simulation.mean_confidence_interval(values)
+    assert mean == 50
+    assert half_width == pytest.approx(1.96 * values.std(ddof=1) / np.sqrt(101), rel=1e-3)
+
+
+def test_simulate_stream_carries_state_across_chunks():
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2014-01-01", "2016-12-31")
+    df = pd.DataFrame({"Date": dates, "Order_Demand": rng.poisson(20, len(dates))})
+    df = df.sample(frac=0.6, random_state=0)
+
+    chunks = list(core_simulation.demand_chunks(df, "2014-01-01", "2016-12-31", 100))
+    assert len(chunks) == 11
+    assert sum(len(chunk) for chunk in chunks) == len(dates)
+
+    result = pd.concat(
+        core_simulation.simulate_stream(chunks, 50, 300, 500, 7), ignore_index=True
+    )
+    demand = pd.concat(chunks, ignore_index=True)["Order_Demand"]
+    inventory, receipts, stockouts = core_simulation.simulate_inventory(
+        demand, 50, 300, 500, 7, flows=True
+    )
+    assert result["Inventory_Quantity"].tolist() == inventory.tolist()
+    assert result["Received_Quantity"].tolist() == receipts.tolist()
+    assert result["Lost_Sales"].tolist() == stockouts.tolist()
+
+
+def test_portfolio_simulation_stream():
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2014-01-01", "2015-12-31")
+    daily_demand = pd.DataFrame(
+        rng.poisson(10, (len(dates), 4)).astype(float),
+        index=dates,
+        columns=["P1", "P2", "P3", "P4"],
+    )
+    L = [1, 5, np.nan, 9]
+    steps = list(
+        core_simulation.portfolio_simulation_stream(
+            core_simulation.matrix_chunks(daily_demand, chunk_days=200), 5, 100, 200, L
+        )
+    )
+    assert [n_days for n_days, _, _ in steps] == [200, 400, 600, 730]
+
+    _, result, fill_rate = steps[-1]
+    expected, expected_fill_rate = core_simulation.portfolio_simulation(
+        daily_demand, 5, 100, 200, L
+    )
+    pd.testing.assert_frame_equal(result, expected)
+    assert fill_rate == pytest.approx(expected_fill_rate)
+    assert result.loc["P3"].isna().all()
+
+
+def test_apply_policy():
+    apply_policy(3000, 10.2, 55.5, 99.1)
+    assert st.session_state[3001] == 11
+    assert st.session_state[3002] == 56
+    assert st.session_state[3003] == 100
+    assert st.session_state[3028] is False
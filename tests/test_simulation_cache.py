@@ -0,0 +1,65 @@
+import pytest
+import numpy as np
+import pandas as pd
+from core.simulation_cache import *
+
+
+def frame(n_rows):
+    return pd.DataFrame({"Inventory_Quantity": np.zeros(n_rows)})
+
+
+def test_simulation_key_scalar_and_seasonal_rop():
+    key = simulation_key("P1", 2016, 10, 50, 100, 5, "abc")
+    assert key == simulation_key("P1", 2016.0, 10.0, 50.0, 100.0, 5.0, "abc")
+    assert key != simulation_key("P2", 2016, 10, 50, 100, 5, "abc")
+    assert key != simulation_key("P1", 2016, 10, 50, 100, 5, "def")
+
+    seasonal = simulation_key("P1", 2016, 10, np.full(365, 50.0), 100, 5, "abc")
+    hash(seasonal)
+    assert seasonal == simulation_key("P1", 2016, 10, [50.0] * 365, 100, 5, "abc")
+    assert seasonal != simulation_key("P1", 2016, 10, np.full(365, 60.0), 100, 5, "abc")
+
+
+def test_cache_hits_and_misses():
+    cache = SimulationCache()
+    computed = []
+
+    def compute():
+        computed.append(1)
+        return frame(10)
+
+    first = cache.get_or_compute("a", compute)
+    second = cache.get_or_compute("a", compute)
+    assert second is first
+    assert len(computed) == 1
+    assert cache.stats()["Hits"] == 1
+    assert cache.stats()["Misses"] == 1
+    assert cache.get("b") is None
+
+
+def test_cache_evicts_least_recently_used():
+    size = result_size(frame(100))
+    cache = SimulationCache(max_bytes=2 * size)
+    cache.put("a", frame(100))
+    cache.put("b", frame(100))
+    cache.get("a")
+    cache.put("c", frame(100))
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.size == 2 * size
+
+    # Results larger than the cache are not kept
+    cache.put("d", frame(1000))
+    assert "d" not in cache
+    assert len(cache) == 2
+
+
+def test_cache_replace_and_clear():
+    cache = SimulationCache()
+    cache.put("a", frame(10))
+    cache.put("a", frame(20))
+    assert len(cache) == 1
+    assert cache.size == result_size(frame(20))
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
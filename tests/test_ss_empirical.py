@@ -0,0 +1,32 @@
+import pytest
+from unittest.mock import patch, MagicMock
+import pandas as pd
+from components.ss_empirical import ss_empirical
+
+
+@pytest.fixture
+def mock_streamlit():
+    with patch('streamlit.columns') as mock_columns, \
+         patch('streamlit.session_state', {'year': 2023}), \
+         patch('streamlit.warning') as mock_warning, \
+         patch('streamlit.info') as mock_info, \
+         patch('streamlit.area_chart'):
+        column_mock = MagicMock()
+        column_mock.number_input.return_value = 0.9
+        column_mock.selectbox.side_effect = ['Rolling windows', 'Observed lead times']
+        mock_columns.return_value = [column_mock] * 3
+        yield {'warning': mock_warning, 'info': mock_info}
+
+
+def test_rolling_windows_longer_than_history(mock_streamlit):
+    filtered_data = pd.DataFrame({
+        'Date': pd.date_range('2023-12-27', periods=5, freq='D'),
+        'Order_Demand': [10, 20, 30, 40, 50],
+    })
+    lead_time_data = pd.DataFrame({'Lead_Time_Days': [400, 420]})
+
+    # Run the fragment's function outside a Streamlit app
+    ss_empirical.__wrapped__(filtered_data, lead_time_data)
+
+    mock_streamlit['warning'].assert_called_once()
+    mock_streamlit['info'].assert_not_called()
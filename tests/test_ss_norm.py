@@ -86,6 +86,32 @@ def test_uncertain_lead_time(monkeypatch, mock_session_state, mock_data):
     assert st.session_state['avg_sales'] == expected_avg_sales
     assert st.session_state['sd_lead_time'] == expected_sd_lead_time
 
+def test_uncertain_lead_time_fitted_moments(monkeypatch, mock_session_state):
+    monkeypatch.setattr(st, 'session_state', mock_session_state)
+    rng = np.random.default_rng(0)
+    lead_time_data = pd.DataFrame({
+        'Product_Code': 'A',
+        'Lead_Time_Days': rng.gamma(4.0, 2.0, 200),
+    })
+    filtered_data = pd.DataFrame({
+        'Date': pd.date_range(start='2023-01-01', periods=10, freq='D'),
+        'Order_Demand': [100] * 10,
+    })
+
+    mock_cols = [MockColumn(), MockColumn(), MockColumn()]
+    monkeypatch.setattr(st, 'columns', lambda x: mock_cols)
+    monkeypatch.setattr(st, 'info', lambda x: None)
+    monkeypatch.setattr(st, 'caption', lambda x: None)
+    monkeypatch.setattr(st, 'selectbox', lambda *args, **kwargs: 'gamma')
+
+    uncertain_lead_time(filtered_data, lead_time_data)
+
+    fit = fit_lead_time_distributions(lead_time_data).iloc[0]
+    mean, sd = lead_time_moments(fit, 'gamma')
+    assert st.session_state['avg_lead_time'] == round(mean, 2)
+    assert st.session_state['sd_lead_time'] == round(sd, 2)
+    assert st.session_state['sd_lead_time'] != calculate_sd_lead_time(lead_time_data)
+
 def test_uncertain_demand_lead_time_ind(monkeypatch, mock_session_state, mock_data):
     monkeypatch.setattr(st, 'session_state', mock_session_state)
     filtered_data, lead_time_data = mock_data
@@ -105,6 +131,27 @@ def test_uncertain_demand_lead_time_ind(monkeypatch, mock_session_state, mock_da
     assert st.session_state['demand_sd'] == exepcted_sd_demand
     assert st.session_state['sd_lead_time'] == expected_sd_lead_time
 
+def test_uncertain_demand_lead_time_ind_ss(monkeypatch, mock_session_state, mock_data):
+    monkeypatch.setattr(st, 'session_state', mock_session_state)
+    filtered_data, lead_time_data = mock_data
+    infos = []
+
+    mock_cols = [MockColumn(), MockColumn(), MockColumn()]
+    monkeypatch.setattr(st, 'columns', lambda x: mock_cols)
+    monkeypatch.setattr(st, 'info', infos.append)
+    monkeypatch.setattr(st, 'write', lambda *args, **kwargs: None)
+
+    uncertain_demand_lead_time_ind(filtered_data, lead_time_data)
+
+    # The lead time variance is scaled by the average sales, not the lead time
+    Z = round(stats.norm.ppf(0.95), 2)
+    L = st.session_state['avg_lead_time']
+    sd = st.session_state['demand_sd']
+    D = st.session_state['avg_sales']
+    sd_L = st.session_state['sd_lead_time']
+    ss = round(Z * (L * sd ** 2 + (D * sd_L) ** 2) ** 0.5)
+    assert f"**{ss}**" in infos[0]
+
 def test_ss_fill_rate(monkeypatch, mock_session_state, mock_data):
     monkeypatch.setattr(st, 'session_state', mock_session_state)
     filtered_data, lead_time_data = mock_data
@@ -85,3 +85,12 @@ def test_remove_outliers_iqr():
     result = remove_outliers_iqr(df, 'Order_Demand')
     assert len(result) < len(df)  # Should have removed outliers
     assert 200 not in result['Order_Demand'].values  # Extreme value should be removed
+
+def test_data_fingerprint(sample_df):
+    fingerprint = data_fingerprint(sample_df)
+    assert fingerprint == data_fingerprint(sample_df.copy())
+
+    changed = sample_df.copy()
+    changed.loc[0, 'Order_Demand'] = 101
+    assert fingerprint != data_fingerprint(changed)
+    assert fingerprint != data_fingerprint(sample_df.rename(columns={'Order_Demand': 'Demand'}))